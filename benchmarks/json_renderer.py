@@ -0,0 +1,52 @@
+"""
+Compare rendering a page of serialized rows with DRF's `JSONRenderer` and
+with `FastJSONRenderer`.
+
+    python benchmarks/json_renderer.py [num_rows] [repeat]
+
+"""
+import os
+import sys
+import uuid
+import timeit
+import decimal
+import datetime
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run(num_rows: int, repeat: int):
+    from rest_framework.renderers import JSONRenderer
+    from django_typescript.core.renderers import FastJSONRenderer, orjson
+
+    created = datetime.datetime(2020, 1, 1, 12, 30, 15, 123456)
+    rows = [
+        OrderedDict([
+            ('id', i),
+            ('name', f'row {i}'),
+            ('price', decimal.Decimal('19.99')),
+            ('uuid', uuid.uuid4()),
+            ('created', created + datetime.timedelta(seconds=i)),
+            ('active', i % 2 == 0),
+        ])
+        for i in range(num_rows)
+    ]
+    drf_renderer, fast_renderer = JSONRenderer(), FastJSONRenderer()
+    assert drf_renderer.render(rows) == fast_renderer.render(rows), 'Rendered output differs.'
+
+    drf_time = min(timeit.repeat(lambda: drf_renderer.render(rows), number=1, repeat=repeat))
+    fast_time = min(timeit.repeat(lambda: fast_renderer.render(rows), number=1, repeat=repeat))
+    print(f'{num_rows} rows, best of {repeat} (orjson {"installed" if orjson else "not installed"})')
+    print(f'  JSONRenderer:     {drf_time * 1000:8.1f} ms')
+    print(f'  FastJSONRenderer: {fast_time * 1000:8.1f} ms')
+    print(f'  speedup:          {drf_time / fast_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    settings.configure()
+    run(num_rows=int(sys.argv[1]) if len(sys.argv) > 1 else 5000,
+        repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
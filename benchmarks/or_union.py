@@ -0,0 +1,115 @@
+"""
+Compare the database's plan and the latency of a list query OR-ing two
+index-backed branches - one on a joined table - applied as a single OR-ed
+predicate, and rewritten as a `UNION` of the branches.
+
+    python benchmarks/or_union.py [num_rows] [repeat]
+
+"""
+import os
+import sys
+import timeit
+
+import django
+from django.conf import settings
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# =================================
+# Setup
+# ---------------------------------
+
+def setup():
+    settings.configure(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        SECRET_KEY='not very secret in benchmarks',
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'rest_framework',
+            'django_typescript',
+            'tests',
+        ),
+    )
+    django.setup()
+
+
+def ledger_models(num_rows: int):
+    from django.db import models, connection
+
+    class Account(models.Model):
+        number = models.IntegerField(db_index=True)
+
+        class Meta:
+            app_label = 'tests'
+
+    class Entry(models.Model):
+        account = models.ForeignKey(Account, on_delete=models.CASCADE)
+        amount = models.IntegerField(db_index=True)
+
+        class Meta:
+            app_label = 'tests'
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Account)
+        schema_editor.create_model(Entry)
+    num_accounts = max(num_rows // 100, 1)
+    with connection.cursor() as cursor:
+        # Generate rows in SQL; building millions of instances would dominate the run.
+        cursor.execute(f'''
+            WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < {num_accounts})
+            INSERT INTO {Account._meta.db_table} (id, number) SELECT i, i FROM seq
+        ''')
+        cursor.execute(f'''
+            WITH RECURSIVE seq(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM seq WHERE i < {num_rows})
+            INSERT INTO {Entry._meta.db_table} (id, account_id, amount)
+            SELECT i, (i % {num_accounts}) + 1, (i * 7919) % 1000003 FROM seq
+        ''')
+        cursor.execute('ANALYZE')
+    return Account, Entry
+
+
+def query_plan(queryset) -> str:
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+        return '\n'.join(f'    {row[-1]}' for row in cursor.fetchall())
+
+
+# =================================
+# Benchmark
+# ---------------------------------
+
+def run(num_rows: int, repeat: int):
+    from django.test.utils import override_settings
+    from django_typescript import config
+    from django_typescript.model_types.queryset import ModelTypeQuery
+    from django_typescript.model_types.query_normalizer import clear_union_verdict_cache
+
+    _, entry_cls = ledger_models(num_rows)
+    query = ModelTypeQuery.from_data({
+        'filters': {'amount': 4242}, 'or_': [{'filters': {'account__number': 17}}]
+    }).normalized(model_cls=entry_cls)
+    print(f'{num_rows} rows, {repeat} runs')
+    for union in (False, True):
+        config.UNION_OR_QUERIES = union
+        clear_union_verdict_cache()
+        queryset = query.apply_to_queryset(entry_cls.objects.all())
+        seconds = timeit.timeit(lambda: list(queryset.all()), number=repeat) / repeat
+        print(f"  {'UNION' if union else 'OR'}: {1000 * seconds:10.2f} ms/query, {len(list(queryset))} rows")
+        print(query_plan(queryset))
+
+
+if __name__ == '__main__':
+    setup()
+    run(num_rows=int(sys.argv[1]) if len(sys.argv) > 1 else 2000000,
+        repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
@@ -0,0 +1,97 @@
+"""
+Measure the bytes read from the database by a list query on a wide table,
+with and without projecting the selected columns onto those the serializer
+reads.
+
+    python benchmarks/projection.py [num_rows]
+
+"""
+import os
+import sys
+
+import django
+from django.conf import settings
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# =================================
+# Setup
+# ---------------------------------
+
+def setup():
+    settings.configure(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        SECRET_KEY='not very secret in benchmarks',
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'rest_framework',
+            'django_typescript',
+            'tests',
+        ),
+    )
+    django.setup()
+
+
+def wide_model():
+    from django.db import models, connection
+
+    class WideThing(models.Model):
+        name = models.CharField(max_length=200)
+        number = models.IntegerField()
+        payload = models.TextField()
+        created_by = models.CharField(max_length=200)
+        modified_by = models.CharField(max_length=200)
+
+        class Meta:
+            app_label = 'tests'
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(WideThing)
+    return WideThing
+
+
+def bytes_read(queryset) -> int:
+    from django.db import connection
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return sum(len(str(value)) for row in cursor.fetchall() for value in row if value is not None)
+
+
+# =================================
+# Benchmark
+# ---------------------------------
+
+def run(num_rows: int):
+    from django_typescript.model_types.model_type import ModelType
+    from django_typescript.model_types.projection import project_queryset
+
+    model_cls = wide_model()
+    model_cls.objects.bulk_create([
+        model_cls(name=f'row {i}', number=i, payload='x' * 4096, created_by='audit', modified_by='audit')
+        for i in range(num_rows)
+    ], batch_size=500)
+    write_only = {'write_only': True}
+    model_type = ModelType(model_cls=model_cls, serializer_field_kwargs={
+        'payload': write_only, 'created_by': write_only, 'modified_by': write_only
+    })
+    queryset = model_cls.objects.all()
+    full = bytes_read(queryset)
+    projected = bytes_read(project_queryset(queryset, serializer_cls=model_type.serializer_cls))
+    print(f'{num_rows} rows')
+    print(f'  all columns:       {full:12d} bytes')
+    print(f'  projected columns: {projected:12d} bytes  ({100 * (1 - projected / full):.1f}% less)')
+
+
+if __name__ == '__main__':
+    setup()
+    run(num_rows=int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
@@ -0,0 +1,96 @@
+"""
+Compare the throughput of serializing `values()` list payloads through a
+`subset_serializer` DRF class against the serializer-free fast path.
+
+    python benchmarks/values_fast_path.py [num_rows] [repeat]
+
+"""
+import os
+import sys
+import timeit
+import datetime
+
+import django
+from django.conf import settings
+
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# =================================
+# Setup
+# ---------------------------------
+
+def setup():
+    settings.configure(
+        DATABASES={
+            'default': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            }
+        },
+        SECRET_KEY='not very secret in benchmarks',
+        INSTALLED_APPS=(
+            'django.contrib.auth',
+            'django.contrib.contenttypes',
+            'rest_framework',
+            'django_typescript',
+            'tests',
+        ),
+    )
+    django.setup()
+
+
+def create_rows(model_cls, num_rows: int):
+    from django.db import connection
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(model_cls)
+    timestamp = datetime.datetime(2020, 1, 1, 12, 30, 15, 123456)
+    model_cls.objects.bulk_create([
+        model_cls(name=f'row {i}', timestamp=timestamp + datetime.timedelta(seconds=i))
+        for i in range(num_rows)
+    ], batch_size=1000)
+
+
+# =================================
+# Benchmark
+# ---------------------------------
+
+def run(num_rows: int, repeat: int):
+    from rest_framework.renderers import JSONRenderer
+
+    from django_typescript.model_types.serializer import ModelTypeSerializer
+    from django_typescript.model_types.values import ValuesSerializer
+    from django_typescript.core.utils.subset_serializer import subset_serializer
+    from tests.models import TimestampedModel
+
+    create_rows(TimestampedModel, num_rows)
+    serializer = ModelTypeSerializer(model_cls=TimestampedModel)
+    values = ['id', 'name', 'timestamp']
+    rows = list(TimestampedModel.objects.values(*values))
+
+    def drf_path():
+        serializer_cls = subset_serializer(serializer_cls=serializer.base_serializer_cls, select_fields=values)
+        return serializer_cls(rows, many=True).data
+
+    def fast_path():
+        values_serializer = ValuesSerializer.for_fields(field_names=values,
+                                                        coercion_table=serializer.values_coercion_table)
+        return values_serializer.serialize(rows)
+
+    renderer = JSONRenderer()
+    assert renderer.render(drf_path()) == renderer.render(fast_path()), 'Fast path output differs.'
+
+    drf_time = min(timeit.repeat(drf_path, number=1, repeat=repeat))
+    fast_time = min(timeit.repeat(fast_path, number=1, repeat=repeat))
+    print(f'{num_rows} rows, best of {repeat}')
+    print(f'  subset_serializer: {drf_time * 1000:8.1f} ms  ({num_rows / drf_time:10.0f} rows/s)')
+    print(f'  fast path:         {fast_time * 1000:8.1f} ms  ({num_rows / fast_time:10.0f} rows/s)')
+    print(f'  speedup:           {drf_time / fast_time:8.1f}x')
+
+
+if __name__ == '__main__':
+    setup()
+    run(num_rows=int(sys.argv[1]) if len(sys.argv) > 1 else 10000,
+        repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5)
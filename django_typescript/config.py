@@ -4,3 +4,39 @@ from django.conf import settings
 INTERFACE_PATH = getattr(settings, 'DJANGO_TS_INTERFACE', '')
 
 FIELD_TYPES = getattr(settings, 'DJANGO_TS_FIELD_TYPES', {})
+
+PREFETCH_SERIALIZER_CACHE_SIZE = getattr(settings, 'DJANGO_TS_PREFETCH_SERIALIZER_CACHE_SIZE', 256)
+
+COUNT_CAP = getattr(settings, 'DJANGO_TS_COUNT_CAP', 1000)
+
+COUNT_CACHE_TTL = getattr(settings, 'DJANGO_TS_COUNT_CACHE_TTL', 60)
+
+STREAM_CHUNK_SIZE = getattr(settings, 'DJANGO_TS_STREAM_CHUNK_SIZE', 2000)
+
+QUERY_PLAN_CACHE_SIZE = getattr(settings, 'DJANGO_TS_QUERY_PLAN_CACHE_SIZE', 1024)
+
+PROJECT_QUERIES = getattr(settings, 'DJANGO_TS_PROJECT_QUERIES', True)
+
+FAST_JSON = getattr(settings, 'DJANGO_TS_FAST_JSON', False)
+
+RESULT_CACHE_TTL = getattr(settings, 'DJANGO_TS_RESULT_CACHE_TTL', 300)
+
+GET_MANY_MAX_PKS = getattr(settings, 'DJANGO_TS_GET_MANY_MAX_PKS', 1000)
+
+BULK_MAX_ROWS = getattr(settings, 'DJANGO_TS_BULK_MAX_ROWS', 10000)
+
+BULK_BATCH_SIZE = getattr(settings, 'DJANGO_TS_BULK_BATCH_SIZE', 500)
+
+QUERY_DELETE_MAX_ROWS = getattr(settings, 'DJANGO_TS_QUERY_DELETE_MAX_ROWS', 1000)
+
+UNION_OR_QUERIES = getattr(settings, 'DJANGO_TS_UNION_OR_QUERIES', True)
+
+READ_DATABASES = getattr(settings, 'DJANGO_TS_READ_DATABASES', [])
+
+STICKY_PRIMARY_SECONDS = getattr(settings, 'DJANGO_TS_STICKY_PRIMARY_SECONDS', 5)
+
+QUERY_TIMEOUT = getattr(settings, 'DJANGO_TS_QUERY_TIMEOUT', None)
+
+QUERY_COST_BUDGET = getattr(settings, 'DJANGO_TS_QUERY_COST_BUDGET', 1000)
+
+QUERY_COST_WINDOW = getattr(settings, 'DJANGO_TS_QUERY_COST_WINDOW', 60)
@@ -0,0 +1,56 @@
+import typing
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser, BaseParser
+from rest_framework.settings import api_settings
+
+from django_typescript import config
+from django_typescript.core.renderers import FastJSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# =================================
+# Fast JSON Parser
+# ---------------------------------
+
+class FastJSONParser(JSONParser):
+
+    """
+    A drop-in replacement for DRF's `JSONParser` that parses with `orjson`
+    when it is installed, and with the standard library otherwise. Like a
+    strict `JSONParser`, `orjson` rejects `NaN` and `Infinity`.
+
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        if orjson is None or not self.strict or encoding.lower().replace('-', '') != 'utf8':
+            return JSONParser.parse(self, stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+# =================================
+# Parser Classes
+# ---------------------------------
+
+def parser_classes() -> typing.Tuple[typing.Type[BaseParser], ...]:
+    """
+    Return DRF's default parser classes, with `JSONParser` replaced by
+    `FastJSONParser` if `DJANGO_TS_FAST_JSON` is set.
+
+    """
+    classes = list(api_settings.DEFAULT_PARSER_CLASSES)
+    if config.FAST_JSON:
+        classes = [FastJSONParser if cls is JSONParser else cls for cls in classes]
+    return tuple(classes)
@@ -0,0 +1,105 @@
+import typing
+
+from rest_framework.renderers import JSONRenderer, BaseRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils import encoders
+
+from django_typescript import config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# =================================
+# Fast JSON Renderer
+# ---------------------------------
+
+class FastJSONRenderer(JSONRenderer):
+
+    """
+    A drop-in replacement for DRF's `JSONRenderer` that renders with `orjson`
+    when it is installed. Types `orjson` does not handle natively (e.g.
+    `Decimal`, lazy translation strings) and datetimes - so they are
+    formatted exactly as DRF formats them - are passed to DRF's encoder.
+
+    Without `orjson`, when the output must be indented or ASCII only, or for
+    data `orjson` cannot encode (e.g. integers beyond 64 bits), the standard
+    library encoder is used, as by `JSONRenderer`. Output is the same JSON
+    as `JSONRenderer`'s, though not byte for byte: `orjson` writes some
+    floats differently (e.g. `1e16` rather than `1e+16`).
+
+    """
+
+    _default = staticmethod(encoders.JSONEncoder().default)
+
+    def _render_orjson(self, data) -> bytes:
+        ret = orjson.dumps(data, default=self._default,
+                           option=orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS)
+        # As `JSONRenderer`, escape the line and paragraph separators, which are
+        # invalid in JavaScript strings.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if orjson is None or not self.compact or self.ensure_ascii:
+            return JSONRenderer.render(self, data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return JSONRenderer.render(self, data, accepted_media_type, renderer_context)
+        try:
+            return self._render_orjson(data)
+        except orjson.JSONEncodeError:
+            return JSONRenderer.render(self, data, accepted_media_type, renderer_context)
+
+
+# =================================
+# NDJSON Renderer
+# ---------------------------------
+
+class NDJSONRenderer(FastJSONRenderer):
+
+    """
+    Renders newline delimited JSON - one JSON document per line. Lists are
+    rendered one item per line, any other data as a single line. Lines are
+    rendered with `FastJSONRenderer` if `DJANGO_TS_FAST_JSON` is set.
+
+    Streamed list responses do not go through `render`; they write each row
+    with `render_line` as it is serialized.
+
+    """
+
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+
+    def render_line(self, data) -> bytes:
+        if config.FAST_JSON:
+            return FastJSONRenderer.render(self, data) + b'\n'
+        return JSONRenderer.render(self, data) + b'\n'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if isinstance(data, list):
+            return b''.join(self.render_line(item) for item in data)
+        return self.render_line(data)
+
+
+# =================================
+# Renderer Classes
+# ---------------------------------
+
+def renderer_classes(*extra_renderer_classes: typing.Type[BaseRenderer]) -> typing.Tuple[typing.Type[BaseRenderer], ...]:
+    """
+    Return DRF's default renderer classes, with `JSONRenderer` replaced by
+    `FastJSONRenderer` if `DJANGO_TS_FAST_JSON` is set, followed by
+    `extra_renderer_classes`.
+
+    """
+    classes = list(api_settings.DEFAULT_RENDERER_CLASSES)
+    if config.FAST_JSON:
+        classes = [FastJSONRenderer if cls is JSONRenderer else cls for cls in classes]
+    return (*classes, *extra_renderer_classes)
@@ -0,0 +1,202 @@
+import time
+import typing
+import sqlite3
+import functools
+import contextlib
+
+from django.db import connections, transaction, DatabaseError
+from rest_framework.response import Response
+from rest_framework import status
+
+from django_typescript import config
+from django_typescript.core.renderers import NDJSONRenderer
+
+
+QUERY_TIMEOUT_CODE = 'query_timeout'
+
+# The key of the error line ending a stream whose query timed out.
+STREAM_ERROR_KEY = '__error__'
+
+# SQLite calls the progress handler every this many virtual machine instructions.
+SQLITE_PROGRESS_STEPS = 1000
+
+# PostgreSQL's `query_canceled` SQLSTATE, and the error numbers of MySQL's
+# `max_execution_time` and MariaDB's `max_statement_time`.
+POSTGRESQL_QUERY_CANCELED = '57014'
+MYSQL_QUERY_TIMEOUT_ERRORS = (3024, 1969)
+
+
+# =================================
+# Query Timeout
+# ---------------------------------
+
+class QueryTimeout(object):
+
+    """
+    A context manager limiting the time each query run on any database
+    connection (of the current thread) may take, with the database's own
+    mechanism: `statement_timeout` on PostgreSQL, `max_execution_time` on
+    MySQL (`max_statement_time` on MariaDB, both for `SELECT` queries only)
+    and a progress handler on SQLite. The database cancels queries over the
+    limit, and the error is raised. Other backends are not limited.
+
+    A connection is only limited once it runs a query, so connections a
+    view does not use are not opened, and limits are lifted on exit.
+
+    """
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self._limited = {}
+        self._deadline = None
+        self._wrappers = None
+
+    def __enter__(self) -> 'QueryTimeout':
+        self._limited = {}
+        self._wrappers = contextlib.ExitStack()
+        for connection in connections.all():
+            self._wrappers.enter_context(connection.execute_wrapper(self._execute))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._wrappers.close()
+        for connection in self._limited.values():
+            if self.timed_out(exc_value) and connection.vendor == 'postgresql' and connection.in_atomic_block:
+                # PostgreSQL aborts the transaction of a cancelled query.
+                transaction.set_rollback(True, using=connection.alias)
+            self._lift(connection)
+        return False
+
+    def _execute(self, execute, sql, params, many, context):
+        connection = context['connection']
+        if connection.alias not in self._limited:
+            self._limited[connection.alias] = connection
+            self._limit(connection, context['cursor'].cursor)
+        # On SQLite, each query - rows are fetched after `execute()` returns -
+        # has `seconds` from its start.
+        self._deadline = time.monotonic() + self.seconds
+        return execute(sql, params, many, context)
+
+    def _sqlite_progress(self) -> bool:
+        # A true return value interrupts the query.
+        return time.monotonic() > self._deadline
+
+    def _limit(self, connection, cursor):
+        if connection.vendor == 'sqlite':
+            connection.connection.set_progress_handler(self._sqlite_progress, SQLITE_PROGRESS_STEPS)
+        elif connection.vendor == 'postgresql':
+            cursor.execute('SET statement_timeout = %d' % (1000 * self.seconds))
+        elif connection.vendor == 'mysql' and connection.mysql_is_mariadb:
+            cursor.execute('SET SESSION max_statement_time = %f' % self.seconds)
+        elif connection.vendor == 'mysql':
+            cursor.execute('SET SESSION max_execution_time = %d' % (1000 * self.seconds))
+
+    def _lift(self, connection):
+        if connection.connection is None:
+            return
+        if connection.vendor == 'sqlite':
+            connection.connection.set_progress_handler(None, 0)
+        elif connection.needs_rollback:
+            # Rolling back the transaction undoes the `SET` (if it was run
+            # in the transaction), and the connection cannot run queries.
+            return
+        elif connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('RESET statement_timeout')
+        elif connection.vendor == 'mysql':
+            with connection.cursor() as cursor:
+                variable = 'max_statement_time' if connection.mysql_is_mariadb else 'max_execution_time'
+                cursor.execute(f'SET SESSION {variable} = DEFAULT')
+
+    def timed_out(self, error) -> bool:
+        """
+        Whether `error` (a database error) is a query being cancelled for
+        exceeding its time limit.
+
+        """
+        if not isinstance(error, DatabaseError) or not self._limited:
+            return False
+        cause = error.__cause__
+        if isinstance(cause, sqlite3.OperationalError):
+            return str(cause) == 'interrupted'
+        if getattr(cause, 'pgcode', None) == POSTGRESQL_QUERY_CANCELED:
+            return True
+        args = getattr(cause, 'args', ())
+        return bool(args) and args[0] in MYSQL_QUERY_TIMEOUT_ERRORS
+
+    def error_data(self) -> dict:
+        return {
+            'code': QUERY_TIMEOUT_CODE,
+            'detail': f'The query exceeded its time limit of {self.seconds:g} seconds.',
+            'timeout': self.seconds,
+        }
+
+    def response(self) -> Response:
+        """
+        Return the 504 (Gateway Timeout) response to a request whose query
+        exceeded its time limit.
+
+        """
+        return Response(self.error_data(), status=status.HTTP_504_GATEWAY_TIMEOUT)
+
+
+def with_query_timeout(view_func: typing.Callable, seconds: float) -> typing.Callable:
+    """
+    Wrap `view_func` so the queries it runs are limited to `seconds`, and a
+    query over the limit is answered with a 504 response.
+
+    """
+    @functools.wraps(view_func)
+    def timed_view_func(request, *args, **kwargs):
+        query_timeout = QueryTimeout(seconds)
+        try:
+            with query_timeout:
+                return view_func(request, *args, **kwargs)
+        except DatabaseError as e:
+            if not query_timeout.timed_out(e):
+                raise
+            return query_timeout.response()
+    return timed_view_func
+
+
+def stream_with_query_timeout(lines: typing.Iterator[bytes], seconds: float) -> typing.Iterator[bytes]:
+    """
+    Yield the NDJSON `lines` of a streamed response, limiting the queries
+    run to produce them - after the view has returned - to `seconds`. A
+    query over the limit ends the stream with an error line,
+    `{"__error__": <the data of the 504 response>}`, as the status has
+    already been sent.
+
+    """
+    query_timeout = QueryTimeout(seconds)
+    try:
+        with query_timeout:
+            yield from lines
+    except DatabaseError as e:
+        if not query_timeout.timed_out(e):
+            raise
+        yield NDJSONRenderer().render_line({STREAM_ERROR_KEY: query_timeout.error_data()})
+
+
+def resolve_query_timeouts(query_timeout: typing.Union[float, typing.Dict[str, float], None],
+                           view_names: typing.Iterable[str]) -> typing.Dict[str, typing.Optional[float]]:
+    """
+    Return the query timeout (in seconds, or `None`) of each of `view_names`
+    for `query_timeout`, which may be a number of seconds for every view, a
+    mapping of view names to seconds, or `None`. Views without a timeout
+    use `DJANGO_TS_QUERY_TIMEOUT`.
+
+    """
+    view_names = list(view_names)
+    if query_timeout is None:
+        query_timeout = {}
+    elif not isinstance(query_timeout, dict):
+        query_timeout = dict.fromkeys(view_names, query_timeout)
+    unknown = set(query_timeout) - set(view_names)
+    if unknown:
+        raise ValueError(f"Unknown views {sorted(unknown)} in `query_timeout`; expected any of {view_names}.")
+    timeouts = {name: query_timeout.get(name, config.QUERY_TIMEOUT) for name in view_names}
+    for name, seconds in timeouts.items():
+        if seconds is not None and (not isinstance(seconds, (int, float)) or seconds <= 0):
+            raise ValueError(f"Invalid query timeout `{seconds}` for view `{name}`: expected a positive number.")
+    return timeouts
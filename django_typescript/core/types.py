@@ -3,6 +3,7 @@ import typing
 from django.db import models
 from rest_framework import serializers
 from rest_framework.permissions import BasePermission
+from rest_framework.throttling import BaseThrottle
 
 
 # =================================
@@ -12,6 +13,13 @@ from rest_framework.permissions import BasePermission
 PermissionClasses = typing.Optional[typing.Tuple[typing.Type[BasePermission]]]
 
 
+# =================================
+# Throttles
+# ---------------------------------
+
+ThrottleClasses = typing.Optional[typing.Tuple[typing.Type[BaseThrottle]]]
+
+
 # =================================
 # Serializers
 # ---------------------------------
@@ -73,6 +81,26 @@ def field_is_relation(field: ModelField) -> bool:
     return isinstance(field, REVERSE_RELATION_FIELDS + FORWARD_RELATION_FIELDS + (models.ManyToManyRel, ))
 
 
+def field_is_multi_valued_relation(field: ModelField) -> bool:
+    """
+    Return whether `field` is a relation that can relate many objects to a
+    single instance - i.e. a reverse foreign key or a many-to-many relation.
+
+    """
+    return bool(field.is_relation and (field.one_to_many or field.many_to_many))
+
+
+def relation_accessor_name(field: ModelField) -> str:
+    """
+    Return the name of the model attribute used to access the related
+    object(s) of relation `field`.
+
+    """
+    if isinstance(field, models.ForeignObjectRel):
+        return field.get_accessor_name()
+    return field.name
+
+
 # =================================
 # Prefetch Tree
 # ---------------------------------
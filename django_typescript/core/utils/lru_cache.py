@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+
+# =================================
+# LRU Cache
+# ---------------------------------
+
+class LRUCache(object):
+
+    """
+    A small, thread-safe, bounded least-recently-used cache that keeps
+    hit/miss counters so cache effectiveness can be inspected at runtime.
+
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key: Hashable):
+        return key in self._data
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        if lookups == 0:
+            return 0.0
+        return self.hits / lookups
+
+    def info(self) -> dict:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hit_ratio,
+            'size': len(self._data),
+            'maxsize': self.maxsize
+        }
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `factory` to build (and
+        cache) it on a miss.
+
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+        value = factory()
+        self.set(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
@@ -4,8 +4,11 @@ from rest_framework.settings import api_settings
 from rest_framework.response import Response
 from rest_framework import status
 
-from django_typescript.core.types import PermissionClasses
+from django_typescript.core.types import PermissionClasses, ThrottleClasses
 from django_typescript.core import endpoints
+from django_typescript.core.renderers import renderer_classes
+from django_typescript.core.parsers import parser_classes
+from django_typescript.core.timeouts import with_query_timeout
 
 
 # =================================
@@ -15,6 +18,13 @@ from django_typescript.core import endpoints
 class View(object):
 
     REQUEST_METHOD: str = None
+    # Throttle classes replacing DRF's `DEFAULT_THROTTLE_CLASSES`, if any.
+    throttle_classes: ThrottleClasses = None
+    # The time limit, in seconds, of each query the view runs (see `QueryTimeout`).
+    query_timeout: float = None
+    # The attribute of the DRF view (passed to permissions and throttles)
+    # holding this view.
+    VIEW_ATTR = 'django_ts_view'
 
     def __init__(self, endpoint: endpoints.Endpoint, permission_classes: PermissionClasses = None):
         self.endpoint = endpoint
@@ -23,11 +33,35 @@ class View(object):
     def _view_function(self):
         raise NotImplementedError
 
+    def _wrap_view_function(self, view_func):
+        """
+        Return `view_func`, the view function, wrapped with any behaviour the
+        view adds around it - by default, its `query_timeout`. It is still
+        wrapped by `api_view`, so it can return DRF responses.
+
+        """
+        if self.query_timeout is None:
+            return view_func
+        return with_query_timeout(view_func, seconds=self.query_timeout)
+
+    @property
+    def renderer_classes(self):
+        return renderer_classes()
+
+    @property
+    def parser_classes(self):
+        return parser_classes()
+
     def view(self):
-        view_func = self._view_function()
+        view_func = self._wrap_view_function(self._view_function())
         if self.permission_classes:
             view_func.permission_classes = self.permission_classes
+        view_func.renderer_classes = self.renderer_classes
+        view_func.parser_classes = self.parser_classes
+        if self.throttle_classes is not None:
+            view_func.throttle_classes = self.throttle_classes
         view = api_view([self.REQUEST_METHOD])(view_func)
+        setattr(view.cls, self.VIEW_ATTR, self)
         view = add_permission_classes(self.permission_classes)(view)
         view.authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
         return view
@@ -10,6 +10,15 @@ from rest_framework import status
 from django_typescript.object_types.object_type import ObjectType
 from django_typescript.core.utils import camel_case_to_underscore
 from django_typescript.model_types.model_type import ModelType
+from django_typescript.model_types.serializer import clear_prefetch_serializer_cache, PREFETCH_SERIALIZER_CACHE
+from django_typescript.model_types.query_plan import clear_query_plan_cache, QUERY_PLAN_CACHE
+from django_typescript.model_types.index_policy import (clear_index_verdict_cache, clear_indexed_fields_cache,
+                                                        INDEX_VERDICT_CACHE, INDEXED_FIELDS_CACHE)
+from django_typescript.model_types.projection import clear_projection_cache, PROJECTION_CACHE
+from django_typescript.model_types.routing import ReadRouting, resolve_read_routing
+from django_typescript.model_types.query_normalizer import clear_union_verdict_cache, UNION_VERDICT_CACHE
+from django_typescript.model_types.relation_graph import (RelationGraph, clear_resolved_prefetch_cache,
+                                                          RESOLVED_PREFETCH_CACHE)
 from django_typescript.utils import CurrentUserIDDefault
 
 
@@ -25,12 +34,16 @@ class Interface(object):
     """
 
     _TRANSPILE_DEST: str = None
+    _RELATION_GRAPH: RelationGraph = None
+    _READ_ROUTING: ReadRouting = None
 
     def __init_subclass__(cls, **kwargs):
         transpile_dest = kwargs.get('transpile_dest')
         assert transpile_dest is not None, 'A `transpile_dest` argument must be supplied to' \
                                             ' any subclass of `Interface`.'
         cls._TRANSPILE_DEST = transpile_dest
+        # The default read routing of the Interface's `ModelType`s.
+        cls._READ_ROUTING = resolve_read_routing(kwargs.get('read_routing'))
 
     @classmethod
     def model_types(cls) -> typing.List[ModelType]:
@@ -71,14 +84,30 @@ class Interface(object):
             models_.append(interface_model_type.model_cls)
         return models_
 
+    @classmethod
+    def relation_graph(cls) -> RelationGraph:
+        """
+        Return the graph of relations between the models of this Interface,
+        built on first use.
+
+        """
+        if cls.__dict__.get('_RELATION_GRAPH') is None:
+            cls._RELATION_GRAPH = RelationGraph(model_types=cls.model_types())
+        return cls._RELATION_GRAPH
+
     @classmethod
     def urlpatterns(cls, extra_patterns: list = None):
         """
-        Return the Django URL patterns for this interface.
+        Return the Django URL patterns for this interface. Prefetch trees sent
+        to the views are resolved against the Interface's `relation_graph`, and
+        `ModelType`s without a read routing of their own use the Interface's.
 
         """
         urlpatterns = []
+        relation_graph = cls.relation_graph()
         for interface_model_type in cls.model_types():
+            interface_model_type.bind_relation_graph(relation_graph)
+            interface_model_type.bind_read_routing(cls._READ_ROUTING)
             urlpatterns.append(
                 path('{}/'.format(interface_model_type.base_url()),
                      include((interface_model_type.urlpatterns(), camel_case_to_underscore(interface_model_type.model_name)))),
@@ -93,6 +122,40 @@ class Interface(object):
             urlpatterns += extra_patterns
         return urlpatterns
 
+    @classmethod
+    def clear_caches(cls):
+        """
+        Clear any process-level caches derived from this Interface's types. Call
+        this after reloading an Interface so stale compiled classes are dropped.
+        The relation graph is rebuilt the next time the URL patterns are.
+
+        """
+        cls._RELATION_GRAPH = None
+        clear_prefetch_serializer_cache()
+        clear_query_plan_cache()
+        clear_index_verdict_cache()
+        clear_indexed_fields_cache()
+        clear_projection_cache()
+        clear_resolved_prefetch_cache()
+        clear_union_verdict_cache()
+
+    @classmethod
+    def cache_info(cls) -> dict:
+        """
+        Return the size and hit/miss statistics of the process-level caches,
+        keyed by cache name.
+
+        """
+        return {
+            'prefetch_serializers': PREFETCH_SERIALIZER_CACHE.info(),
+            'query_plans': QUERY_PLAN_CACHE.info(),
+            'index_verdicts': INDEX_VERDICT_CACHE.info(),
+            'indexed_fields': INDEXED_FIELDS_CACHE.info(),
+            'projections': PROJECTION_CACHE.info(),
+            'resolved_prefetches': RESOLVED_PREFETCH_CACHE.info(),
+            'union_verdicts': UNION_VERDICT_CACHE.info()
+        }
+
     @classmethod
     def base_url(cls):
         return '/'
\ No newline at end of file
@@ -0,0 +1,168 @@
+import json
+import typing
+import decimal
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Trunc
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from django_typescript.core import types
+from django_typescript.model_types.query_plan import split_lookup_path
+
+
+# =================================
+# Aggregation
+# ---------------------------------
+
+AGGREGATE_FUNCTIONS = {
+    'count': models.Count,
+    'sum': models.Sum,
+    'avg': models.Avg,
+    'min': models.Min,
+    'max': models.Max,
+}
+
+DATE_TRUNC_KINDS = ('year', 'quarter', 'month', 'week', 'day')
+
+TIME_TRUNC_KINDS = ('hour', 'minute', 'second')
+
+# Functions that only apply to numbers and durations, and the field types they apply to.
+NUMERIC_FUNCTIONS = ('sum', 'avg')
+
+NUMERIC_FIELDS = (models.IntegerField, models.FloatField, models.DecimalField, models.DurationField)
+
+
+def _invalid(key: str, message: str):
+    return ValidationError({key: [message]})
+
+
+def _coerce_decimals(row: dict) -> dict:
+    """
+    Return `row` with its `Decimal` values as strings, as DRF serializes
+    decimal fields (unless `COERCE_DECIMAL_TO_STRING` is disabled).
+
+    """
+    if not api_settings.COERCE_DECIMAL_TO_STRING:
+        return row
+    return {key: str(value) if isinstance(value, decimal.Decimal) else value for key, value in row.items()}
+
+
+class ModelTypeAggregation(object):
+
+    """
+    Helper class for running aggregations sent by `<ModelName>QuerySet`
+    TypeScript class instances, in SQL. Aggregates are given as
+
+        `{<alias>: {'fn': 'count' | 'sum' | 'avg' | 'min' | 'max', 'field': <field path>, 'distinct': <bool>}}`
+
+    where `field` is optional for `count`. Results are grouped by `group_by`,
+    a list of field paths and/or date truncation buckets:
+
+        `['parent__name', {'field': 'timestamp', 'trunc': 'month', 'alias': 'month'}]`
+
+    Without `group_by`, the payload is a single object of aggregate values.
+    Otherwise it is a list of objects - one per group, ordered by the group
+    values - holding the group values and the group's aggregate values.
+    `Decimal` values are strings, as in serialized objects.
+
+    """
+
+    AGGREGATES_KEY = 'aggregates'
+    GROUP_BY_KEY = 'group_by'
+
+    def __init__(self, model_cls: types.ModelClass, aggregates: dict, group_by: list = None):
+        self.model_cls = model_cls
+        self.aggregates = aggregates
+        self.group_by = group_by or []
+
+    @classmethod
+    def for_request(cls, request: Request, model_cls: types.ModelClass) -> 'ModelTypeAggregation':
+        try:
+            aggregates = json.loads(request.query_params.get(cls.AGGREGATES_KEY, '{}'))
+            group_by = json.loads(request.query_params.get(cls.GROUP_BY_KEY, '[]'))
+        except ValueError:
+            raise ValidationError({cls.AGGREGATES_KEY: ['Aggregates and group_by must be JSON.']})
+        if not isinstance(aggregates, dict) or not aggregates:
+            raise _invalid(cls.AGGREGATES_KEY, 'Expected an object of at least one aggregate.')
+        if not isinstance(group_by, list):
+            raise _invalid(cls.GROUP_BY_KEY, 'Expected a list of fields.')
+        return cls(model_cls=model_cls, aggregates=aggregates, group_by=group_by)
+
+    def _field(self, key: str, field_path: typing.Any) -> types.ModelField:
+        if not isinstance(field_path, str):
+            raise _invalid(key, f"Expected a field path, got `{field_path}`.")
+        field, rest = split_lookup_path(self.model_cls, field_path)
+        if rest:
+            raise _invalid(key, f"`{field_path}` is not a field of {self.model_cls.__name__}.")
+        return field
+
+    def _group_expressions(self) -> typing.Tuple[typing.List[str], typing.Dict[str, Trunc]]:
+        """
+        Return the field paths and the (aliased) date truncation buckets to
+        group by.
+
+        """
+        field_paths = []
+        buckets = {}
+        for group in self.group_by:
+            if isinstance(group, str):
+                self._field(self.GROUP_BY_KEY, group)
+                field_paths.append(group)
+                continue
+            if not isinstance(group, dict) or 'field' not in group or 'trunc' not in group:
+                raise _invalid(self.GROUP_BY_KEY, f"Expected a field path or a date bucket, got `{group}`.")
+            field = self._field(self.GROUP_BY_KEY, group['field'])
+            kind = group['trunc']
+            if not isinstance(field, models.DateField):
+                raise _invalid(self.GROUP_BY_KEY, f"Cannot truncate `{group['field']}`, which is not a date.")
+            valid_kinds = DATE_TRUNC_KINDS
+            if isinstance(field, models.DateTimeField):
+                valid_kinds += TIME_TRUNC_KINDS
+            if kind not in valid_kinds:
+                raise _invalid(self.GROUP_BY_KEY, f"Invalid truncation `{kind}` of `{group['field']}`. "
+                                                  f"Valid truncations are: {', '.join(valid_kinds)}.")
+            buckets[group.get('alias') or f"{group['field']}_{kind}"] = Trunc(group['field'], kind)
+        return field_paths, buckets
+
+    def _aggregate_expressions(self) -> typing.Dict[str, models.Aggregate]:
+        expressions = {}
+        for alias, spec in self.aggregates.items():
+            if not isinstance(spec, dict) or spec.get('fn') not in AGGREGATE_FUNCTIONS:
+                raise _invalid(self.AGGREGATES_KEY, f"Invalid aggregate `{alias}`. Valid functions are: "
+                                                    f"{', '.join(AGGREGATE_FUNCTIONS)}.")
+            function = spec['fn']
+            field_path = spec.get('field')
+            if field_path is None:
+                if function != 'count':
+                    raise _invalid(self.AGGREGATES_KEY, f"Aggregate `{alias}` requires a field.")
+                field_path = 'pk'
+            field = self._field(self.AGGREGATES_KEY, field_path)
+            if function in NUMERIC_FUNCTIONS and not isinstance(field, NUMERIC_FIELDS):
+                raise _invalid(self.AGGREGATES_KEY, f"Aggregate `{alias}`: cannot `{function}` `{field_path}`, "
+                                                    f"which is not a number or a duration.")
+            aggregate_cls = AGGREGATE_FUNCTIONS[function]
+            if spec.get('distinct') and not aggregate_cls.allow_distinct:
+                raise _invalid(self.AGGREGATES_KEY, f"Aggregate `{alias}`: `{function}` does not allow distinct.")
+            expressions[alias] = aggregate_cls(field_path, distinct=bool(spec.get('distinct')))
+        return expressions
+
+    def _validate_aliases(self, aliases: typing.Iterable[str]):
+        field_names = {field.name for field in self.model_cls._meta.get_fields()}
+        seen = set()
+        for alias in aliases:
+            if (not isinstance(alias, str) or not alias.isidentifier() or LOOKUP_SEP in alias
+                    or alias in field_names or alias in seen):
+                raise _invalid(self.AGGREGATES_KEY, f"Invalid or conflicting alias `{alias}`.")
+            seen.add(alias)
+
+    def payload(self, queryset: models.QuerySet) -> typing.Union[dict, typing.List[dict]]:
+        field_paths, buckets = self._group_expressions()
+        aggregates = self._aggregate_expressions()
+        self._validate_aliases(list(buckets) + list(aggregates))
+        if not field_paths and not buckets:
+            return _coerce_decimals(queryset.order_by().aggregate(**aggregates))
+        queryset = queryset.values(*field_paths, **buckets).annotate(**aggregates)
+        return [_coerce_decimals(row) for row in queryset.order_by(*field_paths, *buckets)]
@@ -0,0 +1,55 @@
+import typing
+import json
+import hashlib
+
+from django.utils.http import parse_etags
+from rest_framework.request import Request
+
+
+# =================================
+# Conditional Requests
+# ---------------------------------
+
+def request_fingerprint(request: Request) -> list:
+    """
+    Return a JSON serializable fingerprint of what `request` asks for: its
+    path, (order independent) query parameters and accepted media type.
+
+    """
+    return [
+        request.path,
+        sorted((key, sorted(values)) for key, values in request.query_params.lists()),
+        getattr(request, 'accepted_media_type', None)
+    ]
+
+
+def versioned_digest(request: Request, versions: typing.Dict[str, str]) -> str:
+    """
+    Return a digest of `request` and the table `versions` (as returned by
+    `model_versions`) of the tables its response reads. The digest changes
+    whenever any of the tables is written to.
+
+    """
+    data = json.dumps([request_fingerprint(request), sorted(versions.items())])
+    return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+
+def versioned_etag(request: Request, versions: typing.Dict[str, str]) -> str:
+    """
+    Return a strong ETag for the response to `request`, given the `versions`
+    of the tables it reads.
+
+    """
+    return '"' + versioned_digest(request, versions) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Whether the `If-None-Match` header of `request` matches `etag`.
+
+    """
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    etags = parse_etags(if_none_match)
+    return '*' in etags or etag in etags or ('W/' + etag) in etags
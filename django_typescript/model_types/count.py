@@ -0,0 +1,158 @@
+import typing
+import hashlib
+import json
+from collections import namedtuple
+
+from django.db import models, connections
+from django.core.cache import cache
+
+from django_typescript import config
+
+
+# =================================
+# Count Result
+# ---------------------------------
+
+# `value` is `None` if no count was made. `exact` is `False` if `value` is a
+# lower bound or an estimate, rather than the exact number of matching rows.
+CountResult = namedtuple('CountResult', ['strategy', 'value', 'exact'])
+
+
+# =================================
+# Count Strategies
+# ---------------------------------
+
+class CountStrategy(object):
+
+    """
+    Base class for strategies that count the rows of a (filtered) queryset
+    when building paginated payloads.
+
+    """
+
+    NAME: str = None
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        raise NotImplementedError
+
+
+class ExactCount(CountStrategy):
+
+    """
+    An unbounded `COUNT(*)` over the queryset.
+
+    """
+
+    NAME = 'exact'
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        return CountResult(strategy=self.NAME, value=queryset.count(), exact=True)
+
+
+class CappedCount(CountStrategy):
+
+    """
+    Count at most `cap + 1` rows, using a `LIMIT`ed subquery. If there are
+    more than `cap` rows, `cap` is returned as an inexact lower bound.
+
+    """
+
+    NAME = 'capped'
+
+    def __init__(self, cap: int = None):
+        self.cap = cap if cap is not None else config.COUNT_CAP
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        value = queryset.order_by()[:self.cap + 1].count()
+        if value > self.cap:
+            return CountResult(strategy=self.NAME, value=self.cap, exact=False)
+        return CountResult(strategy=self.NAME, value=value, exact=True)
+
+
+class CachedCount(CountStrategy):
+
+    """
+    An exact count, memoized in Django's cache for `ttl` seconds by a
+    fingerprint of the query's SQL and parameters. Counts may be served from
+    the cache, and stale, so they are always reported as inexact.
+
+    """
+
+    NAME = 'cached'
+    CACHE_KEY_PREFIX = 'django_ts:count:'
+
+    def __init__(self, ttl: int = None):
+        self.ttl = ttl if ttl is not None else config.COUNT_CACHE_TTL
+
+    @staticmethod
+    def fingerprint(queryset: models.QuerySet) -> str:
+        sql, params = queryset.query.sql_with_params()
+        data = json.dumps([queryset.db, sql, [str(p) for p in params]])
+        return hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        cache_key = self.CACHE_KEY_PREFIX + self.fingerprint(queryset)
+        value = cache.get(cache_key)
+        if value is not None:
+            return CountResult(strategy=self.NAME, value=value, exact=False)
+        value = queryset.count()
+        cache.set(cache_key, value, self.ttl)
+        return CountResult(strategy=self.NAME, value=value, exact=False)
+
+
+class EstimatedCount(CountStrategy):
+
+    """
+    The query planner's row estimate for the queryset. Only PostgreSQL
+    exposes a usable estimate; on other backends this falls back to an
+    exact count.
+
+    """
+
+    NAME = 'estimated'
+
+    def _postgresql_estimate(self, queryset: models.QuerySet) -> int:
+        sql, params = queryset.order_by().query.sql_with_params()
+        with connections[queryset.db].cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        if connections[queryset.db].vendor == 'postgresql':
+            return CountResult(strategy=self.NAME, value=self._postgresql_estimate(queryset), exact=False)
+        return ExactCount().count(queryset)
+
+
+class NoCount(CountStrategy):
+
+    """
+    Do not count rows at all.
+
+    """
+
+    NAME = 'none'
+
+    def count(self, queryset: models.QuerySet) -> CountResult:
+        return CountResult(strategy=self.NAME, value=None, exact=False)
+
+
+COUNT_STRATEGIES: typing.Dict[str, typing.Type[CountStrategy]] = {
+    strategy_cls.NAME: strategy_cls for strategy_cls in (ExactCount, CappedCount, CachedCount, EstimatedCount, NoCount)
+}
+
+
+def resolve_count_strategy(count_strategy: typing.Union[str, CountStrategy, None]) -> typing.Optional[CountStrategy]:
+    """
+    Return a `CountStrategy` instance for `count_strategy`, which may be
+    a strategy name, a `CountStrategy` instance or `None`.
+
+    """
+    if count_strategy is None or isinstance(count_strategy, CountStrategy):
+        return count_strategy
+    if count_strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Unknown count strategy `{count_strategy}`. Valid strategies are: "
+                         f"{', '.join(COUNT_STRATEGIES.keys())}.")
+    return COUNT_STRATEGIES[count_strategy]()
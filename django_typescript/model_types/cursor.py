@@ -0,0 +1,211 @@
+import typing
+import json
+import base64
+import datetime
+import decimal
+import uuid
+import operator
+from functools import reduce
+
+from django.db import models
+from rest_framework.exceptions import ValidationError
+
+
+# =================================
+# Cursor Value Encoding
+# ---------------------------------
+
+class _CursorValueEncoder(json.JSONEncoder):
+
+    """
+    JSON encoder for cursor key values. Unlike `DjangoJSONEncoder`, datetimes
+    keep their full (microsecond) precision, as cursors are compared against
+    stored values.
+
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        if isinstance(o, (decimal.Decimal, uuid.UUID)):
+            return str(o)
+        return super().default(o)
+
+
+# =================================
+# Cursor
+# ---------------------------------
+
+class Cursor(object):
+
+    """
+    An opaque pointer to a position in a keyset-paginated queryset. It holds
+    the ordering key values of the row it points at, and the direction to
+    paginate in relative to that row.
+
+    """
+
+    NEXT = 'n'
+    PREV = 'p'
+
+    def __init__(self, values: list, direction: str = NEXT):
+        self.values = values
+        self.direction = direction
+
+    @property
+    def is_prev(self):
+        return self.direction == self.PREV
+
+    def encode(self) -> str:
+        data = json.dumps({'d': self.direction, 'v': self.values}, cls=_CursorValueEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        try:
+            padded = token + '=' * (-len(token) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+            direction = data['d']
+            values = data['v']
+        except (ValueError, KeyError, TypeError):
+            raise ValidationError({'cursor': 'Invalid cursor.'})
+        if direction not in (cls.NEXT, cls.PREV) or not isinstance(values, list):
+            raise ValidationError({'cursor': 'Invalid cursor.'})
+        return cls(values=values, direction=direction)
+
+
+# =================================
+# Keyset Paginator
+# ---------------------------------
+
+class KeysetPaginator(object):
+
+    """
+    Paginates a queryset by 'keyset' (a.k.a. 'seek' or 'cursor') pagination:
+    rather than `OFFSET n`, each page is selected with a `WHERE` clause on the
+    ordering key of the previous page's boundary row, and no `COUNT(*)` is
+    run. The queryset's active ordering is used, with the primary key appended
+    as a tie-breaker so the ordering key is unique.
+
+    Ordering fields are expected to be non-nullable; `NULL` key values are
+    matched with `isnull` for equality, but are never compared with `<`/`>`.
+
+    """
+
+    KEY_ANNOTATION_PREFIX = '_djts_cursor_'
+
+    def __init__(self, queryset: models.QuerySet, page_size: int):
+        self.queryset = queryset
+        self.page_size = page_size
+        self.ordering: typing.List[typing.Tuple[str, bool]] = self._resolve_ordering()
+
+    def _resolve_ordering(self) -> typing.List[typing.Tuple[str, bool]]:
+        """
+        Return the `(field path, descending)` pairs of this paginator's
+        queryset ordering, including the primary key tie-breaker.
+
+        """
+        query = self.queryset.query
+        order_by = list(query.order_by) if query.order_by else list(query.get_meta().ordering or [])
+        ordering = []
+        pk_names = {'pk', query.get_meta().pk.name}
+        has_pk = False
+        for order_field in order_by:
+            if not isinstance(order_field, str) or order_field == '?':
+                raise ValidationError({'cursor': 'Cursor pagination requires an ordering made up of field names.'})
+            descending = order_field.startswith('-')
+            field_path = order_field.lstrip('-+')
+            if field_path in pk_names:
+                field_path, has_pk = 'pk', True
+            ordering.append((field_path, descending))
+        if not has_pk:
+            ordering.append(('pk', False))
+        return ordering
+
+    @property
+    def key_aliases(self) -> typing.List[str]:
+        return [self.KEY_ANNOTATION_PREFIX + str(i) for i in range(len(self.ordering))]
+
+    def _order_by(self, reverse: bool) -> typing.List[str]:
+        order_by = []
+        for field_path, descending in self.ordering:
+            descending = descending != reverse
+            order_by.append(('-' if descending else '') + field_path)
+        return order_by
+
+    def _seek_q(self, values: list, reverse: bool) -> models.Q:
+        """
+        Return the `Q` selecting rows strictly after (or, if `reverse`, before)
+        the row whose ordering key is `values`:
+
+            (f1 > v1) OR (f1 = v1 AND f2 > v2) OR ...
+
+        """
+        if len(values) != len(self.ordering):
+            raise ValidationError({'cursor': 'Cursor does not match the current ordering.'})
+        branches = []
+        for i, (field_path, descending) in enumerate(self.ordering):
+            value = values[i]
+            if value is None:
+                continue
+            lookup = 'lt' if descending != reverse else 'gt'
+            conditions = {}
+            for prev_field_path, prev_value in zip([f for f, _ in self.ordering[:i]], values[:i]):
+                if prev_value is None:
+                    conditions[prev_field_path + '__isnull'] = True
+                else:
+                    conditions[prev_field_path] = prev_value
+            conditions[field_path + '__' + lookup] = value
+            branches.append(models.Q(**conditions))
+        if not branches:
+            raise ValidationError({'cursor': 'Cursor does not point to a comparable row.'})
+        return reduce(operator.or_, branches)
+
+    def _row_key(self, row) -> list:
+        if isinstance(row, dict):
+            return [row[alias] for alias in self.key_aliases]
+        return [getattr(row, alias) for alias in self.key_aliases]
+
+    def annotated_queryset(self, cursor: typing.Optional[Cursor]) -> models.QuerySet:
+        """
+        Return the queryset for the page following (or preceding) `cursor`,
+        annotated with its ordering key and limited to one row more than the
+        page size, so the existence of a further page can be detected.
+
+        """
+        reverse = cursor is not None and cursor.is_prev
+        queryset = self.queryset.annotate(
+            **{alias: models.F(field_path) for alias, (field_path, _) in zip(self.key_aliases, self.ordering)}
+        )
+        if cursor is not None:
+            queryset = queryset.filter(self._seek_q(cursor.values, reverse=reverse))
+        queryset = queryset.order_by(*self._order_by(reverse=reverse))
+        return queryset[:self.page_size + 1]
+
+    def paginate(self, rows: list, cursor: typing.Optional[Cursor]) -> typing.Tuple[list, typing.Optional[str], typing.Optional[str]]:
+        """
+        Given the evaluated rows of `annotated_queryset(cursor)`, return the
+        page rows (in ordering order) and the encoded next/previous cursors.
+
+        """
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        next_cursor, prev_cursor = None, None
+        if cursor is not None and cursor.is_prev:
+            rows = rows[::-1]
+            if rows:
+                next_cursor = Cursor(values=self._row_key(rows[-1]), direction=Cursor.NEXT).encode()
+                if has_more:
+                    prev_cursor = Cursor(values=self._row_key(rows[0]), direction=Cursor.PREV).encode()
+        else:
+            if rows:
+                if has_more:
+                    next_cursor = Cursor(values=self._row_key(rows[-1]), direction=Cursor.NEXT).encode()
+                if cursor is not None:
+                    prev_cursor = Cursor(values=self._row_key(rows[0]), direction=Cursor.PREV).encode()
+        return rows, next_cursor, prev_cursor
+
+    def strip_key(self, row: dict) -> dict:
+        for alias in self.key_aliases:
+            row.pop(alias, None)
+        return row
@@ -0,0 +1,232 @@
+import re
+import typing
+import logging
+
+from django.db import models, connections
+from rest_framework.exceptions import ValidationError
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.utils.lru_cache import LRUCache
+from django_typescript.model_types.query_plan import QueryPlan, split_lookup_path
+
+
+logger = logging.getLogger('django_typescript')
+
+
+# =================================
+# Indexed Fields
+# ---------------------------------
+
+# Lookups that a B-tree index on the looked up column can serve.
+INDEXABLE_LOOKUPS = {'exact', 'in', 'gt', 'gte', 'lt', 'lte', 'range', 'isnull', 'startswith'}
+
+# Transforms that Django rewrites into an indexable comparison on the column
+# itself (e.g. `date__year=2020` becomes a `BETWEEN`), mapped to the lookups
+# for which it does so.
+INDEXABLE_TRANSFORMS = {'year': {'exact', 'gt', 'gte', 'lt', 'lte'}, 'iso_year': {'exact', 'gt', 'gte', 'lt', 'lte'}}
+
+
+INDEXED_FIELDS_CACHE = LRUCache(maxsize=config.QUERY_PLAN_CACHE_SIZE)
+
+
+def _indexed_field_names(model_cls: types.ModelClass) -> typing.FrozenSet[str]:
+    opts = model_cls._meta
+    names = {opts.pk.name}
+    for field in opts.concrete_fields:
+        if field.unique or field.db_index:
+            names.add(field.name)
+    for index in opts.indexes:
+        if index.fields:
+            names.add(index.fields[0].lstrip('-'))
+    for field_names in list(opts.index_together) + list(opts.unique_together):
+        if field_names:
+            names.add(field_names[0])
+    for constraint in opts.constraints:
+        if isinstance(constraint, models.UniqueConstraint) and constraint.condition is None and constraint.fields:
+            names.add(constraint.fields[0])
+    return frozenset(names)
+
+
+def indexed_field_names(model_cls: types.ModelClass) -> typing.FrozenSet[str]:
+    """
+    Return the (cached) names of the fields of `model_cls` that lead (are the first
+    column of) at least one index: the primary key, `unique` and `db_index`
+    fields (including foreign keys), and the first fields of `Meta.indexes`,
+    `index_together`, `unique_together` and unconditional `UniqueConstraint`s.
+    Only leading columns are returned, as a multi-column index cannot be used
+    to search on its other columns alone.
+
+    """
+    return INDEXED_FIELDS_CACHE.get_or_set(model_cls, lambda: _indexed_field_names(model_cls))
+
+
+def clear_indexed_fields_cache():
+    INDEXED_FIELDS_CACHE.clear()
+
+
+def _field_is_indexed(field: types.ModelField) -> bool:
+    if field.auto_created and not field.concrete:
+        # Reverse relations are matched on the related model's foreign key,
+        # or on a many-to-many table's indexed columns.
+        return True
+    if field.many_to_many:
+        return True
+    return field.name in indexed_field_names(field.model)
+
+
+def lookup_index_violation(model_cls: types.ModelClass, lookup_path: str) -> typing.Optional[str]:
+    """
+    Return why a filter on `lookup_path` cannot use an index, or `None` if it
+    can.
+
+    """
+    field, lookup_parts = split_lookup_path(model_cls, lookup_path)
+    if not _field_is_indexed(field):
+        return f"`{lookup_path}`: {field.model.__name__}.{field.name} is not indexed."
+    if not lookup_parts:
+        return None
+    *transforms, lookup = lookup_parts
+    if lookup in INDEXABLE_TRANSFORMS and not transforms:
+        return None
+    if len(transforms) > 1 or (transforms and lookup not in INDEXABLE_TRANSFORMS.get(transforms[0], ())):
+        return f"`{lookup_path}`: transform `{'__'.join(transforms)}` cannot use an index."
+    if lookup not in INDEXABLE_LOOKUPS and not transforms:
+        return f"`{lookup_path}`: lookup `{lookup}` cannot use an index."
+    return None
+
+
+def ordering_index_violation(model_cls: types.ModelClass, order_by: typing.List[str]) -> typing.Optional[str]:
+    """
+    Return why the (leading field of) `order_by` cannot be read from an
+    index, or `None` if it can.
+
+    """
+    if not order_by:
+        return None
+    order_field = order_by[0]
+    if order_field == '?':
+        return '`?`: random ordering cannot use an index.'
+    field_path = order_field.lstrip('-+')
+    if '__' in field_path:
+        return f"`{order_field}`: ordering across relations cannot use an index."
+    field, _ = split_lookup_path(model_cls, field_path)
+    if not _field_is_indexed(field):
+        return f"`{order_field}`: {field.model.__name__}.{field.name} is not indexed."
+    return None
+
+
+# =================================
+# Explain Verdicts
+# ---------------------------------
+
+def explain_index_violations(queryset: models.QuerySet) -> typing.List[str]:
+    """
+    Return the full table scans and index-less sorts in the database's plan
+    for `queryset`. Only PostgreSQL and SQLite plans are inspected.
+
+    """
+    vendor = connections[queryset.db].vendor
+    if vendor not in ('postgresql', 'sqlite'):
+        return []
+    violations = []
+    for line in queryset.explain().splitlines():
+        # Strip PostgreSQL's tree drawing and SQLite's node ids.
+        line = re.sub(r'^[\d\s|`>-]*', '', line).strip()
+        if vendor == 'postgresql' and 'Seq Scan' in line:
+            violations.append(f"EXPLAIN: {line}")
+        elif vendor == 'sqlite':
+            if (line.startswith('SCAN') and 'USING' not in line) or 'TEMP B-TREE' in line:
+                violations.append(f"EXPLAIN: {line}")
+    return violations
+
+
+# =================================
+# Index Policy
+# ---------------------------------
+
+INDEX_VERDICT_CACHE = LRUCache(maxsize=config.QUERY_PLAN_CACHE_SIZE)
+
+
+class IndexPolicy(object):
+
+    """
+    Checks that client supplied filters and orderings can use an index, and
+    rejects (with a 400 response) or flags (by logging a warning and setting
+    an `X-Index-Violations` response header) those that cannot.
+
+    If `explain`, the database's `EXPLAIN` output is inspected as well. Either
+    way, verdicts are cached per model and query shape, so each shape is only
+    checked (and explained) once.
+
+    """
+
+    REJECT = 'reject'
+    FLAG = 'flag'
+    EXPLAIN = 'explain'
+
+    def __init__(self, action: str = REJECT, explain: bool = False):
+        if action not in (self.REJECT, self.FLAG):
+            raise ValueError(f"Unknown index policy action `{action}`. Valid actions are: "
+                             f"{self.REJECT}, {self.FLAG}.")
+        self.action = action
+        self.explain = explain
+
+    def _violations(self, model_cls: types.ModelClass, plan: typing.Optional[QueryPlan],
+                    order_by: typing.Optional[typing.List[str]], queryset: models.QuerySet) -> typing.List[str]:
+        violations = []
+        if plan is not None:
+            for lookup_path in plan.lookup_paths:
+                violation = lookup_index_violation(model_cls, lookup_path)
+                if violation is not None:
+                    violations.append(violation)
+        violation = ordering_index_violation(model_cls, order_by)
+        if violation is not None:
+            violations.append(violation)
+        if self.explain:
+            violations += explain_index_violations(queryset)
+        return violations
+
+    def violations(self, model_cls: types.ModelClass, plan: typing.Optional[QueryPlan],
+                   order_by: typing.Optional[typing.List[str]], queryset: models.QuerySet) -> typing.List[str]:
+        """
+        Return the (cached) index violations of `queryset`, built by applying
+        `plan` and ordering by `order_by`.
+
+        """
+        cache_key = (model_cls, plan.shape if plan is not None else None, tuple(order_by or ()), self.explain)
+        return INDEX_VERDICT_CACHE.get_or_set(
+            cache_key, lambda: self._violations(model_cls=model_cls, plan=plan, order_by=order_by, queryset=queryset)
+        )
+
+    def enforce(self, model_cls: types.ModelClass, plan: typing.Optional[QueryPlan],
+                order_by: typing.Optional[typing.List[str]], queryset: models.QuerySet) -> typing.List[str]:
+        """
+        Apply this policy to `queryset`, raising a `ValidationError` if it is
+        rejected. Return its (flagged) violations.
+
+        """
+        violations = self.violations(model_cls=model_cls, plan=plan, order_by=order_by, queryset=queryset)
+        if violations and self.action == self.REJECT:
+            raise ValidationError({'index_policy': violations})
+        if violations:
+            logger.warning('Query on %s cannot use an index: %s', model_cls.__name__, ' '.join(violations))
+        return violations
+
+
+def resolve_index_policy(index_policy: typing.Union[str, IndexPolicy, None]) -> typing.Optional[IndexPolicy]:
+    """
+    Return an `IndexPolicy` instance for `index_policy`, which may be an
+    `IndexPolicy`, `None`, or one of the names `'reject'`, `'flag'` or
+    `'explain'` (flag, with `EXPLAIN` checks).
+
+    """
+    if index_policy is None or isinstance(index_policy, IndexPolicy):
+        return index_policy
+    if index_policy == IndexPolicy.EXPLAIN:
+        return IndexPolicy(action=IndexPolicy.FLAG, explain=True)
+    return IndexPolicy(action=index_policy)
+
+
+def clear_index_verdict_cache():
+    INDEX_VERDICT_CACHE.clear()
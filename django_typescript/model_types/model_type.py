@@ -7,16 +7,31 @@ from django.urls import path
 from rest_framework.generics import CreateAPIView
 
 from django_typescript.model_types.serializer import ModelTypeSerializer
+from django_typescript.model_types.count import CountStrategy, resolve_count_strategy
+from django_typescript.model_types.index_policy import IndexPolicy, resolve_index_policy
+from django_typescript.model_types.versions import connect_version_signals
+from django_typescript.model_types.result_cache import ResultCache, resolve_result_cache
+from django_typescript.model_types.relation_graph import RelationGraph
+from django_typescript.model_types.routing import ReadRouting, resolve_read_routing
+from django_typescript.core.timeouts import resolve_query_timeouts
+from django_typescript.model_types.view import ModelView
 from django_typescript.core.model_inspector import ModelInspector
+from django_typescript.core.exceptions import ModelTypeImproperlyConfigured
 from django_typescript.core import types
-from django_typescript.model_types.views import (CreateView,
+from django_typescript.model_types.views import (AggregateView,
+                                                 BulkCreateView,
+                                                 BulkUpdateView,
+                                                 CreateView,
                                                  DeleteView,
+                                                 QueryDeleteView,
                                                  GetView,
+                                                 GetManyView,
                                                  GetOrCreateView,
                                                  ListView,
                                                  ModelMethodView,
                                                  ModelStaticMethodView,
                                                  UpdateView,
+                                                 QueryUpdateView,
                                                  ModelPropertyView)
 
 
@@ -46,11 +61,24 @@ class ModelType(object):
     _SERIALIZER_FIELD_KWARGS: dict = None
     _ONE_TO_ONE_PROXY_FIELDS: types.OneToOneProxyFields = None
     _PROPERTY_FIELDS: typing.List[str] = None
+    _COUNT_STRATEGY: typing.Union[str, CountStrategy] = None
+    _INDEX_POLICY: typing.Union[str, IndexPolicy] = None
+    _ETAG: bool = False
+    _RESULT_CACHE: typing.Union[bool, ResultCache] = None
+    _READ_ROUTING: typing.Union[bool, typing.List[str], ReadRouting] = None
+    _QUERY_TIMEOUT: typing.Union[float, typing.Dict[str, float]] = None
+    _THROTTLE_CLASSES: types.ThrottleClasses = None
 
     def __init__(self, model_cls: typing.Type[models.Model], create_permissions: types.PermissionClasses = None,
                  get_permissions: types.PermissionClasses = None, delete_permissions: types.PermissionClasses = None,
                  update_permissions: types.PermissionClasses = None, serializer_field_kwargs: dict = None,
-                 one_to_one_proxy_fields: types.OneToOneProxyFields = None, property_fields: typing.List[str] = None):
+                 one_to_one_proxy_fields: types.OneToOneProxyFields = None, property_fields: typing.List[str] = None,
+                 count_strategy: typing.Union[str, CountStrategy] = None,
+                 index_policy: typing.Union[str, IndexPolicy] = None, etag: bool = False,
+                 result_cache: typing.Union[bool, ResultCache] = None,
+                 read_routing: typing.Union[bool, typing.List[str], ReadRouting] = None,
+                 query_timeout: typing.Union[float, typing.Dict[str, float]] = None,
+                 throttle_classes: types.ThrottleClasses = None):
 
         """
 
@@ -61,10 +89,40 @@ class ModelType(object):
         get_permissions
         delete_permissions
         update_permissions
+        count_strategy: The default `CountStrategy` (or strategy name) used to count
+            paginated list results. Defaults to an exact count.
+        index_policy: An optional `IndexPolicy` (or `'reject'`, `'flag'` or `'explain'`)
+            applied to list filters and orderings that cannot use an index.
+        etag: Whether list and get responses carry ETags, derived from the versions
+            of the tables they read, and matching `If-None-Match` requests are
+            answered with a 304.
+        result_cache: An optional `ResultCache` (or `True`, for the default one)
+            caching list and get response data until a table they read is
+            written to.
+        read_routing: An optional `ReadRouting` (or a list of read database aliases, or
+            `True`, for `DJANGO_TS_READ_DATABASES`) routing the queries of read views to
+            read databases. Defaults to the routing of the `Interface`.
+        query_timeout: The time limit, in seconds, of each query run by the generated
+            views, or a mapping of view names (e.g. `'list'`, or the name of a method or
+            property field) to time limits. Queries
+            over the limit are cancelled and answered with a 504. Defaults to
+            `DJANGO_TS_QUERY_TIMEOUT`.
+        throttle_classes: Optional throttle classes (e.g. `QueryCostThrottle`) of the
+            generated views, replacing DRF's `DEFAULT_THROTTLE_CLASSES`.
         """
 
         self.model_cls = model_cls
         self.model_inspector = ModelInspector(model_cls=model_cls)
+        self.etag = etag
+        self.result_cache = resolve_result_cache(result_cache)
+        self.read_routing = resolve_read_routing(read_routing)
+        if etag or self.result_cache is not None:
+            connect_version_signals(model_cls)
+        try:
+            self.count_strategy = resolve_count_strategy(count_strategy)
+            self.index_policy = resolve_index_policy(index_policy)
+        except ValueError as e:
+            raise ModelTypeImproperlyConfigured(str(e))
         self.serializer: ModelTypeSerializer = ModelTypeSerializer(model_cls=model_cls,
                                                                    validate_func=getattr(self, "validate", None),
                                                                    serializer_field_kwargs=serializer_field_kwargs,
@@ -73,20 +131,48 @@ class ModelType(object):
         self.create_view = CreateView(serializer=self.serializer,
                                       serializer_cls=self.serializer.base_serializer_cls,
                                       permission_classes=create_permissions)
+        self.bulk_create_view = BulkCreateView(serializer=self.serializer,
+                                               serializer_cls=self.serializer.base_serializer_cls,
+                                               permission_classes=create_permissions)
         self.delete_view = DeleteView(serializer=self.serializer,
                                       serializer_cls=self.serializer.base_serializer_cls,
                                       permission_classes=delete_permissions)
+        self.query_delete_view = QueryDeleteView(serializer=self.serializer,
+                                                 serializer_cls=self.serializer.base_serializer_cls,
+                                                 permission_classes=delete_permissions, index_policy=self.index_policy)
         self.get_view = GetView(serializer=self.serializer, serializer_cls=self.serializer.base_serializer_cls,
-                                permission_classes=get_permissions)
+                                permission_classes=get_permissions, etag=etag, result_cache=self.result_cache)
+        self.get_many_view = GetManyView(serializer=self.serializer, serializer_cls=self.serializer.base_serializer_cls,
+                                         permission_classes=get_permissions)
         self.get_or_create_view = GetOrCreateView(serializer=self.serializer,
                                                   serializer_cls=self.serializer.base_serializer_cls,
                                                   permission_classes=create_permissions)
         self.list_view = ListView(serializer=self.serializer, serializer_cls=self.serializer.base_serializer_cls,
-                                  permission_classes=get_permissions)
+                                  permission_classes=get_permissions, count_strategy=self.count_strategy,
+                                  index_policy=self.index_policy, etag=etag, result_cache=self.result_cache)
+        self.aggregate_view = AggregateView(serializer=self.serializer,
+                                            serializer_cls=self.serializer.base_serializer_cls,
+                                            permission_classes=get_permissions, index_policy=self.index_policy)
         self.update_view = UpdateView(serializer=self.serializer, serializer_cls=self.serializer.base_serializer_cls,
                                       permission_classes=update_permissions)
+        self.query_update_view = QueryUpdateView(serializer=self.serializer,
+                                                 serializer_cls=self.serializer.base_serializer_cls,
+                                                 permission_classes=update_permissions, index_policy=self.index_policy)
+        self.bulk_update_view = BulkUpdateView(serializer=self.serializer,
+                                               serializer_cls=self.serializer.base_serializer_cls,
+                                               permission_classes=update_permissions)
         self.one_to_one_proxy_fields = one_to_one_proxy_fields
         self.property_fields = property_fields
+        self.throttle_classes = throttle_classes
+        view_names = list(self.model_views) + [view.name for view in self.method_views + self.static_method_views
+                                               + self.property_views]
+        try:
+            self.query_timeouts = resolve_query_timeouts(query_timeout, view_names=view_names)
+        except ValueError as e:
+            raise ModelTypeImproperlyConfigured(str(e))
+        for name, model_view in self.model_views.items():
+            model_view.query_timeout = self.query_timeouts[name]
+            model_view.throttle_classes = throttle_classes
 
     def __init_subclass__(cls, **kwargs):
         model_cls = kwargs.get('model_cls', None)
@@ -99,6 +185,13 @@ class ModelType(object):
         one_to_one_proxy_fields = kwargs.get('one_to_one_proxy_fields')
         serializer_field_kwargs = kwargs.get('serializer_field_kwargs')
         property_fields = kwargs.get('property_fields')
+        count_strategy = kwargs.get('count_strategy')
+        index_policy = kwargs.get('index_policy')
+        etag = kwargs.get('etag', False)
+        result_cache = kwargs.get('result_cache')
+        read_routing = kwargs.get('read_routing')
+        query_timeout = kwargs.get('query_timeout')
+        throttle_classes = kwargs.get('throttle_classes')
         cls._MODEL_CLS = model_cls
         cls._CREATE_PERMISSIONS = create_permissions
         cls._GET_PERMISSIONS = get_permissions
@@ -107,15 +200,46 @@ class ModelType(object):
         cls._SERIALIZER_FIELD_KWARGS = serializer_field_kwargs
         cls._ONE_TO_ONE_PROXY_FIELDS = one_to_one_proxy_fields
         cls._PROPERTY_FIELDS = property_fields
+        cls._COUNT_STRATEGY = count_strategy
+        cls._INDEX_POLICY = index_policy
+        cls._ETAG = etag
+        cls._RESULT_CACHE = result_cache
+        cls._READ_ROUTING = read_routing
+        cls._QUERY_TIMEOUT = query_timeout
+        cls._THROTTLE_CLASSES = throttle_classes
 
     @classmethod
     def as_type(cls) -> 'ModelType':
         type_ = cls(model_cls=cls._MODEL_CLS, create_permissions=cls._CREATE_PERMISSIONS,
                     get_permissions=cls._GET_PERMISSIONS, delete_permissions=cls._DELETE_PERMISSIONS,
                     update_permissions=cls._UPDATE_PERMISSIONS, serializer_field_kwargs=cls._SERIALIZER_FIELD_KWARGS,
-                    one_to_one_proxy_fields=cls._ONE_TO_ONE_PROXY_FIELDS, property_fields=cls._PROPERTY_FIELDS)
+                    one_to_one_proxy_fields=cls._ONE_TO_ONE_PROXY_FIELDS, property_fields=cls._PROPERTY_FIELDS,
+                    count_strategy=cls._COUNT_STRATEGY, index_policy=cls._INDEX_POLICY, etag=cls._ETAG, result_cache=cls._RESULT_CACHE,
+                    read_routing=cls._READ_ROUTING, query_timeout=cls._QUERY_TIMEOUT,
+                    throttle_classes=cls._THROTTLE_CLASSES)
         return type_
 
+    @property
+    def model_views(self) -> typing.Dict[str, ModelView]:
+        """
+        The generated views of this ModelType, by URL name.
+
+        """
+        return {
+            'create': self.create_view,
+            'bulk_create': self.bulk_create_view,
+            'delete': self.delete_view,
+            'query_delete': self.query_delete_view,
+            'get': self.get_view,
+            'get_many': self.get_many_view,
+            'get_or_create': self.get_or_create_view,
+            'list': self.list_view,
+            'aggregate': self.aggregate_view,
+            'update': self.update_view,
+            'query_update': self.query_update_view,
+            'bulk_update': self.bulk_update_view,
+        }
+
     @property
     def serializer_cls(self):
         return self.serializer.base_serializer_cls
@@ -178,37 +302,83 @@ class ModelType(object):
 
         return decorator
 
+    def bind_read_routing(self, read_routing: typing.Optional[ReadRouting]):
+        """
+        Route this ModelType's read views with `read_routing`, the routing of
+        its `Interface`, unless it has a routing of its own.
+
+        """
+        if self.read_routing is None:
+            self.read_routing = read_routing
+
+    def _write_view(self, view):
+        """
+        Return the view function of write (or method) `view`, which keeps a
+        client's reads on the primary database after its writes.
+
+        """
+        if self.read_routing is None:
+            return view.view()
+        return self.read_routing.sticky_writes(view.view())
+
     def urlpatterns(self):
         """
         Return the Django URL patterns for this ModelType.
 
         :return:
         """
+        for read_view in (self.get_view, self.get_many_view, self.list_view, self.aggregate_view):
+            read_view.read_routing = self.read_routing
         urlpatterns = [
-            path(self.create_view.endpoint.url(), self.create_view.view(), name='create'),
-            path(self.delete_view.endpoint.url(URL_PARAM), self.delete_view.view(), name='delete'),
+            path(self.create_view.endpoint.url(), self._write_view(self.create_view), name='create'),
+            path(self.bulk_create_view.endpoint.url(), self._write_view(self.bulk_create_view), name='bulk_create'),
+            path(self.delete_view.endpoint.url(URL_PARAM), self._write_view(self.delete_view), name='delete'),
+            path(self.query_delete_view.endpoint.url(), self._write_view(self.query_delete_view), name='query_delete'),
             path(self.get_view.endpoint.url(URL_PARAM), self.get_view.view(), name='get'),
-            path(self.get_or_create_view.endpoint.url(), self.get_or_create_view.view(), name='get_or_create'),
+            path(self.get_many_view.endpoint.url(), self.get_many_view.view(), name='get_many'),
+            path(self.get_or_create_view.endpoint.url(), self._write_view(self.get_or_create_view),
+                 name='get_or_create'),
             path(self.list_view.endpoint.url(), self.list_view.view(), name='list'),
-            path(self.update_view.endpoint.url(URL_PARAM), self.update_view.view(), name='update'),
+            path(self.aggregate_view.endpoint.url(), self.aggregate_view.view(), name='aggregate'),
+            path(self.update_view.endpoint.url(URL_PARAM), self._write_view(self.update_view), name='update'),
+            path(self.query_update_view.endpoint.url(), self._write_view(self.query_update_view),
+                 name='query_update'),
+            path(self.bulk_update_view.endpoint.url(), self._write_view(self.bulk_update_view), name='bulk_update'),
         ]
         for method_view in self.method_views:
             # Pass the method view this ModelType's serializer class.
             method_view.model_serializer_cls = self.serializer.base_serializer_cls
+            method_view.query_timeout = self.query_timeouts[method_view.name]
+            method_view.throttle_classes = self.throttle_classes
             urlpatterns.append(
-                path(method_view.endpoint.url(URL_PARAM), method_view.view(), name=method_view.name),
+                path(method_view.endpoint.url(URL_PARAM), self._write_view(method_view), name=method_view.name),
             )
         for static_method_view in self.static_method_views:
             static_method_view.model_type_cls = self.__class__
+            static_method_view.query_timeout = self.query_timeouts[static_method_view.name]
+            static_method_view.throttle_classes = self.throttle_classes
             urlpatterns.append(
-                path(static_method_view.endpoint.url(), static_method_view.view(), name=static_method_view.name),
+                path(static_method_view.endpoint.url(), self._write_view(static_method_view),
+                     name=static_method_view.name),
             )
         for property_view in self.property_views:
+            property_view.read_routing = self.read_routing
+            property_view.query_timeout = self.query_timeouts[property_view.name]
+            property_view.throttle_classes = self.throttle_classes
             urlpatterns.append(
                 path(property_view.endpoint.url(URL_PARAM), property_view.view(), name=property_view.name),
             )
         return urlpatterns
 
+    def bind_relation_graph(self, relation_graph: RelationGraph):
+        """
+        Resolve the prefetch trees of this ModelType's views against
+        `relation_graph`, the relation graph of its `Interface`.
+
+        """
+        for view in self.model_views.values():
+            view.relation_graph = relation_graph
+
     @property
     def model_name(self):
         return self.model_cls.__name__
@@ -25,3 +25,27 @@ class PrefetchResolver(object):
 
 
 
+
+
+# =================================
+# Canonical Prefetch Trees
+# ---------------------------------
+
+def canonical_prefetch_tree(prefetch_tree: types.PrefetchTree) -> typing.Hashable:
+    """
+    Return a hashable, structurally equivalent form of `prefetch_tree`,
+    suitable for use as a cache key. Lists become tuples and dictionaries
+    become tuples of `(key, subtree)` pairs, e.g:
+
+        `{'parent': ['grand_parent']}` -> `(('parent', ('grand_parent',)),)`
+
+    """
+    if isinstance(prefetch_tree, str):
+        return prefetch_tree
+    if isinstance(prefetch_tree, list):
+        return tuple(canonical_prefetch_tree(t) for t in prefetch_tree)
+    return tuple((k, canonical_prefetch_tree(v)) for k, v in prefetch_tree.items())
+
+
+def canonical_prefetch_trees(prefetch_trees: typing.List[types.PrefetchTree]) -> typing.Hashable:
+    return tuple(canonical_prefetch_tree(t) for t in prefetch_trees)
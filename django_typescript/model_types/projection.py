@@ -0,0 +1,94 @@
+import typing
+
+from django.db import models
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.utils.lru_cache import LRUCache
+
+
+# =================================
+# Serializer Projection
+# ---------------------------------
+
+PROJECTION_CACHE = LRUCache(maxsize=config.PREFETCH_SERIALIZER_CACHE_SIZE)
+
+
+class _Unprojectable(Exception):
+    pass
+
+
+def _serializer_fields(serializer: serializers.BaseSerializer) -> typing.Dict[str, serializers.Field]:
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    return serializer.fields
+
+
+def _projection(serializer: serializers.BaseSerializer, model_cls: types.ModelClass,
+                prefix: str = '') -> typing.List[str]:
+    """
+    Return the `only()` field paths needed to serialize instances of
+    `model_cls` with `serializer`, prefixing each with `prefix`. Raises
+    `_Unprojectable` if the fields cannot be determined, e.g. because
+    the serializer reads a property or a field of an unjoined relation.
+
+    """
+    opts = model_cls._meta
+    paths = [prefix + opts.pk.name]
+    for field in _serializer_fields(serializer).values():
+        if field.write_only:
+            continue
+        if field.source == '*' or len(field.source_attrs) != 1:
+            raise _Unprojectable
+        try:
+            model_field = opts.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            raise _Unprojectable
+        if types.field_is_multi_valued_relation(model_field):
+            # Fetched by a separate (prefetch) query, matched on the primary key.
+            continue
+        path = prefix + model_field.name
+        if not model_field.concrete:
+            if not (model_field.one_to_one and isinstance(field, serializers.BaseSerializer)):
+                raise _Unprojectable
+            # A joined reverse one-to-one, which has no column of its own.
+            paths += _projection(field, model_field.related_model, prefix=path + '__')
+            continue
+        if path not in paths:
+            paths.append(path)
+        if isinstance(field, serializers.BaseSerializer):
+            paths += _projection(field, model_field.related_model, prefix=path + '__')
+    return paths
+
+
+def serializer_projection(serializer_cls: types.ModelSerializerClass) -> typing.Optional[typing.Tuple[str, ...]]:
+    """
+    Return the field paths `serializer_cls` reads from its model - across
+    nested (`select_related`) serializers - as arguments for `only()`, or
+    `None` if they cannot be determined. Projections are cached per
+    serializer class.
+
+    """
+    def build():
+        try:
+            return tuple(_projection(serializer_cls(), serializer_cls.Meta.model))
+        except _Unprojectable:
+            return None
+    return PROJECTION_CACHE.get_or_set(serializer_cls, build)
+
+
+def project_queryset(queryset: models.QuerySet, serializer_cls: types.ModelSerializerClass) -> models.QuerySet:
+    """
+    Restrict the columns `queryset` selects to those read by `serializer_cls`.
+
+    """
+    projection = serializer_projection(serializer_cls)
+    if projection is None:
+        return queryset
+    return queryset.only(*projection)
+
+
+def clear_projection_cache():
+    PROJECTION_CACHE.clear()
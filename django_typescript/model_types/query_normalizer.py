@@ -0,0 +1,205 @@
+import json
+import typing
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.utils.lru_cache import LRUCache
+from django_typescript.model_types.query_plan import QueryPlan
+from django_typescript.model_types.index_policy import lookup_index_violation
+
+
+# =================================
+# Query Branches
+# ---------------------------------
+
+# A branch of a query: its filters and excludes, AND-ed. A query is the OR of
+# its branches.
+Branch = typing.Tuple[dict, dict]
+
+# The branch of a query that matches nothing (Django answers `pk__in=[]`
+# without querying the database).
+EMPTY_BRANCH: Branch = ({'pk__in': []}, {})
+
+
+def query_branches(query) -> typing.List[Branch]:
+    """
+    Return the branches of `query`, a `ModelTypeQuery`: its own lookups (if
+    any), then those of its `or_` children's branches, at any depth.
+
+    """
+    branches = [(query.filters, query.exclude or {})] if query.filters or query.exclude else []
+    for child in query.children:
+        branches += query_branches(child)
+    return branches
+
+
+def _canonical(value) -> str:
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _branch_key(branch: Branch) -> str:
+    return _canonical(branch)
+
+
+def _branch_shape(branch: Branch) -> tuple:
+    filters, exclude = branch
+    return tuple(sorted(filters)), tuple(sorted(exclude))
+
+
+# =================================
+# Lookup Folding
+# ---------------------------------
+
+def _foldable_lookup(model_cls: types.ModelClass,
+                     key: str, value) -> typing.Optional[typing.Tuple[types.ModelField, typing.FrozenSet]]:
+    """
+    Return the field and the set of values a `key=value` lookup allows, if it
+    is an `exact` or `in` lookup on a (non-text) column of `model_cls` itself.
+    Text columns are left alone, as database collations may compare distinct
+    strings as equal.
+
+    """
+    parts = key.split(LOOKUP_SEP)
+    lookup = parts[1] if len(parts) == 2 else 'exact'
+    if len(parts) > 2 or lookup not in ('exact', 'in') or value is None:
+        return None
+    opts = model_cls._meta
+    try:
+        field = opts.pk if parts[0] == 'pk' else opts.get_field(parts[0])
+    except FieldDoesNotExist:
+        return None
+    if not field.concrete or field.many_to_many or isinstance(field, (models.CharField, models.TextField)):
+        return None
+    if lookup == 'in' and not isinstance(value, list):
+        return None
+    try:
+        return field, frozenset(field.to_python(v) for v in (value if lookup == 'in' else [value]))
+    except (DjangoValidationError, TypeError, ValueError):
+        return None
+
+
+def fold_branch(model_cls: types.ModelClass, branch: Branch) -> typing.Optional[Branch]:
+    """
+    Return `branch` with the `exact`/`in` lookups on each column folded into
+    one, or `None` if they contradict each other (or the branch's exclude),
+    so the branch matches nothing.
+
+    """
+    filters, exclude = branch
+    allowed: typing.Dict[types.ModelField, typing.FrozenSet] = {}
+    field_keys: typing.Dict[types.ModelField, typing.List[str]] = {}
+    for key, value in filters.items():
+        foldable = _foldable_lookup(model_cls, key, value)
+        if foldable is None:
+            continue
+        field, values = foldable
+        allowed[field] = allowed[field] & values if field in allowed else values
+        field_keys.setdefault(field, []).append(key)
+    if any(not values for values in allowed.values()):
+        return None
+    filters = dict(filters)
+    for field, keys in field_keys.items():
+        if len(keys) < 2:
+            continue
+        for key in keys:
+            del filters[key]
+        values = sorted(allowed[field], key=str)
+        if len(values) == 1:
+            filters[field.name] = values[0]
+        else:
+            filters[field.name + LOOKUP_SEP + 'in'] = values
+    if len(exclude) == 1:
+        # The only exclude lookup is either implied by the filters, or ruled out by them.
+        (key, value), = exclude.items()
+        foldable = _foldable_lookup(model_cls, key, value)
+        if foldable is not None and foldable[0] in allowed:
+            field, excluded = foldable
+            if allowed[field] <= excluded:
+                return None
+            if not allowed[field] & excluded:
+                exclude = {}
+    return filters, exclude
+
+
+def normalize_branches(model_cls: types.ModelClass, branches: typing.List[Branch]) -> typing.List[Branch]:
+    """
+    Return the normal form of the OR of `branches`: contradictory branches
+    dropped, redundant lookups folded, duplicate branches removed, and
+    branches implied by (stricter than) another branch removed. Branches are
+    ordered by their lookup keys, so equivalent queries share a shape.
+
+    """
+    if not branches:
+        return [({}, {})]
+    folded = [branch for branch in (fold_branch(model_cls, branch) for branch in branches) if branch is not None]
+    if not folded:
+        return [EMPTY_BRANCH]
+    unique = []
+    seen = set()
+    for branch in folded:
+        if _branch_key(branch) not in seen:
+            seen.add(_branch_key(branch))
+            unique.append(branch)
+    canonical = [({key: _canonical(value) for key, value in filters.items()}, _canonical(exclude))
+                 for filters, exclude in unique]
+
+    def implies(i: int, j: int) -> bool:
+        # Whether branch `i` only matches rows that branch `j` matches.
+        (filters_i, exclude_i), (filters_j, exclude_j) = canonical[i], canonical[j]
+        return exclude_i == exclude_j and all(filters_i.get(key) == value for key, value in filters_j.items())
+
+    kept = [branch for i, branch in enumerate(unique)
+            if not any(i != j and implies(i, j) for j in range(len(unique)))]
+    return sorted(kept, key=_branch_shape)
+
+
+# =================================
+# Union Rewriting
+# ---------------------------------
+
+UNION_VERDICT_CACHE = LRUCache(maxsize=config.QUERY_PLAN_CACHE_SIZE)
+
+
+def clear_union_verdict_cache():
+    UNION_VERDICT_CACHE.clear()
+
+
+def _branches_indexed(plan: QueryPlan) -> bool:
+    branch_keys = plan.root.branch_keys()
+    return len(branch_keys) > 1 and all(
+        any(lookup_index_violation(plan.model_cls, key) is None for key in filter_keys)
+        for filter_keys, _ in branch_keys
+    )
+
+
+def unions_branches(plan: QueryPlan) -> bool:
+    """
+    Whether queries of `plan` are applied as a `UNION` of their branches:
+    if they OR several branches, each of which filters on an index. Verdicts
+    are cached per model and query shape.
+
+    """
+    if not config.UNION_OR_QUERIES:
+        return False
+    return UNION_VERDICT_CACHE.get_or_set((plan.model_cls, plan.shape), lambda: _branches_indexed(plan))
+
+
+def apply_query_plan(queryset: models.QuerySet, plan: QueryPlan, values: typing.Iterable) -> models.QuerySet:
+    """
+    Apply `plan`, bound to `values`, to `queryset`. An OR of index-backed
+    branches is applied as `pk IN (<branch> UNION ALL <branch> ...)`, so each
+    branch is searched with its own index - a single OR-ed predicate (across
+    joins in particular) often makes the database scan the table instead.
+    The result is a plain filtered queryset, which can still be ordered,
+    paginated, aggregated, updated or deleted.
+
+    """
+    if not unions_branches(plan):
+        return plan.apply(queryset, values)
+    manager = queryset.model._base_manager
+    branch_querysets = [manager.filter(q).order_by().values('pk') for q in plan.branch_qs(values)]
+    return queryset.filter(pk__in=branch_querysets[0].union(*branch_querysets[1:], all=True))
@@ -0,0 +1,364 @@
+import typing
+import operator
+from functools import reduce
+
+from django.db import models
+from django.db.models.constants import LOOKUP_SEP
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.utils.lru_cache import LRUCache
+
+
+# =================================
+# Query Shape
+# ---------------------------------
+
+# The shape of a `ModelTypeQuery` - its lookup keys, without their values:
+#
+#   `(sorted filter keys, sorted exclude keys, (child shape, ...))`
+#
+# Queries of the same shape differ only in the values bound to their lookups.
+QueryShape = typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...], tuple]
+
+
+# =================================
+# Lookup Validation
+# ---------------------------------
+
+def _invalid_lookup(lookup_path: str, reason: str):
+    return ValidationError({'query': [f"Invalid lookup `{lookup_path}`: {reason}"]})
+
+
+def split_lookup_path(model_cls: types.ModelClass,
+                      lookup_path: str) -> typing.Tuple[types.ModelField, typing.List[str]]:
+    """
+    Split `lookup_path` - e.g. `parent__name__icontains` - into the last
+    (related) field of its path and the transform/lookup names following
+    it, e.g. `(<CharField: name>, ['icontains'])`.
+
+    Raises a `ValidationError` if the path does not start with a field of
+    `model_cls`.
+
+    """
+    parts = lookup_path.split(LOOKUP_SEP)
+    opts = model_cls._meta
+    field = None
+    i = 0
+    while i < len(parts):
+        if field is not None:
+            if not field.is_relation or field.related_model is None:
+                break
+            opts = field.related_model._meta
+        name = parts[i]
+        try:
+            next_field = opts.pk if name == 'pk' else opts.get_field(name)
+        except FieldDoesNotExist:
+            if field is None:
+                raise _invalid_lookup(lookup_path, f"{opts.object_name} has no field named '{name}'.")
+            break
+        field = next_field
+        i += 1
+    return field, parts[i:]
+
+
+def lookup_path_models(model_cls: types.ModelClass, lookup_path: str) -> typing.List[types.ModelClass]:
+    """
+    Return the models whose tables `lookup_path` reads: `model_cls`, followed
+    by the related model of each relation the path traverses.
+
+    """
+    model_classes = [model_cls]
+    opts = model_cls._meta
+    for name in lookup_path.split(LOOKUP_SEP):
+        try:
+            field = opts.pk if name == 'pk' else opts.get_field(name)
+        except FieldDoesNotExist:
+            break
+        if not field.is_relation or field.related_model is None:
+            break
+        model_classes.append(field.related_model)
+        opts = field.related_model._meta
+    return model_classes
+
+
+def validate_lookup_path(model_cls: types.ModelClass, lookup_path: str) -> types.ModelField:
+    """
+    Validate that `lookup_path` is a valid filter keyword argument for
+    `model_cls`: a path of (related) field names, optionally followed by
+    transforms and a lookup. Return the last field of the path.
+
+    Raises a `ValidationError` if it is not.
+
+    """
+    field, lookup_parts = split_lookup_path(model_cls, lookup_path)
+    output_field = field
+    for j, name in enumerate(lookup_parts):
+        get_transform = getattr(output_field, 'get_transform', None)
+        transform = get_transform(name) if get_transform is not None else None
+        if j == len(lookup_parts) - 1:
+            if transform is None and output_field.get_lookup(name) is None:
+                raise _invalid_lookup(lookup_path, f"unsupported lookup '{name}' for {type(output_field).__name__}.")
+        else:
+            if transform is None:
+                raise _invalid_lookup(lookup_path, f"unsupported transform '{name}' for "
+                                                   f"{type(output_field).__name__}.")
+            transform_output_field = getattr(transform, 'output_field', None)
+            if isinstance(transform_output_field, models.Field):
+                output_field = transform_output_field
+    return field
+
+
+# =================================
+# Multi-valued Relation Lookups
+# ---------------------------------
+
+class RelationExists(typing.NamedTuple):
+
+    """
+    A lookup across a multi-valued relation - a reverse foreign key or a
+    many-to-many relation - compiled into an `EXISTS` subquery on the
+    related model, rather than a join that repeats the rows it matches.
+
+    """
+
+    # The lookup path of the relation, e.g. `parent__children`.
+    relation_path: str
+    related_model: types.ModelClass
+    # The related model's lookup of the outer row, and the outer row's field it matches.
+    remote_name: str
+    outer_ref: str
+    # The lookup on the related model, e.g. `name__icontains`. `None` for an
+    # `isnull` lookup of the relation itself.
+    related_lookup: typing.Optional[str]
+
+    def exists(self, lookups: typing.List[typing.Tuple[str, typing.Any]]) -> models.Exists:
+        """
+        Return whether a single related object matches every one of `lookups`,
+        as Django does for lookups across a relation in one `filter()` call.
+
+        """
+        queryset = self.related_model._base_manager.filter(**{self.remote_name: models.OuterRef(self.outer_ref)})
+        return models.Exists(queryset.filter(*[models.Q((lookup, value)) for lookup, value in lookups]))
+
+    def q(self, value) -> models.Q:
+        """
+        Return the `Q` of this lookup alone, bound to `value`.
+
+        """
+        if self.related_lookup is None:
+            exists = self.exists([])
+            return models.Q(~exists if value else exists)
+        return models.Q(self.exists([(self.related_lookup, value)]))
+
+
+def _has_field(model_cls: types.ModelClass, name: str) -> bool:
+    try:
+        model_cls._meta.get_field(name)
+    except FieldDoesNotExist:
+        return False
+    return True
+
+
+def relation_exists(model_cls: types.ModelClass, lookup_path: str) -> typing.Optional[RelationExists]:
+    """
+    Return the `EXISTS` form of `lookup_path` - a (valid) lookup of
+    `model_cls` - if it traverses a reverse foreign key or a many-to-many
+    relation, or `None` if it does not.
+
+    """
+    parts = lookup_path.split(LOOKUP_SEP)
+    opts = model_cls._meta
+    for i, name in enumerate(parts):
+        try:
+            field = opts.pk if name == 'pk' else opts.get_field(name)
+        except FieldDoesNotExist:
+            return None
+        if not field.is_relation or field.related_model is None:
+            return None
+        if types.field_is_multi_valued_relation(field):
+            break
+        opts = field.related_model._meta
+    else:
+        return None
+    if isinstance(field, models.ManyToManyField):
+        remote_name, outer_name = field.related_query_name(), 'pk'
+    elif isinstance(field, models.ManyToManyRel):
+        remote_name, outer_name = field.field.name, 'pk'
+    elif isinstance(field, models.ManyToOneRel):
+        remote_name, outer_name = field.field.name, field.field.target_field.name
+    else:
+        # E.g. generic relations, which are left as joins.
+        return None
+    prefix, rest = parts[:i], parts[i + 1:]
+    if rest == ['isnull']:
+        related_lookup = None
+    elif rest and (rest[0] == 'pk' or _has_field(field.related_model, rest[0])):
+        related_lookup = LOOKUP_SEP.join(rest)
+    else:
+        # A lookup of the related object itself, e.g. `children__in`.
+        related_lookup = LOOKUP_SEP.join(['pk'] + rest)
+    return RelationExists(relation_path=LOOKUP_SEP.join(parts[:i + 1]), related_model=field.related_model,
+                          remote_name=remote_name, outer_ref=LOOKUP_SEP.join(prefix + [outer_name]),
+                          related_lookup=related_lookup)
+
+
+# =================================
+# Query Plan
+# ---------------------------------
+
+class QueryPlanNode(object):
+
+    """
+    A compiled node of a `ModelTypeQuery` tree. Values are bound to its
+    lookup keys in shape order: filters, then excludes, then its children.
+
+    """
+
+    def __init__(self, filter_keys: typing.Tuple[str, ...], exclude_keys: typing.Tuple[str, ...],
+                 children: typing.List['QueryPlanNode'], relation_exists: typing.Dict[str, RelationExists] = None):
+        self.filter_keys = filter_keys
+        self.exclude_keys = exclude_keys
+        self.children = children
+        # The `EXISTS` forms of the node's lookups across multi-valued relations.
+        self.relation_exists = relation_exists or {}
+
+    def _lookups_q(self, keys: typing.Tuple[str, ...], values: typing.Iterator) -> models.Q:
+        """
+        Return the `Q` AND-ing the lookups `keys`. Lookups across the same
+        multi-valued relation share an `EXISTS` subquery, so a single related
+        object must match all of them.
+
+        """
+        lookups = []
+        relation_lookups: typing.Dict[str, typing.Tuple[RelationExists, list]] = {}
+        qs = []
+        for key in keys:
+            value = next(values)
+            exists = self.relation_exists.get(key)
+            if exists is None:
+                lookups.append((key, value))
+            elif exists.related_lookup is None:
+                qs.append(exists.q(value))
+            else:
+                relation_lookups.setdefault(exists.relation_path, (exists, []))[1].append((exists.related_lookup, value))
+        qs += [models.Q(exists.exists(related_lookups)) for exists, related_lookups in relation_lookups.values()]
+        return reduce(operator.and_, qs, models.Q(*lookups))
+
+    def _own_q(self, values: typing.Iterator) -> typing.Tuple[models.Q, typing.Optional[models.Q]]:
+        filter_q = self._lookups_q(self.filter_keys, values)
+        exclude_q = None
+        if self.exclude_keys:
+            exclude_q = self._lookups_q(self.exclude_keys, values)
+        return filter_q, exclude_q
+
+    def branch_keys(self) -> typing.List[typing.Tuple[typing.Tuple[str, ...], typing.Tuple[str, ...]]]:
+        """
+        Return the `(filter keys, exclude keys)` of each branch OR-ed by this
+        node: its own lookups (if any), then those of its children's branches.
+
+        """
+        branches = [(self.filter_keys, self.exclude_keys)] if self.filter_keys or self.exclude_keys else []
+        for child in self.children:
+            branches += child.branch_keys()
+        return branches
+
+    def branch_qs(self, values: typing.Iterator) -> typing.List[models.Q]:
+        """
+        Return the `Q` of each branch OR-ed by this node, in `branch_keys`
+        order. Branches without lookups, which `Q` drops when OR-ing, are
+        left out.
+
+        """
+        filter_q, exclude_q = self._own_q(values)
+        q = filter_q if exclude_q is None else filter_q & ~exclude_q
+        qs = [q] if self.filter_keys or self.exclude_keys else []
+        for child in self.children:
+            qs += child.branch_qs(values)
+        return qs
+
+    def q(self, values: typing.Iterator) -> models.Q:
+        """
+        Return the `Q` of this node, OR-ed with those of its children.
+
+        """
+        filter_q, exclude_q = self._own_q(values)
+        q = filter_q if exclude_q is None else filter_q & ~exclude_q
+        if not self.children:
+            return q
+        return reduce(operator.or_, [q] + [child.q(values) for child in self.children])
+
+    def apply(self, queryset: models.QuerySet, values: typing.Iterator) -> models.QuerySet:
+        if self.children:
+            return queryset.filter(self.q(values))
+        filter_q, exclude_q = self._own_q(values)
+        queryset = queryset.filter(filter_q)
+        if exclude_q is not None:
+            queryset = queryset.exclude(exclude_q)
+        return queryset
+
+
+class QueryPlan(object):
+
+    """
+    A `ModelTypeQuery` shape compiled against a model. Compiling validates
+    every lookup of the shape once; applying the plan only binds a query's
+    values to its lookups.
+
+    """
+
+    def __init__(self, model_cls: types.ModelClass, shape: QueryShape):
+        self.model_cls = model_cls
+        self.shape = shape
+        # Every distinct lookup path of the plan, in shape order.
+        self.lookup_paths: typing.List[str] = []
+        self.root = self._compile(shape)
+
+    def _compile(self, shape: QueryShape) -> QueryPlanNode:
+        filter_keys, exclude_keys, child_shapes = shape
+        exists_lookups = {}
+        for lookup_path in filter_keys + exclude_keys:
+            validate_lookup_path(self.model_cls, lookup_path)
+            if lookup_path not in self.lookup_paths:
+                self.lookup_paths.append(lookup_path)
+            exists = relation_exists(self.model_cls, lookup_path)
+            if exists is not None:
+                exists_lookups[lookup_path] = exists
+        return QueryPlanNode(filter_keys=filter_keys, exclude_keys=exclude_keys,
+                             children=[self._compile(child_shape) for child_shape in child_shapes],
+                             relation_exists=exists_lookups)
+
+    def q(self, values: typing.Iterable) -> models.Q:
+        return self.root.q(iter(values))
+
+    def branch_qs(self, values: typing.Iterable) -> typing.List[models.Q]:
+        return self.root.branch_qs(iter(values))
+
+    def apply(self, queryset: models.QuerySet, values: typing.Iterable) -> models.QuerySet:
+        return self.root.apply(queryset, iter(values))
+
+
+# =================================
+# Query Plan Cache
+# ---------------------------------
+
+QUERY_PLAN_CACHE = LRUCache(maxsize=config.QUERY_PLAN_CACHE_SIZE)
+
+
+def get_query_plan(model_cls: types.ModelClass, shape: QueryShape) -> QueryPlan:
+    """
+    Return the compiled plan for queries of `shape` on `model_cls`, compiling
+    and caching it on first use. Invalid shapes are not cached.
+
+    """
+    return QUERY_PLAN_CACHE.get_or_set((model_cls, shape), lambda: QueryPlan(model_cls=model_cls, shape=shape))
+
+
+def query_plan_cache_info() -> dict:
+    return QUERY_PLAN_CACHE.info()
+
+
+def clear_query_plan_cache():
+    QUERY_PLAN_CACHE.clear()
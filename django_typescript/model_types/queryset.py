@@ -1,14 +1,26 @@
 import typing
 import json
-from functools import reduce
-import operator
+import math
 
 from django.db import models
+from django.db.models import prefetch_related_objects
+from django.core.exceptions import FieldDoesNotExist
 from django.core.paginator import Paginator
 from rest_framework.request import Request
+from rest_framework.exceptions import ValidationError
 
+from django_typescript import config
 from django_typescript.core import types
+from django_typescript.core.renderers import NDJSONRenderer
 from django_typescript.core.utils.subset_serializer import subset_serializer
+from django_typescript.model_types.cursor import Cursor, KeysetPaginator
+from django_typescript.model_types.count import CountStrategy, ExactCount, resolve_count_strategy
+from django_typescript.model_types.values import CoercionTable, ValuesSerializer
+from django_typescript.model_types.query_plan import QueryShape, QueryPlan, get_query_plan, lookup_path_models
+from django_typescript.model_types.index_policy import IndexPolicy
+from django_typescript.model_types.projection import project_queryset
+from django_typescript.model_types.relation_graph import RelationGraph, ResolvedPrefetch
+from django_typescript.model_types.query_normalizer import query_branches, normalize_branches, apply_query_plan
 
 
 # =================================
@@ -55,28 +67,82 @@ class ModelTypeQuery(object):
     def n_children(self):
         return len(self.children)
 
+    @classmethod
+    def from_data(cls, data) -> 'ModelTypeQuery':
+        """
+        Return the query for the (JSON decoded) `data` sent by a client,
+        raising a `ValidationError` if it is not a well formed query.
+
+        """
+        if not isinstance(data, dict):
+            raise ValidationError({'query': ['Expected an object.']})
+        if not isinstance(data.get('filters', {}), dict) or not isinstance(data.get('exclude', {}), dict):
+            raise ValidationError({'query': ['`filters` and `exclude` must be objects.']})
+        if not isinstance(data.get('or_', []), list):
+            raise ValidationError({'query': ['`or_` must be a list.']})
+        return cls(filters=data.get('filters', {}), exclude=data.get('exclude', {}),
+                   or_=[cls.from_data(child_data) for child_data in data.get('or_', [])])
+
+    @classmethod
+    def from_branches(cls, branches: typing.List[typing.Tuple[dict, dict]]) -> 'ModelTypeQuery':
+        """
+        Return the query OR-ing `branches`, `(filters, exclude)` pairs, with
+        the first branch at its root and the others as its (flat) children.
+
+        """
+        (filters, exclude), *others = branches
+        return cls(filters=filters, exclude=exclude,
+                   or_=[cls(filters=filters, exclude=exclude, or_=[]) for filters, exclude in others])
+
+    def normalized(self, model_cls: types.ModelClass) -> 'ModelTypeQuery':
+        """
+        Return an equivalent query in normal form (see `normalize_branches`):
+        nested `or_` trees flattened, and contradictory branches, redundant
+        lookups and duplicate or implied branches folded away.
+
+        """
+        return self.from_branches(normalize_branches(model_cls, query_branches(self)))
+
     def _make_children(self):
         for data in self.or_:
-            self.children.append(ModelTypeQuery(**data))
+            if isinstance(data, ModelTypeQuery):
+                self.children.append(data)
+            else:
+                self.children.append(ModelTypeQuery(**data))
 
-    def _q(self) -> models.Q:
-        filter_q = models.Q(**self.filters)
-        if not self.exclude:
-            return filter_q
-        return filter_q & ~models.Q(**self.exclude)
+    def shape(self) -> QueryShape:
+        """
+        Return the shape of this query: its lookup keys without their values.
+
+        """
+        return (tuple(sorted(self.filters)), tuple(sorted(self.exclude or {})),
+                tuple(child.shape() for child in self.children))
+
+    def bind_values(self) -> list:
+        """
+        Return the values of this query's lookups, in shape order.
+
+        """
+        values = [self.filters[key] for key in sorted(self.filters)]
+        if self.exclude:
+            values += [self.exclude[key] for key in sorted(self.exclude)]
+        for child in self.children:
+            values += child.bind_values()
+        return values
+
+    def plan(self, model_cls: types.ModelClass) -> QueryPlan:
+        return get_query_plan(model_cls=model_cls, shape=self.shape())
 
     def apply_to_queryset(self, queryset: models.QuerySet, use_q=False):
-        if self.n_children == 0:
-            if not use_q:
-                queryset = queryset.filter(**self.filters)
-                if self.exclude:
-                    queryset = queryset.exclude(**self.exclude)
-                return queryset
-            return self._q()
+        """
+        Apply this query to `queryset`, using the cached plan of its shape.
+        If `use_q`, return the query's `Q` instead.
+
+        """
+        plan = self.plan(model_cls=queryset.model)
         if use_q:
-            return self._q()
-        queries = [self._q()] + [c.apply_to_queryset(queryset=queryset, use_q=True) for c in self.children]
-        return queryset.filter(reduce(operator.or_, queries))
+            return plan.q(self.bind_values())
+        return apply_query_plan(queryset, plan, self.bind_values())
 
 
 # =================================
@@ -85,6 +151,16 @@ class ModelTypeQuery(object):
 
 class PrefetchTreeSelectRelated(object):
 
+    """
+    Resolves a prefetch tree into the `select_related` paths and the
+    `prefetch_related` lookups needed to fetch it. Single-valued relations
+    (forward foreign keys and one-to-ones) are joined with `select_related`,
+    while multi-valued relations (reverse foreign keys and many-to-manys) are
+    fetched with a `Prefetch`, whose queryset in turn joins/prefetches the
+    subtree nested under it.
+
+    """
+
     def __init__(self, prefetch_tree: types.PrefetchTree, base_model: types.ModelClass, key_prefix = None):
         self.prefetch_tree = prefetch_tree
         self.base_model = base_model
@@ -95,27 +171,46 @@ class PrefetchTreeSelectRelated(object):
             return self.key_prefix + "__" + key
         return key
 
-    def select_related(self) -> typing.Union[typing.List[str], None]:
-        selected_related = []
+    def _get_field(self, field_name: str) -> typing.Optional[types.ModelField]:
+        # Names that are not model fields are 'property fields', which need
+        # no related fetching.
+        try:
+            return self.base_model._meta.get_field(field_name)
+        except FieldDoesNotExist:
+            return None
+
+    def _subtrees(self) -> typing.List[typing.Tuple[types.ModelField, typing.Optional[types.PrefetchTree]]]:
+        """
+        Return the `(model field, nested prefetch tree)` pairs at the root of this
+        prefetch tree. Leaf fields have a nested prefetch tree of `None`.
+
+        """
         if isinstance(self.prefetch_tree, str):
-            try:
-                self.base_model._meta.get_field(self.prefetch_tree)
-                selected_related.append(self._select_related_key(self.prefetch_tree))
-            except models.FieldDoesNotExist:
-                pass
+            items = [(self.prefetch_tree, None)]
         elif isinstance(self.prefetch_tree, list):
-            for prefetch_field in self.prefetch_tree:
-                try:
-                    self.base_model._meta.get_field(prefetch_field)
-                    selected_related.append(self._select_related_key(prefetch_field))
-                except models.FieldDoesNotExist:
-                    pass
+            items = [(prefetch_field, None) for prefetch_field in self.prefetch_tree]
         else:
-            for k, v in self.prefetch_tree.items():
-                model_field = self.base_model._meta.get_field(k)
-                prefetch_tree_select_rel = PrefetchTreeSelectRelated(prefetch_tree=v,
+            items = list(self.prefetch_tree.items())
+        subtrees = []
+        for field_name, subtree in items:
+            model_field = self._get_field(field_name)
+            if model_field is None:
+                if subtree is not None:
+                    raise FieldDoesNotExist(f"{self.base_model.__name__} has no field named '{field_name}'")
+                continue
+            subtrees.append((model_field, subtree))
+        return subtrees
+
+    def select_related(self) -> typing.Union[typing.List[str], None]:
+        selected_related = []
+        for model_field, subtree in self._subtrees():
+            if types.field_is_multi_valued_relation(model_field):
+                continue
+            selected_related.append(self._select_related_key(model_field.name))
+            if subtree is not None:
+                prefetch_tree_select_rel = PrefetchTreeSelectRelated(prefetch_tree=subtree,
                                                                      base_model=model_field.related_model,
-                                                                     key_prefix=self._select_related_key(key=k))
+                                                                     key_prefix=self._select_related_key(key=model_field.name))
                 nested_related = prefetch_tree_select_rel.select_related()
                 if nested_related:
                     selected_related += nested_related
@@ -123,6 +218,47 @@ class PrefetchTreeSelectRelated(object):
             return selected_related
         return None
 
+    def related_models(self) -> typing.List[types.ModelClass]:
+        """
+        Return the related models fetched for this prefetch tree, at any depth.
+
+        """
+        related_models = []
+        for model_field, subtree in self._subtrees():
+            related_models.append(model_field.related_model)
+            if subtree is not None:
+                nested = PrefetchTreeSelectRelated(prefetch_tree=subtree, base_model=model_field.related_model)
+                related_models += nested.related_models()
+        return related_models
+
+    def prefetch_related(self) -> typing.Union[typing.List[typing.Union[str, models.Prefetch]], None]:
+        prefetch_related = []
+        for model_field, subtree in self._subtrees():
+            if types.field_is_multi_valued_relation(model_field):
+                lookup = self._select_related_key(types.relation_accessor_name(model_field))
+                if subtree is None:
+                    prefetch_related.append(lookup)
+                    continue
+                nested = PrefetchTreeSelectRelated(prefetch_tree=subtree, base_model=model_field.related_model)
+                queryset = model_field.related_model._default_manager.all()
+                nested_select_related = nested.select_related()
+                if nested_select_related:
+                    queryset = queryset.select_related(*nested_select_related)
+                nested_prefetch_related = nested.prefetch_related()
+                if nested_prefetch_related:
+                    queryset = queryset.prefetch_related(*nested_prefetch_related)
+                prefetch_related.append(models.Prefetch(lookup, queryset=queryset))
+            elif subtree is not None:
+                prefetch_tree_select_rel = PrefetchTreeSelectRelated(prefetch_tree=subtree,
+                                                                     base_model=model_field.related_model,
+                                                                     key_prefix=self._select_related_key(key=model_field.name))
+                nested_prefetch_related = prefetch_tree_select_rel.prefetch_related()
+                if nested_prefetch_related:
+                    prefetch_related += nested_prefetch_related
+        if len(prefetch_related) > 0:
+            return prefetch_related
+        return None
+
 
 # =================================
 # Model Type Queryset Builder
@@ -141,18 +277,25 @@ class ModelTypeQuerysetBuilder(object):
     DISTINCT_KEY = 'distinct'
 
     def __init__(self,  model_cls: types.ModelClass, query: ModelTypeQuery=None, order_by: typing.List[str]=None, distinct: typing.List[str]=None,
-                 prefetch_trees: typing.List[types.PrefetchTree]= None):
+                 prefetch_trees: typing.List[types.PrefetchTree]= None, index_policy: IndexPolicy = None,
+                 relation_graph: RelationGraph = None):
         self.model_cls = model_cls
         self.query = query
         self.order_by = order_by
         self.distinct = distinct
         self.prefetch_trees = prefetch_trees
+        self.index_policy = index_policy
+        self.relation_graph = relation_graph
+        # Index violations flagged by the `index_policy` when building the queryset.
+        self.index_violations: typing.List[str] = []
 
     @classmethod
-    def for_request(cls, request: Request, model_cls: types.ModelClass) -> 'ModelTypeQuerysetBuilder':
-        kwargs = {'model_cls': model_cls}
+    def for_request(cls, request: Request, model_cls: types.ModelClass, index_policy: IndexPolicy = None,
+                    relation_graph: RelationGraph = None) -> 'ModelTypeQuerysetBuilder':
+        kwargs = {'model_cls': model_cls, 'index_policy': index_policy, 'relation_graph': relation_graph}
         if cls.QUERY_KEY in request.query_params:
-            kwargs['query'] = ModelTypeQuery(**json.loads(request.query_params[cls.QUERY_KEY]))
+            query = ModelTypeQuery.from_data(json.loads(request.query_params[cls.QUERY_KEY]))
+            kwargs['query'] = query.normalized(model_cls=model_cls)
         if cls.ORDER_BY_KEY in request.query_params:
             kwargs['order_by'] = json.loads(request.query_params[cls.ORDER_BY_KEY])
         if cls.PREFETCH_KEY in request.query_params:
@@ -161,6 +304,33 @@ class ModelTypeQuerysetBuilder(object):
             kwargs['distinct'] = json.loads(request.query_params[cls.DISTINCT_KEY])
         return cls(**kwargs)
 
+    @classmethod
+    def for_query_request(cls, request: Request, model_cls: types.ModelClass,
+                          index_policy: IndexPolicy = None) -> 'ModelTypeQuerysetBuilder':
+        """
+        Return a builder for the query of `request` alone (ignoring ordering
+        and prefetches), for writes to the objects it matches. The query is
+        required, so that writing to every object takes an explicit empty
+        query.
+
+        """
+        if cls.QUERY_KEY not in request.query_params:
+            raise ValidationError({cls.QUERY_KEY: ['A query is required.']})
+        query = ModelTypeQuery.from_data(json.loads(request.query_params[cls.QUERY_KEY]))
+        return cls(model_cls=model_cls, query=query.normalized(model_cls=model_cls), index_policy=index_policy)
+
+    def resolved_prefetch(self) -> typing.Optional[ResolvedPrefetch]:
+        """
+        Return the prefetch trees resolved against the `relation_graph`, or
+        `None` if there are none, or no relation graph (in which case they are
+        resolved by `PrefetchTreeSelectRelated`). Raises a `ValidationError`
+        for invalid prefetch trees.
+
+        """
+        if not self.prefetch_trees or self.relation_graph is None:
+            return None
+        return self.relation_graph.resolve(model_cls=self.model_cls, prefetch_trees=self.prefetch_trees)
+
     def _flatten_prefetch_tree(self, prefetch_tree: types.PrefetchTree):
         """
         Return a prefetch tree in 'flattened' form, e.g:
@@ -172,22 +342,69 @@ class ModelTypeQuerysetBuilder(object):
         prefetch_tree_select_rel = PrefetchTreeSelectRelated(base_model=self.model_cls, prefetch_tree=prefetch_tree)
         return prefetch_tree_select_rel.select_related()
 
+    def _prefetch_related(self, prefetch_tree: types.PrefetchTree):
+        prefetch_tree_select_rel = PrefetchTreeSelectRelated(base_model=self.model_cls, prefetch_tree=prefetch_tree)
+        return prefetch_tree_select_rel.prefetch_related()
+
+    def touched_models(self) -> typing.Set[types.ModelClass]:
+        """
+        Return the models whose tables the built queryset reads: the base
+        model, models joined by filters and orderings, prefetched models, and
+        the multi-table inheritance parents of all of them.
+
+        """
+        touched = {self.model_cls}
+        paths = []
+        if self.query:
+            paths += self.query.plan(model_cls=self.model_cls).lookup_paths
+        paths += [field_path.lstrip('-+') for field_path in (self.order_by or []) + (self.distinct or [])
+                  if field_path != '?']
+        for path in paths:
+            touched.update(lookup_path_models(self.model_cls, path))
+        resolved_prefetch = self.resolved_prefetch()
+        if resolved_prefetch is not None:
+            touched.update(resolved_prefetch.related_models)
+        else:
+            for prefetch_tree in self.prefetch_trees or []:
+                prefetch_tree_select_rel = PrefetchTreeSelectRelated(base_model=self.model_cls,
+                                                                     prefetch_tree=prefetch_tree)
+                touched.update(prefetch_tree_select_rel.related_models())
+        for model_cls in list(touched):
+            touched.update(model_cls._meta.get_parent_list())
+        return touched
+
     def build_queryset(self, queryset: models.QuerySet) -> models.QuerySet:
+        resolved_prefetch = self.resolved_prefetch()
+        plan = None
         if self.query:
-            queryset = self.query.apply_to_queryset(queryset)
+            plan = self.query.plan(model_cls=self.model_cls)
+            queryset = apply_query_plan(queryset, plan, self.query.bind_values())
         if self.order_by:
             queryset = queryset.order_by(*self.order_by)
+        if self.index_policy is not None:
+            self.index_violations = self.index_policy.enforce(model_cls=self.model_cls, plan=plan,
+                                                              order_by=self.order_by, queryset=queryset)
         if self.distinct:
             queryset = queryset.distinct(*self.distinct)
-        if self.prefetch_trees:
+        if resolved_prefetch is not None:
+            if resolved_prefetch.select_related:
+                queryset = queryset.select_related(*resolved_prefetch.select_related)
+            if resolved_prefetch.prefetch_lookups:
+                queryset = queryset.prefetch_related(*resolved_prefetch.prefetch_related())
+        elif self.prefetch_trees:
             select_related = []
+            prefetch_related = []
             for prefetch_tree in self.prefetch_trees:
                 tree_select_related = self._flatten_prefetch_tree(prefetch_tree=prefetch_tree)
                 if tree_select_related is not None:
                     select_related += tree_select_related
-            queryset = queryset.select_related(
-                *[sr for sr in select_related if sr is not None]
-            )
+                tree_prefetch_related = self._prefetch_related(prefetch_tree=prefetch_tree)
+                if tree_prefetch_related is not None:
+                    prefetch_related += tree_prefetch_related
+            if select_related:
+                queryset = queryset.select_related(*select_related)
+            if prefetch_related:
+                queryset = queryset.prefetch_related(*prefetch_related)
         return queryset
 
 
@@ -203,26 +420,77 @@ class ModelTypeQuerysetPayloadBuilder(object):
     VALUES_KEY = 'values'
     EXISTS_KEY = 'exists'
     COUNT_KEY = 'count'
+    CURSOR_KEY = 'cursor'
+    COUNT_STRATEGY_KEY = 'count_strategy'
+    STREAM_KEY = 'stream'
 
     def __init__(self, queryset: models.QuerySet, values: typing.List[str] = None, page_num: int = None,
-                 page_size: int = None, exists: bool = False, many=True, count: bool = False):
+                 page_size: int = None, exists: bool = False, many=True, count: bool = False, cursor: str = None,
+                 count_strategy: CountStrategy = None, values_coercion_table: CoercionTable = None,
+                 stream: bool = False):
         self.queryset = queryset
         self.values = values
         self.page_num = page_num
-        self.page_size = page_size
+        self.page_size = self._validate_page_size(page_size) if page_size is not None else None
         self.exists = exists
         self.count = count
         self.many = many
+        self.cursor = cursor
+        self.stream = stream
+        self.count_strategy = count_strategy if count_strategy is not None else ExactCount()
+        self.values_serializer: typing.Optional[ValuesSerializer] = None
+        if values and many and values_coercion_table is not None:
+            self.values_serializer = ValuesSerializer.for_fields(field_names=values,
+                                                                 coercion_table=values_coercion_table)
+
+    @classmethod
+    def _validate_page_size(cls, page_size) -> int:
+        try:
+            page_size = int(page_size)
+        except (TypeError, ValueError):
+            page_size = 0
+        if page_size < 1:
+            raise ValidationError({cls.PAGE_SIZE_KEY: ['Expected a positive integer.']})
+        return page_size
 
     @property
     def is_paginated(self):
         return self.page_num is not None
 
+    @property
+    def is_cursor_paginated(self):
+        return self.cursor is not None
+
+    @property
+    def is_streamed(self):
+        """
+        Whether the payload is streamed as NDJSON. Only plain list payloads
+        are streamed; paginated, existence and count payloads are small, and
+        are returned as usual.
+
+        """
+        return (self.stream and self.many and not self.is_paginated and not self.is_cursor_paginated
+                and not self.exists and not self.count)
+
     @classmethod
-    def for_request(cls, request: Request, queryset: models.QuerySet, many=True) -> 'ModelTypeQuerysetPayloadBuilder':
+    def for_request(cls, request: Request, queryset: models.QuerySet, many=True,
+                    count_strategy: CountStrategy = None,
+                    values_coercion_table: CoercionTable = None) -> 'ModelTypeQuerysetPayloadBuilder':
+        """
+        Return a payload builder for `request`. `count_strategy` is the default
+        strategy used to count paginated results, which the request may override.
+        If a `values_coercion_table` is given, `values` rows of the fields it
+        covers are serialized without a DRF serializer. The payload is streamed
+        if requested with `stream=true` or by accepting NDJSON.
+
+        """
         kwargs = {
             'page_num': request.query_params.get(cls.PAGE_NUM_KEY),
-            'page_size': request.query_params.get(cls.PAGE_SIZE_KEY, cls.DEFAULT_PAGE_SIZE)
+            'page_size': request.query_params.get(cls.PAGE_SIZE_KEY, cls.DEFAULT_PAGE_SIZE),
+            'count_strategy': count_strategy,
+            'values_coercion_table': values_coercion_table,
+            'stream': (request.query_params.get(cls.STREAM_KEY) in ('true', '1') or
+                       isinstance(getattr(request, 'accepted_renderer', None), NDJSONRenderer))
         }
         if cls.VALUES_KEY in request.query_params:
             kwargs['values'] = json.loads(request.query_params[cls.VALUES_KEY])
@@ -230,6 +498,13 @@ class ModelTypeQuerysetPayloadBuilder(object):
             kwargs['exists'] = json.loads(request.query_params[cls.EXISTS_KEY])
         if cls.COUNT_KEY in request.query_params:
             kwargs['count'] = json.loads(request.query_params[cls.COUNT_KEY])
+        if cls.CURSOR_KEY in request.query_params:
+            kwargs['cursor'] = request.query_params[cls.CURSOR_KEY]
+        if cls.COUNT_STRATEGY_KEY in request.query_params:
+            try:
+                kwargs['count_strategy'] = resolve_count_strategy(request.query_params[cls.COUNT_STRATEGY_KEY])
+            except ValueError as e:
+                raise ValidationError({cls.COUNT_STRATEGY_KEY: str(e)})
         return cls(queryset=queryset, many=many, **kwargs)
 
     def paginated_payload(self, serializer_cls: types.ModelSerializerClass):
@@ -237,24 +512,160 @@ class ModelTypeQuerysetPayloadBuilder(object):
         queryset = self.queryset
         if self.values:
             queryset = queryset.values(*self.values)
-            serializer_cls = subset_serializer(serializer_cls=serializer_cls, select_fields=self.values)
-        paginator = Paginator(queryset, self.page_size)
-        queryset = paginator.get_page(number=self.page_num)
-        serializer = serializer_cls(queryset, many=self.many)
+        if isinstance(self.count_strategy, ExactCount):
+            paginator = Paginator(queryset, self.page_size)
+            queryset = paginator.get_page(number=self.page_num)
+            return {
+                'num_results': paginator.count,
+                'num_pages': paginator.num_pages,
+                'page': self.page_num,
+                'count_strategy': ExactCount.NAME,
+                'count_exact': True,
+                'data': self._serialize(queryset, serializer_cls=serializer_cls)
+            }
+        return self._counted_paginated_payload(queryset=queryset, serializer_cls=serializer_cls)
+
+    def _counted_paginated_payload(self, queryset: models.QuerySet, serializer_cls: types.ModelSerializerClass):
+        """
+        Return a paginated payload whose total is computed by this builder's
+        (non-exact) count strategy. Unlike the exact path, out of range pages
+        are returned empty rather than clamped to the last page, since the
+        last page may not be known.
+
+        """
+        page_size = self.page_size
+        try:
+            page_num = max(int(self.page_num), 1)
+        except (TypeError, ValueError):
+            page_num = 1
+        offset = (page_num - 1) * page_size
+        count_result = self.count_strategy.count(queryset)
+        data = self._serialize(queryset[offset:offset + page_size], serializer_cls=serializer_cls)
+        num_pages = None
+        if count_result.value is not None:
+            num_pages = max(math.ceil(count_result.value / page_size), 1)
         return {
-            'num_results': paginator.count,
-            'num_pages': paginator.num_pages,
+            'num_results': count_result.value,
+            'num_pages': num_pages,
             'page': self.page_num,
-            'data': serializer.data
+            'count_strategy': count_result.strategy,
+            'count_exact': count_result.exact,
+            'data': data
+        }
+
+    def cursor_paginated_payload(self, serializer_cls: types.ModelSerializerClass):
+        """
+        Return a keyset-paginated payload. An empty `cursor` selects the first
+        page; otherwise it must be a `next`/`prev` cursor from a previous payload.
+
+        """
+        assert self.is_cursor_paginated, 'Payload is not cursor paginated.'
+        cursor = Cursor.decode(self.cursor) if self.cursor else None
+        paginator = KeysetPaginator(queryset=self.queryset, page_size=self.page_size)
+        queryset = paginator.annotated_queryset(cursor=cursor)
+        if self.values:
+            queryset = queryset.values(*self.values, *paginator.key_aliases)
+        rows, next_cursor, prev_cursor = paginator.paginate(rows=list(queryset), cursor=cursor)
+        if self.values:
+            rows = [paginator.strip_key(row) for row in rows]
+        return {
+            'next': next_cursor,
+            'prev': prev_cursor,
+            'data': self._serialize(rows, serializer_cls=serializer_cls)
+        }
+
+    def stream_payload(self, serializer_cls: types.ModelSerializerClass,
+                       chunk_size: int = None) -> typing.Iterator[bytes]:
+        """
+        Yield the payload as NDJSON lines, one per row. Rows are read from the
+        database with a server-side cursor (where supported) and serialized
+        `chunk_size` rows at a time, so at most one chunk is held in memory.
+        Prefetches are made per chunk, since `QuerySet.iterator()` skips them.
+
+        """
+        assert self.is_streamed, 'Payload is not streamed.'
+        chunk_size = chunk_size or config.STREAM_CHUNK_SIZE
+        if self.values and self.values_serializer is None:
+            serializer_cls = subset_serializer(serializer_cls=serializer_cls, select_fields=self.values)
+        self._project(serializer_cls)
+        prefetch_lookups = self.queryset._prefetch_related_lookups
+        queryset = self.queryset.prefetch_related(None)
+        if self.values:
+            queryset = queryset.values(*self.values)
+            prefetch_lookups = ()
+        renderer = NDJSONRenderer()
+        chunk = []
+        for row in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield from self._stream_chunk(chunk, serializer_cls, prefetch_lookups, renderer)
+                chunk = []
+        if chunk:
+            yield from self._stream_chunk(chunk, serializer_cls, prefetch_lookups, renderer)
+
+    def _stream_chunk(self, chunk: list, serializer_cls: types.ModelSerializerClass, prefetch_lookups,
+                      renderer: NDJSONRenderer) -> typing.Iterator[bytes]:
+        if prefetch_lookups:
+            prefetch_related_objects(chunk, *prefetch_lookups)
+        for data in self._serialize(chunk, serializer_cls=serializer_cls):
+            yield renderer.render_line(data)
+
+    def pks_payload(self, serializer_cls: types.ModelSerializerClass, pks: list) -> dict:
+        """
+        Return the payload of the rows with primary keys `pks`, fetched by a
+        single `pk__in` query: the rows in the order of `pks` (without
+        duplicates), and the primary keys of rows that do not exist.
+
+        """
+        if self.values and self.values_serializer is None:
+            serializer_cls = subset_serializer(serializer_cls=serializer_cls, select_fields=self.values)
+        self._project(serializer_cls)
+        pk_name = self.queryset.model._meta.pk.name
+        queryset = self.queryset.filter(pk__in=pks).order_by()
+        if not self.values:
+            rows_by_pk = {row.pk: row for row in queryset}
+        elif pk_name in self.values or 'pk' in self.values:
+            pk_key = pk_name if pk_name in self.values else 'pk'
+            rows_by_pk = {row[pk_key]: row for row in queryset.values(*self.values)}
+        else:
+            rows_by_pk = {}
+            for row in queryset.values(*self.values, pk_name):
+                rows_by_pk[row.pop(pk_name)] = row
+        return {
+            'data': self._serialize([rows_by_pk[pk] for pk in pks if pk in rows_by_pk], serializer_cls=serializer_cls),
+            'missing': [pk for pk in pks if pk not in rows_by_pk]
         }
 
     def exists_payload(self):
         assert self.exists, 'Payload is not existence check.'
         return self.queryset.exists()
 
+    def _serialize(self, rows, serializer_cls: types.ModelSerializerClass):
+        """
+        Serialize `rows`, using the serializer-free fast path for `values`
+        rows when available.
+
+        """
+        if self.values_serializer is not None:
+            return self.values_serializer.serialize(rows)
+        return serializer_cls(rows, many=self.many).data
+
+    def _project(self, serializer_cls: types.ModelSerializerClass):
+        """
+        Restrict the columns selected for model instances to those read by
+        `serializer_cls`. `values` rows are already projected.
+
+        """
+        if config.PROJECT_QUERIES and self.many and not self.values:
+            self.queryset = project_queryset(self.queryset, serializer_cls=serializer_cls)
+
     def payload(self, serializer_cls: types.ModelSerializerClass):
-        if self.values:
+        if self.values and self.values_serializer is None:
             serializer_cls = subset_serializer(serializer_cls=serializer_cls, select_fields=self.values)
+        if not self.exists and not self.count:
+            self._project(serializer_cls)
+        if self.is_cursor_paginated:
+            return self.cursor_paginated_payload(serializer_cls=serializer_cls)
         if self.is_paginated:
             return self.paginated_payload(serializer_cls=serializer_cls)
         if self.exists:
@@ -264,8 +675,7 @@ class ModelTypeQuerysetPayloadBuilder(object):
         queryset = self.queryset
         if self.values:
             queryset = queryset.values(*self.values)
-        serializer = serializer_cls(queryset, many=self.many)
-        return serializer.data
+        return self._serialize(queryset, serializer_cls=serializer_cls)
 
 
 
@@ -0,0 +1,173 @@
+import typing
+
+from django.db import models
+from rest_framework.exceptions import ValidationError
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.utils.lru_cache import LRUCache
+from django_typescript.model_types.prefetch_tree import canonical_prefetch_trees
+
+
+PREFETCH_KEY = 'prefetch'
+
+
+# =================================
+# Resolved Prefetch Trees
+# ---------------------------------
+
+RESOLVED_PREFETCH_CACHE = LRUCache(maxsize=config.PREFETCH_SERIALIZER_CACHE_SIZE)
+
+
+def clear_resolved_prefetch_cache():
+    RESOLVED_PREFETCH_CACHE.clear()
+
+
+class PrefetchLookup(typing.NamedTuple):
+
+    """
+    A `prefetch_related` lookup of a multi-valued relation, and the resolved
+    subtree fetched along with the related objects (if any).
+
+    """
+
+    lookup: str
+    related_model: types.ModelClass
+    nested: typing.Optional['ResolvedPrefetch']
+
+    def build(self) -> typing.Union[str, models.Prefetch]:
+        if self.nested is None:
+            return self.lookup
+        queryset = self.related_model._default_manager.all()
+        if self.nested.select_related:
+            queryset = queryset.select_related(*self.nested.select_related)
+        if self.nested.prefetch_lookups:
+            queryset = queryset.prefetch_related(*self.nested.prefetch_related())
+        return models.Prefetch(self.lookup, queryset=queryset)
+
+
+class ResolvedPrefetch(typing.NamedTuple):
+
+    """
+    The `select_related` paths and `prefetch_related` lookups that fetch a list
+    of prefetch trees, and every related model they read.
+
+    """
+
+    select_related: typing.Tuple[str, ...]
+    prefetch_lookups: typing.Tuple[PrefetchLookup, ...]
+    related_models: typing.FrozenSet[types.ModelClass]
+
+    def prefetch_related(self) -> typing.List[typing.Union[str, models.Prefetch]]:
+        # `Prefetch` objects hold querysets, so they are built for each use.
+        return [prefetch_lookup.build() for prefetch_lookup in self.prefetch_lookups]
+
+
+# =================================
+# Relation Graph
+# ---------------------------------
+
+class RelationEdge(typing.NamedTuple):
+
+    name: str
+    related_model: types.ModelClass
+    multi_valued: bool
+    accessor_name: str
+
+
+class RelationGraph(object):
+
+    """
+    The relations - forward, reverse, one-to-one and many-to-many - between the
+    models of a pool of `ModelType`s (an `Interface`'s), built once. Prefetch
+    trees are resolved against it in a single pass over the tree, and names
+    that are neither relations to models of the pool nor property fields of
+    the `ModelType`s are rejected. Resolutions are cached per canonical
+    prefetch tree.
+
+    """
+
+    def __init__(self, model_types: typing.Iterable):
+        model_types = list(model_types)
+        self.models: typing.Set[types.ModelClass] = {model_type.model_cls for model_type in model_types}
+        self.edges: typing.Dict[types.ModelClass, typing.Dict[str, RelationEdge]] = {}
+        self.property_fields: typing.Dict[types.ModelClass, typing.Set[str]] = {}
+        for model_type in model_types:
+            self.property_fields.setdefault(model_type.model_cls, set()).update(model_type.property_fields or [])
+        for model_cls in self.models:
+            self.edges[model_cls] = {
+                field.name: RelationEdge(name=field.name, related_model=field.related_model,
+                                         multi_valued=types.field_is_multi_valued_relation(field),
+                                         accessor_name=types.relation_accessor_name(field))
+                for field in model_cls._meta.get_fields()
+                if field.is_relation and field.related_model in self.models
+            }
+
+    def _invalid(self, message: str):
+        return ValidationError({PREFETCH_KEY: [message]})
+
+    def _nodes(self, model_cls: types.ModelClass,
+               prefetch_tree: types.PrefetchTree) -> typing.List[typing.Tuple[RelationEdge, typing.Any]]:
+        """
+        Return the `(edge, nested prefetch tree)` pairs at the root of
+        `prefetch_tree`. Leaf edges have a nested prefetch tree of `None`.
+
+        """
+        if isinstance(prefetch_tree, str):
+            items = [(prefetch_tree, None)]
+        elif isinstance(prefetch_tree, list) and all(isinstance(name, str) for name in prefetch_tree):
+            items = [(name, None) for name in prefetch_tree]
+        elif isinstance(prefetch_tree, dict):
+            items = list(prefetch_tree.items())
+        else:
+            raise self._invalid(f"Invalid prefetch tree `{prefetch_tree}`.")
+        nodes = []
+        edges = self.edges.get(model_cls, {})
+        for name, subtree in items:
+            edge = edges.get(name)
+            if edge is None:
+                if subtree is None and name in self.property_fields.get(model_cls, ()):
+                    continue
+                raise self._invalid(f"`{name}` is not a relation or property field of {model_cls.__name__}.")
+            nodes.append((edge, subtree))
+        return nodes
+
+    def _resolve(self, model_cls: types.ModelClass, prefetch_trees: list, prefix: str = '') -> ResolvedPrefetch:
+        select_related = []
+        prefetch_lookups = []
+        related_models = set()
+        for prefetch_tree in prefetch_trees:
+            for edge, subtree in self._nodes(model_cls, prefetch_tree):
+                related_models.add(edge.related_model)
+                nested = None
+                if edge.multi_valued:
+                    if subtree is not None:
+                        nested = self._resolve(edge.related_model, [subtree])
+                    prefetch_lookups.append(PrefetchLookup(lookup=prefix + edge.accessor_name,
+                                                           related_model=edge.related_model, nested=nested))
+                else:
+                    select_related.append(prefix + edge.name)
+                    if subtree is not None:
+                        nested = self._resolve(edge.related_model, [subtree], prefix=prefix + edge.name + '__')
+                        select_related += nested.select_related
+                        prefetch_lookups += nested.prefetch_lookups
+                if nested is not None:
+                    related_models |= nested.related_models
+        return ResolvedPrefetch(select_related=tuple(select_related), prefetch_lookups=tuple(prefetch_lookups),
+                                related_models=frozenset(related_models))
+
+    def resolve(self, model_cls: types.ModelClass, prefetch_trees: typing.List[types.PrefetchTree]) -> ResolvedPrefetch:
+        """
+        Return the resolved `prefetch_trees` of `model_cls`, raising a
+        `ValidationError` if they are malformed or name anything but
+        relations and property fields.
+
+        """
+        if not isinstance(prefetch_trees, list):
+            raise self._invalid('Expected a list of prefetch trees.')
+        try:
+            cache_key = (self, model_cls, canonical_prefetch_trees(prefetch_trees))
+            hash(cache_key)
+        except (AttributeError, TypeError):
+            raise self._invalid('Invalid prefetch trees.')
+        return RESOLVED_PREFETCH_CACHE.get_or_set(cache_key, lambda: self._resolve(model_cls, prefetch_trees))
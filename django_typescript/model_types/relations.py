@@ -0,0 +1,72 @@
+import typing
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import models
+
+from django_typescript.core import types
+
+
+# =================================
+# Relation Resolver
+# ---------------------------------
+
+class RelationResolver(object):
+
+    """
+    Resolves the values of forward relation fields (e.g. `parent_id`) to the
+    related objects, with one `in_bulk()` query per related model for each
+    batch of values. Resolved objects - and values without an object - are
+    memoized, so a resolver is shared for the whole of a request (see
+    `for_request`).
+
+    """
+
+    REQUEST_ATTR = '_django_ts_relation_resolver'
+
+    def __init__(self):
+        self._objects: typing.Dict[typing.Tuple[types.ModelClass, str], dict] = {}
+
+    @classmethod
+    def for_request(cls, request) -> 'RelationResolver':
+        resolver = getattr(request, cls.REQUEST_ATTR, None)
+        if resolver is None:
+            resolver = cls()
+            setattr(request, cls.REQUEST_ATTR, resolver)
+        return resolver
+
+    @staticmethod
+    def _target(model_field: types.ForwardRelationField) -> typing.Tuple[types.ModelClass, str]:
+        target_field = model_field.target_field
+        return model_field.related_model, 'pk' if target_field.primary_key else target_field.name
+
+    @staticmethod
+    def _to_python(model_field: types.ForwardRelationField, value):
+        try:
+            return model_field.target_field.to_python(value)
+        except (DjangoValidationError, TypeError, ValueError):
+            return None
+
+    def prime(self, model_field: types.ForwardRelationField, values: typing.Iterable):
+        """
+        Fetch the objects related through `model_field` to any of `values` not
+        resolved yet, with a single query. Invalid values are ignored.
+
+        """
+        related_model, field_name = self._target(model_field)
+        objects = self._objects.setdefault((related_model, field_name), {})
+        missing = {self._to_python(model_field, value) for value in values if value is not None} - set(objects)
+        missing.discard(None)
+        if missing:
+            found = related_model.objects.in_bulk(list(missing), field_name=field_name)
+            for value in missing:
+                objects[value] = found.get(value)
+
+    def resolve(self, model_field: types.ForwardRelationField, value) -> typing.Optional[models.Model]:
+        """
+        Return the object related through `model_field` to `value`, or `None`
+        if there is none.
+
+        """
+        self.prime(model_field, [value])
+        related_model, field_name = self._target(model_field)
+        return self._objects[(related_model, field_name)].get(self._to_python(model_field, value))
@@ -0,0 +1,85 @@
+import typing
+import json
+import hashlib
+
+from django.core.cache import cache
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.model_types.conditional import request_fingerprint
+
+
+# =================================
+# Result Cache
+# ---------------------------------
+
+MISS = object()
+
+
+def _cacheable(data):
+    """
+    Return `data` with DRF's `ReturnList`/`ReturnDict` (which reference
+    their serializer, and so the queried instances) replaced by plain lists
+    and dicts.
+
+    """
+    if isinstance(data, dict):
+        return {key: _cacheable(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_cacheable(item) for item in data]
+    return data
+
+
+class ResultCache(object):
+
+    """
+    Caches the response data of read views in Django's cache, for `ttl`
+    seconds. Entries are keyed by the request's path, query parameters (the
+    query, prefetch trees, fields, ordering and pagination) and accepted
+    media type, and record the versions of every table the response read
+    (see `versions.model_versions`). An entry is only served while all of
+    those versions are current, i.e. until any of the tables is written to.
+
+    """
+
+    CACHE_KEY_PREFIX = 'django_ts:result:'
+
+    def __init__(self, ttl: int = None):
+        self.ttl = ttl if ttl is not None else config.RESULT_CACHE_TTL
+
+    def key(self, request: Request) -> str:
+        data = json.dumps(request_fingerprint(request))
+        return self.CACHE_KEY_PREFIX + hashlib.sha1(data.encode('utf-8')).hexdigest()
+
+    def get(self, request: Request, versions: typing.Dict[str, str]):
+        """
+        Return the cached data of the response to `request`, or `MISS` if
+        there is none, or if the `versions` of the tables it read changed.
+
+        """
+        entry = cache.get(self.key(request))
+        if entry is None or entry['versions'] != versions:
+            return MISS
+        return entry['data']
+
+    def set(self, request: Request, versions: typing.Dict[str, str], data):
+        """
+        Cache `data`, the data of the response to `request`, which read tables
+        at `versions`. Versions must be read before the data is queried, so
+        that a write committed in between invalidates the entry.
+
+        """
+        cache.set(self.key(request), {'versions': versions, 'data': _cacheable(data)}, self.ttl)
+
+
+def resolve_result_cache(result_cache: typing.Union[bool, ResultCache, None]) -> typing.Optional[ResultCache]:
+    """
+    Return a `ResultCache` instance for `result_cache`, which may be a
+    `ResultCache`, `True` (a `ResultCache` with the default TTL), or falsy.
+
+    """
+    if isinstance(result_cache, ResultCache):
+        return result_cache
+    if result_cache:
+        return ResultCache()
+    return None
@@ -0,0 +1,84 @@
+import time
+import typing
+import itertools
+import functools
+
+from django.db import models, DEFAULT_DB_ALIAS
+
+from django_typescript import config
+
+
+# =================================
+# Read Routing
+# ---------------------------------
+
+class ReadRouting(object):
+
+    """
+    Routes the queries of read-only generated views (list - including
+    `exists` and `count` - get, get-many, aggregate and property views) to
+    read database aliases, in turn. Write and method views, and read views
+    with ETags or a result cache, use the primary (`default`) database.
+
+    For `sticky_seconds` after a successful write through the generated
+    views, a client's reads go to the primary as well, so it reads its own
+    writes despite replication lag. The window is kept in a cookie.
+
+    """
+
+    STICKY_COOKIE = 'django_ts_primary_until'
+
+    def __init__(self, read_databases: typing.List[str] = None, sticky_seconds: int = None):
+        self.read_databases = list(read_databases if read_databases is not None else config.READ_DATABASES)
+        self.sticky_seconds = sticky_seconds if sticky_seconds is not None else config.STICKY_PRIMARY_SECONDS
+        self._turns = itertools.count()
+
+    def is_sticky(self, request) -> bool:
+        """
+        Whether `request`'s client wrote within the last `sticky_seconds`.
+
+        """
+        try:
+            return float(request.COOKIES.get(self.STICKY_COOKIE, 0)) > time.time()
+        except ValueError:
+            return False
+
+    def read_alias(self, request) -> str:
+        if not self.read_databases or self.is_sticky(request):
+            return DEFAULT_DB_ALIAS
+        return self.read_databases[next(self._turns) % len(self.read_databases)]
+
+    def using(self, queryset: models.QuerySet, request) -> models.QuerySet:
+        return queryset.using(self.read_alias(request))
+
+    def sticky_writes(self, view: typing.Callable) -> typing.Callable:
+        """
+        Wrap `view`, a write (or method) view, so successful responses keep
+        the client's reads on the primary for `sticky_seconds`.
+
+        """
+        @functools.wraps(view)
+        def sticky_view(request, *args, **kwargs):
+            response = view(request, *args, **kwargs)
+            if self.sticky_seconds and 200 <= response.status_code < 300:
+                response.set_cookie(self.STICKY_COOKIE, str(time.time() + self.sticky_seconds),
+                                    max_age=self.sticky_seconds, httponly=True, samesite='Lax')
+            return response
+        return sticky_view
+
+
+def resolve_read_routing(
+        read_routing: typing.Union[bool, typing.List[str], ReadRouting, None]) -> typing.Optional[ReadRouting]:
+    """
+    Return a `ReadRouting` instance for `read_routing`, which may be a
+    `ReadRouting`, a list of read database aliases, `True` (a `ReadRouting`
+    to `DJANGO_TS_READ_DATABASES`), or falsy.
+
+    """
+    if isinstance(read_routing, ReadRouting):
+        return read_routing
+    if isinstance(read_routing, (list, tuple)):
+        return ReadRouting(read_databases=read_routing)
+    if read_routing:
+        return ReadRouting()
+    return None
@@ -1,6 +1,7 @@
-from typing import Dict, Callable, List, Union
+from typing import Dict, Callable, Iterable, List, Union
 
 from django.db import models
+from django.core.exceptions import FieldDoesNotExist
 from rest_framework import serializers
 from rest_framework.utils.field_mapping import get_field_kwargs, UniqueValidator
 
@@ -8,7 +9,11 @@ from django_typescript.core import types
 from django_typescript import config
 from django_typescript.core.field_info import FieldInfo
 from django_typescript.core.model_inspector import ModelInspector
+from django_typescript.core.utils.lru_cache import LRUCache
 from django_typescript.model_types.validator import ModelTypeValidator
+from django_typescript.model_types.relations import RelationResolver
+from django_typescript.model_types.prefetch_tree import canonical_prefetch_trees
+from django_typescript.model_types.values import CoercionTable, build_coercion_table
 
 
 # =================================
@@ -17,6 +22,27 @@ from django_typescript.model_types.validator import ModelTypeValidator
 
 _REGISTRY: Dict[types.ModelClass, 'ModelTypeSerializer'] = {}
 
+# Serializer context key of the `RelationResolver` of serializers used without a request.
+RELATION_RESOLVER_CONTEXT_KEY = 'relation_resolver'
+
+
+# =================================
+# Prefetch Serializer Cache
+# ---------------------------------
+
+# Compiled prefetch serializer classes, keyed by `(ModelTypeSerializer, canonical prefetch trees)`.
+# Each `ModelTypeSerializer` is bound to a single model, so this is effectively keyed by model.
+PREFETCH_SERIALIZER_CACHE = LRUCache(maxsize=config.PREFETCH_SERIALIZER_CACHE_SIZE)
+
+
+def clear_prefetch_serializer_cache():
+    """
+    Discard all cached prefetch serializer classes. Should be called whenever
+    `ModelType`s are rebuilt, e.g. when an `Interface` is reloaded.
+
+    """
+    PREFETCH_SERIALIZER_CACHE.clear()
+
 
 # =================================
 # Model Type Serializer
@@ -41,6 +67,7 @@ class ModelTypeSerializer(object):
         self.field_info: List[FieldInfo] = []
         self.pk_field_info: FieldInfo = None
         self.base_serializer_cls: types.ModelSerializerClass = None
+        self._values_coercion_table: CoercionTable = None
         self._build_fields()
         self._build_serializer_cls()
         self._check_validate_func()
@@ -49,6 +76,17 @@ class ModelTypeSerializer(object):
     def field_names(self):
         return list(self.concrete_fields.keys()) + list(self.forward_rel_fields.keys())
 
+    @property
+    def values_coercion_table(self) -> CoercionTable:
+        """
+        Return the table used to serialize `values()` rows of this serializer's
+        fields without a DRF serializer. Built once, on first use.
+
+        """
+        if self._values_coercion_table is None:
+            self._values_coercion_table = build_coercion_table(self.field_info)
+        return self._values_coercion_table
+
     def _check_validate_func(self):
         if self .validator:
             assert len(set(self.validator.validator_field_names) - set(self._allowed_validator_field_names)) == 0, (
@@ -130,14 +168,63 @@ class ModelTypeSerializer(object):
     def _property_field_serializer(self):
         return serializers.JSONField(read_only=True)
 
-    def _resolve_validator_forward_relations(self, data: dict):
+    @property
+    def validator_relation_fields(self) -> Dict[str, types.ForwardRelationField]:
+        """
+        Return the forward relation fields whose related objects are passed to
+        the `validate` function, keyed by attribute name (e.g. `parent_id`).
+
+        """
+        if not self.validator:
+            return {}
+        return {attname: model_field for attname, model_field in self.forward_rel_model_fields.items()
+                if model_field.name in self.validator.validator_field_names}
+
+    @staticmethod
+    def relation_resolver(context: dict) -> RelationResolver:
+        """
+        Return the `RelationResolver` of the request of serializer `context`,
+        or of the context itself if it has no request.
+
+        """
+        request = context.get('request')
+        if request is None:
+            return context.setdefault(RELATION_RESOLVER_CONTEXT_KEY, RelationResolver())
+        return RelationResolver.for_request(request)
+
+    def prime_validator_relations(self, rows: Iterable[Union[dict, models.Model]], context: dict):
+        """
+        Fetch the objects related to `rows` - raw data, or model instances - that
+        the `validate` function receives, with one query per related model,
+        before the rows are validated one by one.
+
+        """
+        resolver = self.relation_resolver(context)
+        for attname, model_field in self.validator_relation_fields.items():
+            values = [row.get(attname) if isinstance(row, dict) else getattr(row, attname) for row in rows]
+            resolver.prime(model_field, values)
+
+    def _resolve_validator_forward_relations(self, data: dict, context: dict, instance: models.Model = None):
+        resolver = self.relation_resolver(context)
         resolved_relations = {}
-        for k, v in data.items():
-            #
-            if k in self.forward_rel_model_fields and v is not None:
-                model_field = self.forward_rel_model_fields[k]
-                if model_field.name in self.validator.validator_field_names:
-                    resolved_relations[model_field.name] = model_field.related_model.objects.get(pk=v)
+        for attname, model_field in self.validator_relation_fields.items():
+            if attname in data:
+                value = data[attname]
+            elif instance is not None:
+                if model_field.is_cached(instance):
+                    resolved_relations[model_field.name] = getattr(instance, model_field.name)
+                    continue
+                value = getattr(instance, attname)
+            else:
+                continue
+            if value is None:
+                continue
+            related_obj = resolver.resolve(model_field, value)
+            if related_obj is None:
+                raise serializers.ValidationError(
+                    {attname: [f'Invalid pk "{value}" - object does not exist.']}
+                )
+            resolved_relations[model_field.name] = related_obj
         return resolved_relations
 
     def _build_serializer_cls(self):
@@ -148,10 +235,16 @@ class ModelTypeSerializer(object):
 
         def validate(_self, attrs):
             if self.validator:
-                resolved_relations = self._resolve_validator_forward_relations(attrs)
+                instance = _self.instance if _self.partial else None
+                resolved_relations = self._resolve_validator_forward_relations(attrs, _self.context, instance)
                 if _self.partial:
                     for validator_field_name in self.validator.validator_field_names:
-                        if validator_field_name not in attrs:
+                        if validator_field_name not in attrs and validator_field_name not in resolved_relations:
+                            if _self.instance is None:
+                                # A partial update of many rows (e.g. a query update).
+                                raise serializers.ValidationError(
+                                    {validator_field_name: ['This field is required, as it is validated.']}
+                                )
                             attrs[validator_field_name] = getattr(_self.instance, validator_field_name)
                 self.validator.validate(**{**attrs, **resolved_relations})
             return serializers.ModelSerializer.validate(_self, attrs)
@@ -169,17 +262,44 @@ class ModelTypeSerializer(object):
                       [f.name for f in self.forward_rel_model_fields.values()]
         return allowed_names
 
+    @staticmethod
+    def _prefetch_serializer_kwargs(model_field: types.ModelField) -> dict:
+        """
+        Return the init kwargs of the nested serializer for prefetched relation
+        `model_field`. Multi-valued relations are rendered as lists.
+
+        """
+        kwargs = {'many': False}
+        if types.field_is_multi_valued_relation(model_field):
+            kwargs = {'many': True, 'read_only': True}
+        accessor_name = types.relation_accessor_name(model_field)
+        if accessor_name != model_field.name:
+            kwargs['source'] = accessor_name
+        return kwargs
+
     def _build_prefetch_serializer(self, prefetch_field: str):
         # If the prefetch_field is not a model field, it must be a 'property field'.
         try:
             model_field = self.model_cls._meta.get_field(prefetch_field)
-            serializer = ModelTypeSerializer(model_cls=model_field.related_model)
-            serializer_cls = serializer.base_serializer_cls
-            return serializer_cls(many=False)
-        except models.FieldDoesNotExist:
+        except FieldDoesNotExist:
             return self._property_field_serializer()
+        serializer = ModelTypeSerializer(model_cls=model_field.related_model)
+        serializer_cls = serializer.base_serializer_cls
+        return serializer_cls(**self._prefetch_serializer_kwargs(model_field))
 
     def build_prefetch_serializer_tree(self, prefetch_trees: List[types.PrefetchTree]) -> types.ModelSerializerClass:
+        """
+        Return a serializer class that nests the related objects described by
+        `prefetch_trees`. Classes are cached per canonical prefetch tree, so
+        repeated requests reuse the same compiled class.
+
+        """
+        cache_key = (self, canonical_prefetch_trees(prefetch_trees))
+        return PREFETCH_SERIALIZER_CACHE.get_or_set(
+            cache_key, lambda: self._build_prefetch_serializer_tree(prefetch_trees=prefetch_trees)
+        )
+
+    def _build_prefetch_serializer_tree(self, prefetch_trees: List[types.PrefetchTree]) -> types.ModelSerializerClass:
         prefetch_fields = dict()
         for prefetch_tree in prefetch_trees:
             if isinstance(prefetch_tree, str):
@@ -192,8 +312,8 @@ class ModelTypeSerializer(object):
                 for k, v in prefetch_tree.items():
                     model_field = self.model_cls._meta.get_field(k)
                     serializer = ModelTypeSerializer(model_cls=model_field.related_model)
-                    serializer_cls = serializer.build_prefetch_serializer_tree([v])
-                    prefetch_fields[model_field.name] = serializer_cls(many=False)
+                    serializer_cls = serializer._build_prefetch_serializer_tree([v])
+                    prefetch_fields[model_field.name] = serializer_cls(**self._prefetch_serializer_kwargs(model_field))
 
         class Meta:
             model = self.model_cls
@@ -0,0 +1,158 @@
+import json
+import time
+import typing
+
+from django.core.cache import cache as default_cache
+from rest_framework.exceptions import ValidationError
+from rest_framework.throttling import BaseThrottle
+
+from django_typescript import config
+from django_typescript.core import types
+from django_typescript.core.views import View
+from django_typescript.model_types.view import ModelView
+from django_typescript.model_types.queryset import (ModelTypeQuery, ModelTypeQuerysetBuilder,
+                                                    ModelTypeQuerysetPayloadBuilder)
+from django_typescript.model_types.query_normalizer import query_branches
+
+
+# =================================
+# Request Scoring
+# ---------------------------------
+
+def _json_param(request, key: str):
+    try:
+        return json.loads(request.query_params[key])
+    except (KeyError, ValueError):
+        return None
+
+
+def prefetch_depths(prefetch_tree: types.PrefetchTree, depth: int = 1) -> typing.List[int]:
+    """
+    Return the depth of each relation in `prefetch_tree`, e.g:
+
+        `['parent', {'children': ['children']}]` -> `[1, 1, 2]`
+
+    """
+    if isinstance(prefetch_tree, str):
+        return [depth]
+    if isinstance(prefetch_tree, list):
+        return [d for subtree in prefetch_tree for d in prefetch_depths(subtree, depth)]
+    if isinstance(prefetch_tree, dict):
+        return [d for subtree in prefetch_tree.values() for d in [depth] + prefetch_depths(subtree, depth + 1)]
+    return []
+
+
+# =================================
+# Query Cost Throttle
+# ---------------------------------
+
+class QueryCostThrottle(BaseThrottle):
+
+    """
+    A DRF throttle spending the cost of each request to a generated view from
+    the client's token bucket. A bucket holds up to `budget` cost, and refills
+    at `budget` per `window` seconds; requests costing more than is left are
+    throttled (429) until enough has been refilled. Buckets are kept in
+    Django's cache, so they are shared by every worker using the same cache.
+    Clients are identified by user, or by IP address if anonymous.
+
+    A request's cost is scored from the parsed request, before it is run (see
+    `query_cost`). Requests to other views cost `base_cost`. Subclass to
+    change the budget, the window or the weights of the score.
+
+    Each bucket state carries a sequence number, and a request only spends
+    from the state it read if it is the first to claim the next number, with
+    the cache's atomic `add()`; requests losing the claim to a concurrent
+    request read the bucket again, up to `max_retries` times, and are then
+    throttled. So concurrent requests cannot all spend the same tokens -
+    unless the cache's `add()` is not atomic (e.g. the file based cache).
+
+    """
+
+    cache = default_cache
+    scope = 'query_cost'
+    cache_format = 'django_ts_throttle_%(scope)s_%(ident)s'
+
+    budget: float = config.QUERY_COST_BUDGET
+    window: float = config.QUERY_COST_WINDOW
+
+    # The cost of any request.
+    base_cost: float = 1
+    # The cost of each OR-ed branch of the query, beyond the first.
+    branch_cost: float = 1
+    # The cost of each relation of the prefetch trees, times its depth.
+    prefetch_cost: float = 2
+    # The cost of `distinct`.
+    distinct_cost: float = 2
+    # The number of objects returned per unit of cost, each prefetched relation
+    # counting as returning as many again. Unbounded lists are taken to return
+    # `unbounded_rows`, and `values` rows cost `values_factor` of objects.
+    rows_per_cost: float = 100
+    unbounded_rows: int = 1000
+    values_factor: float = 0.5
+
+    # How many times a request reads a bucket again after concurrent requests
+    # spent from it first, before it is throttled.
+    max_retries: int = 5
+
+    def __init__(self):
+        self._wait = None
+
+    def get_cache_key(self, request, view) -> str:
+        if request.user and request.user.is_authenticated:
+            ident = request.user.pk
+        else:
+            ident = self.get_ident(request)
+        return self.cache_format % {'scope': self.scope, 'ident': ident}
+
+    def query_cost(self, request, view) -> float:
+        """
+        Return the cost of `request`: `base_cost`, plus the cost of the
+        breadth of its query's ORs, of its prefetch trees and of `distinct`,
+        plus that of the objects it may return. Requests never cost less
+        than `base_cost`, so no request refills a bucket.
+
+        """
+        model_view = getattr(view, View.VIEW_ATTR, None)
+        if not isinstance(model_view, ModelView):
+            return self.base_cost
+        cost = self.base_cost
+        query_data = _json_param(request, ModelTypeQuerysetBuilder.QUERY_KEY)
+        if query_data is not None:
+            try:
+                cost += self.branch_cost * max(len(query_branches(ModelTypeQuery.from_data(query_data))) - 1, 0)
+            except ValidationError:
+                pass
+        prefetch_trees = _json_param(request, ModelTypeQuerysetBuilder.PREFETCH_KEY)
+        depths = prefetch_depths(prefetch_trees) if isinstance(prefetch_trees, list) else []
+        cost += self.prefetch_cost * sum(depths)
+        if _json_param(request, ModelTypeQuerysetBuilder.DISTINCT_KEY):
+            cost += self.distinct_cost
+        rows = model_view.max_rows(request)
+        rows = self.unbounded_rows if rows is None else rows
+        row_cost = rows * (1 + len(depths)) / self.rows_per_cost
+        if _json_param(request, ModelTypeQuerysetPayloadBuilder.VALUES_KEY):
+            row_cost *= self.values_factor
+        return max(cost + row_cost, self.base_cost)
+
+    def allow_request(self, request, view) -> bool:
+        # A request costing more than the budget is let through with a full bucket.
+        cost = min(self.query_cost(request, view), self.budget)
+        key = self.get_cache_key(request, view)
+        for _ in range(self.max_retries + 1):
+            now = time.time()
+            tokens, refilled_at, sequence = self.cache.get(key, (self.budget, now, 0))
+            tokens = min(self.budget, tokens + (now - refilled_at) * self.budget / self.window)
+            if cost > tokens:
+                self._wait = (cost - tokens) * self.window / self.budget
+                return False
+            # Claims expire no later than the state they lead to, so a bucket
+            # starting over at sequence 0 finds no stale claims.
+            if self.cache.add(f'{key}_{sequence + 1}', True, self.window):
+                self.cache.set(key, (tokens - cost, now, sequence + 1), self.window)
+                return True
+        self._wait = None
+        return False
+
+    def wait(self) -> typing.Optional[float]:
+        return self._wait
@@ -0,0 +1,90 @@
+import typing
+
+from rest_framework import serializers
+
+from django_typescript.core.field_info import FieldInfo
+
+
+# =================================
+# Value Coercions
+# ---------------------------------
+
+# Serializer field types whose `to_representation` returns database values
+# of the corresponding model fields unchanged. Exact types are used, as
+# subclasses may represent values differently.
+IDENTITY_SERIALIZER_FIELD_TYPES = (serializers.CharField,
+                                   serializers.IntegerField,
+                                   serializers.FloatField,
+                                   serializers.BooleanField)
+
+# Maps a serializer field name to the function that converts database values
+# to their serialized representation, or `None` if values can be used as is.
+CoercionTable = typing.Dict[str, typing.Optional[typing.Callable]]
+
+
+def build_coercion_table(field_info: typing.List[FieldInfo]) -> CoercionTable:
+    """
+    Return the coercion table for the fields described by `field_info`. Fields
+    whose values cannot be serialized directly from a `values()` row - those
+    that are write only or have a custom `source` - are left out.
+
+    """
+    coercion_table = {}
+    for info in field_info:
+        serializer_field = info.serializer
+        if serializer_field.write_only:
+            continue
+        if serializer_field.source not in (None, info.serializer_field_name):
+            continue
+        if type(serializer_field) in IDENTITY_SERIALIZER_FIELD_TYPES:
+            coercion_table[info.serializer_field_name] = None
+        else:
+            coercion_table[info.serializer_field_name] = serializer_field.to_representation
+    return coercion_table
+
+
+# =================================
+# Values Serializer
+# ---------------------------------
+
+class ValuesSerializer(object):
+
+    """
+    Serializes `queryset.values(...)` rows without instantiating DRF
+    serializers, by applying a precomputed coercion to each field value. The
+    output is identical to that of a `subset_serializer` of the same fields.
+
+    """
+
+    def __init__(self, field_names: typing.List[str], coercion_table: CoercionTable):
+        self.field_names = field_names
+        self.coercions = [(name, coercion_table[name]) for name in field_names]
+
+    @classmethod
+    def for_fields(cls, field_names: typing.List[str],
+                   coercion_table: CoercionTable) -> typing.Optional['ValuesSerializer']:
+        """
+        Return a `ValuesSerializer` for `field_names`, or `None` if any of them
+        cannot be serialized without a DRF serializer.
+
+        """
+        if len(set(field_names)) != len(field_names):
+            return None
+        for name in field_names:
+            if name not in coercion_table:
+                return None
+        return cls(field_names=field_names, coercion_table=coercion_table)
+
+    def serialize_row(self, row: dict) -> dict:
+        data = {}
+        for name, coerce in self.coercions:
+            value = row[name]
+            if value is None or coerce is None:
+                data[name] = value
+            else:
+                data[name] = coerce(value)
+        return data
+
+    def serialize(self, rows: typing.Iterable[dict]) -> typing.List[dict]:
+        serialize_row = self.serialize_row
+        return [serialize_row(row) for row in rows]
@@ -0,0 +1,108 @@
+import typing
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import signals
+
+from django_typescript.core import types
+
+
+# =================================
+# Model Versions
+# ---------------------------------
+
+# Each model (table) has a version token in Django's cache, replaced with a
+# new random token whenever the table is written to. Random tokens, rather
+# than counters, ensure a version evicted from the cache never repeats.
+
+VERSION_KEY_PREFIX = 'django_ts:version:'
+
+
+def _version_key(model_cls: types.ModelClass) -> str:
+    return VERSION_KEY_PREFIX + model_cls._meta.concrete_model._meta.label_lower
+
+
+def model_versions(model_classes: typing.Iterable[types.ModelClass]) -> typing.Dict[str, str]:
+    """
+    Return the current version token of each of `model_classes`, keyed by
+    cache key. Models without a version are given one, once the receivers
+    bumping their versions are connected (see `connect_version_signals`), so
+    versions are only kept for the models responses actually read.
+
+    """
+    model_classes = list(model_classes)
+    connect_version_signals(*model_classes)
+    keys = sorted({_version_key(model_cls) for model_cls in model_classes})
+    versions = cache.get_many(keys)
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        for key in missing:
+            cache.add(key, uuid.uuid4().hex, None)
+        versions.update(cache.get_many(missing))
+    return versions
+
+
+def _bump(model_classes: typing.Iterable[types.ModelClass]):
+    cache.set_many({_version_key(model_cls): uuid.uuid4().hex for model_cls in model_classes}, None)
+
+
+def bump_model_versions(*model_classes: types.ModelClass):
+    """
+    Replace the versions of `model_classes` (and of the tables of their
+    multi-table inheritance parents). Call this after writes that send no
+    model signals, e.g. `QuerySet.update()` or `bulk_create()`.
+
+    Versions are replaced immediately, and again when the current transaction
+    commits, so a version read while the write is uncommitted is not paired
+    with the data committed later.
+
+    """
+    all_model_classes = set()
+    for model_cls in model_classes:
+        all_model_classes.add(model_cls)
+        all_model_classes.update(model_cls._meta.get_parent_list())
+    _bump(all_model_classes)
+    transaction.on_commit(lambda: _bump(all_model_classes))
+
+
+# =================================
+# Signals
+# ---------------------------------
+
+def _bump_on_write(sender, **kwargs):
+    bump_model_versions(sender)
+
+
+def _bump_on_m2m_changed(sender, instance, model, action, **kwargs):
+    if action.startswith('post_'):
+        bump_model_versions(sender, type(instance), model)
+
+
+def _m2m_through_models(model_cls: types.ModelClass) -> typing.Set[types.ModelClass]:
+    return {field.remote_field.through if field.concrete else field.through
+            for field in model_cls._meta.get_fields() if field.many_to_many}
+
+
+_VERSIONED_MODELS: typing.Set[types.ModelClass] = set()
+
+
+def connect_version_signals(*model_classes: types.ModelClass):
+    """
+    Bump model versions on `post_save` and `post_delete` of `model_classes`
+    and of their multi-table inheritance parents, and on `m2m_changed` of
+    their many-to-many through tables. Receivers are connected for these
+    models only, as a `post_delete` receiver keeps Django from 'fast'
+    deleting a model's rows.
+
+    """
+    for model_cls in model_classes:
+        for model in [model_cls] + model_cls._meta.get_parent_list():
+            if model in _VERSIONED_MODELS:
+                continue
+            signals.post_save.connect(_bump_on_write, sender=model, dispatch_uid='django_ts_version_post_save')
+            signals.post_delete.connect(_bump_on_write, sender=model, dispatch_uid='django_ts_version_post_delete')
+            for through in _m2m_through_models(model):
+                signals.m2m_changed.connect(_bump_on_m2m_changed, sender=through,
+                                            dispatch_uid='django_ts_version_m2m_changed')
+            _VERSIONED_MODELS.add(model)
@@ -1,9 +1,31 @@
-from typing import List
+from typing import List, Optional
+
+from django.db import connections
+from rest_framework.exceptions import ValidationError
 
 from django_typescript.core import endpoints
 from django_typescript.core.views import View, Response, status
 from django_typescript.core import types
 from django_typescript.model_types.serializer import ModelTypeSerializer
+from django_typescript.model_types.conditional import versioned_etag, etag_matches
+from django_typescript.model_types.result_cache import ResultCache, MISS
+from django_typescript.model_types.versions import model_versions
+from django_typescript.model_types.relation_graph import RelationGraph
+from django_typescript.model_types.routing import ReadRouting
+from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
+
+
+INDEX_VIOLATIONS_HEADER = 'X-Index-Violations'
+
+
+def prefers_minimal_return(request) -> bool:
+    """
+    Whether `request` has a `Prefer: return=minimal` header (RFC 7240).
+
+    """
+    preferences = request.META.get('HTTP_PREFER', '')
+    return any(preference.split(';')[0].strip().replace(' ', '') == 'return=minimal'
+               for preference in preferences.split(','))
 
 
 # =================================
@@ -12,6 +34,17 @@ from django_typescript.model_types.serializer import ModelTypeSerializer
 
 class ModelView(View):
 
+    # Whether (read) responses carry an ETag, and `If-None-Match` requests are
+    # answered with a 304 when it matches.
+    etag: bool = False
+    # An optional cache of (read) response data.
+    result_cache: ResultCache = None
+    # The relation graph of the `Interface` the view belongs to, against which
+    # prefetch trees are resolved (see `ModelType.bind_relation_graph`).
+    relation_graph: RelationGraph = None
+    # Routes the queries of read views to read databases (see `ModelType.urlpatterns`).
+    read_routing: ReadRouting = None
+
     def __init__(self, serializer: ModelTypeSerializer, serializer_cls: types.ModelSerializerClass,
                  endpoint: endpoints.Endpoint, permission_classes=None):
         self.serializer = serializer
@@ -26,6 +59,139 @@ class ModelView(View):
             serializer_cls = self.serializer.build_prefetch_serializer_tree(prefetch_trees=prefetch_trees)
             return serializer_cls(*args, **kwargs)
 
+    def max_rows(self, request) -> Optional[int]:
+        """
+        Return the most objects the response to `request` may hold, or `None`
+        if it is unbounded. Used to score requests (see `QueryCostThrottle`).
+
+        """
+        return 1
+
+    def _read_queryset(self, request):
+        """
+        Return the queryset of all objects, on the read database `request` is
+        routed to (if any). Views with ETags or a result cache read from the
+        primary: versions change when the primary is written to, so results
+        read from a lagging replica would be tagged (or cached) as current.
+
+        """
+        queryset = self.model_cls.objects.all()
+        if self.read_routing is not None and not self.etag and self.result_cache is None:
+            queryset = self.read_routing.using(queryset, request)
+        return queryset
+
+    def _versions(self, queryset_builder) -> Optional[dict]:
+        """
+        Return the versions of the tables read by the queryset `queryset_builder`
+        builds, or `None` if this view uses neither ETags nor a result cache.
+        Versions are read from Django's cache; the database is not queried.
+
+        """
+        if not self.etag and self.result_cache is None:
+            return None
+        return model_versions(queryset_builder.touched_models())
+
+    def _etag(self, request, versions: Optional[dict]) -> Optional[str]:
+        """
+        Return the ETag of the response to `request`, or `None` if this view
+        does not use ETags.
+
+        """
+        if not self.etag:
+            return None
+        return versioned_etag(request, versions)
+
+    def _cached_response(self, request, versions: Optional[dict], etag: Optional[str]) -> Optional[Response]:
+        """
+        Return a response with the cached data of the response to `request`,
+        or `None` if there is none.
+
+        """
+        if self.result_cache is None:
+            return None
+        data = self.result_cache.get(request, versions)
+        if data is MISS:
+            return None
+        return self._set_etag(Response(data), etag)
+
+    def _cache_result(self, request, versions: Optional[dict], data):
+        if self.result_cache is not None:
+            self.result_cache.set(request, versions, data)
+
+    @staticmethod
+    def _not_modified(request, etag: Optional[str]) -> Optional[Response]:
+        """
+        Return a 304 response if `request` already has the representation
+        tagged `etag`, otherwise `None`.
+
+        """
+        if etag is None or not etag_matches(request, etag):
+            return None
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response['ETag'] = etag
+        return response
+
+    @staticmethod
+    def _set_etag(response, etag: Optional[str]):
+        if etag is not None and response.status_code == status.HTTP_200_OK:
+            response['ETag'] = etag
+        return response
+
+    def _instance_response(self, request, instance, status_code=status.HTTP_200_OK) -> Response:
+        """
+        Return a response with the serialized `instance`, which was just
+        written. It is only read again if the request's prefetch trees name
+        relations, which require joins or prefetches. With `Prefer: return=minimal`, only its primary
+        key is returned.
+
+        """
+        if prefers_minimal_return(request):
+            response = Response({'pk': instance.pk}, status=status_code)
+            response['Preference-Applied'] = 'return=minimal'
+            return response
+        queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request, model_cls=self.model_cls,
+                                                                relation_graph=self.relation_graph)
+        if not queryset_builder.prefetch_trees:
+            return Response(self.serializer_cls(instance, context={'request': request}).data, status=status_code)
+        resolved_prefetch = queryset_builder.resolved_prefetch()
+        if resolved_prefetch is not None and not resolved_prefetch.select_related \
+                and not resolved_prefetch.prefetch_lookups:
+            # Only property fields, which are read from the instance itself.
+            serializer_cls = self.serializer.build_prefetch_serializer_tree(
+                prefetch_trees=queryset_builder.prefetch_trees
+            )
+            return Response(serializer_cls(instance, context={'request': request}).data, status=status_code)
+        queryset = queryset_builder.build_queryset(queryset=self.model_cls.objects.all())
+        serializer_cls = self.serializer.build_prefetch_serializer_tree(prefetch_trees=queryset_builder.prefetch_trees)
+        payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request,
+                                                                      queryset=queryset.get(pk=instance.pk),
+                                                                      many=False)
+        return Response(payload_builder.payload(serializer_cls=serializer_cls), status=status_code)
+
+    @staticmethod
+    def _flag_index_violations(response, index_violations: List[str]):
+        if index_violations:
+            response[INDEX_VIOLATIONS_HEADER] = ' '.join(index_violations)
+        return response
+
+    @staticmethod
+    def _capped_pks(queryset, max_rows: int) -> list:
+        """
+        Return the primary keys of the objects of `queryset`, locking their
+        rows on databases supporting `SELECT ... FOR UPDATE`, or raise a
+        `ValidationError` if it matches more than `max_rows` objects. Call in
+        a transaction, and write to the returned primary keys only, so the
+        objects written to are those that were counted.
+
+        """
+        pks = queryset.order_by().values_list('pk', flat=True)
+        if connections[queryset.db].features.has_select_for_update and not queryset.query.distinct:
+            pks = pks.select_for_update()
+        pks = list(pks[:max_rows + 1])
+        if len(pks) > max_rows:
+            raise ValidationError({'query': [f"The query matches more than {max_rows} objects."]})
+        return pks
+
     @property
     def model_cls(self):
         return self.serializer_cls.Meta.model
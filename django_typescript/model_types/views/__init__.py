@@ -1,9 +1,15 @@
+from django_typescript.model_types.views.aggregate import AggregateView
+from django_typescript.model_types.views.bulk_create import BulkCreateView
+from django_typescript.model_types.views.bulk_update import BulkUpdateView
 from django_typescript.model_types.views.create import CreateView
 from django_typescript.model_types.views.delete import DeleteView
 from django_typescript.model_types.views.get import GetView
+from django_typescript.model_types.views.get_many import GetManyView
 from django_typescript.model_types.views.get_or_create import GetOrCreateView
 from django_typescript.model_types.views.list import ListView
 from django_typescript.model_types.views.method import ModelMethodView
 from django_typescript.model_types.views.property import ModelPropertyView
+from django_typescript.model_types.views.query_delete import QueryDeleteView
+from django_typescript.model_types.views.query_update import QueryUpdateView
 from django_typescript.model_types.views.static_method import ModelStaticMethodView
 from django_typescript.model_types.views.update import UpdateView
@@ -0,0 +1,38 @@
+from rest_framework.request import Request
+
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder
+from django_typescript.model_types.aggregate import ModelTypeAggregation
+from django_typescript.model_types.index_policy import IndexPolicy
+
+
+# =================================
+# Aggregate Type View
+# ---------------------------------
+
+class AggregateView(ModelView):
+
+    REQUEST_METHOD = 'GET'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None, index_policy: IndexPolicy = None):
+        self.index_policy = index_policy
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('aggregate'))
+
+    def _view_function(self):
+        def aggregate_view(request: Request):
+            queryset = self._read_queryset(request)
+            queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
+                                                                    model_cls=self.serializer_cls.Meta.model,
+                                                                    index_policy=self.index_policy)
+            # Only the query applies; results are ordered by their groups.
+            queryset_builder.order_by = None
+            queryset_builder.distinct = None
+            queryset_builder.prefetch_trees = None
+            queryset = queryset_builder.build_queryset(queryset=queryset)
+            aggregation = ModelTypeAggregation.for_request(request=request, model_cls=self.model_cls)
+            response = Response(aggregation.payload(queryset), status=status.HTTP_200_OK)
+            return self._flag_index_violations(response, queryset_builder.index_violations)
+
+        return aggregate_view
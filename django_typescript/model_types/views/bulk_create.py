@@ -0,0 +1,125 @@
+import typing
+
+from django.db import transaction, IntegrityError
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.versions import bump_model_versions
+
+
+# =================================
+# Bulk Create Type View
+# ---------------------------------
+
+class BulkCreateView(ModelView):
+
+    """
+    Create the objects of a list of rows (the request body) with
+    `bulk_create()`, in a single transaction. Rows are validated, including by
+    the `ModelType`'s `validate` method, one by one.
+
+    By default, any invalid row fails the whole request with a 400 response
+    holding the errors of each invalid row, by row index. With the
+    `partial_success=true` query parameter, valid rows are created regardless,
+    and the errors of invalid rows are returned along with them. Rows whose
+    insert violates a database constraint (e.g. two rows with the same unique
+    value) fail the whole request, or with `partial_success`, are returned as
+    errors too.
+
+    Created objects have primary keys only where the database returns them
+    from bulk inserts (e.g. PostgreSQL); elsewhere (e.g. SQLite, MySQL), their
+    primary keys are `null` - unless the rows were inserted one by one. Multi-table inheritance children,
+    which `bulk_create()` does not support, are saved one by one.
+
+    """
+
+    REQUEST_METHOD = 'POST'
+    PARTIAL_SUCCESS_KEY = 'partial_success'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None):
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('bulk-create'))
+
+    def _validate_rows(self, request: Request) -> typing.Tuple[list, dict]:
+        """
+        Return the validated data of each row of the request (`None` for
+        invalid rows), and the errors of the invalid rows, by row index.
+
+        """
+        rows = request.data
+        if not isinstance(rows, list):
+            raise ValidationError({'non_field_errors': ['Expected a list of rows.']})
+        if len(rows) > config.BULK_MAX_ROWS:
+            raise ValidationError({'non_field_errors': [f"At most {config.BULK_MAX_ROWS} rows can be created."]})
+        list_serializer = self._get_serializer(data=rows, many=True, context={'request': request})
+        self.serializer.prime_validator_relations([row for row in rows if isinstance(row, dict)],
+                                                  list_serializer.context)
+        validated_rows = []
+        errors = {}
+        for i, row in enumerate(rows):
+            try:
+                validated_rows.append(list_serializer.child.run_validation(row))
+            except ValidationError as exc:
+                validated_rows.append(None)
+                errors[i] = exc.detail
+        return validated_rows, errors
+
+    def _insert(self, instances: list):
+        if self.model_cls._meta.parents:
+            for instance in instances:
+                instance.save()
+        else:
+            self.model_cls.objects.bulk_create(instances, batch_size=config.BULK_BATCH_SIZE)
+
+    def _create(self, validated_rows: list, errors: dict, partial_success: bool) -> list:
+        """
+        Create the objects of the valid rows, and return the created object
+        of each row (`None` for invalid rows). If inserting them violates a
+        database constraint, the request fails, unless `partial_success`, in
+        which case the rows are inserted again one by one (each in its own
+        savepoint), and the errors of the rows that cannot be inserted are
+        added to `errors`.
+
+        """
+        instances = [self.model_cls(**attrs) if attrs is not None else None for attrs in validated_rows]
+        with transaction.atomic():
+            try:
+                # Only a partial success needs a savepoint to retry the rows from.
+                with transaction.atomic(savepoint=partial_success):
+                    self._insert([instance for instance in instances if instance is not None])
+            except IntegrityError:
+                if not partial_success:
+                    raise
+                instances = [self.model_cls(**attrs) if attrs is not None else None for attrs in validated_rows]
+                for i, instance in enumerate(instances):
+                    if instance is None:
+                        continue
+                    try:
+                        with transaction.atomic():
+                            instance.save(force_insert=True)
+                    except IntegrityError as exc:
+                        instances[i] = None
+                        errors[i] = {'non_field_errors': [str(exc)]}
+            # `bulk_create()` sends no `post_save` signals.
+            bump_model_versions(self.model_cls)
+        return instances
+
+    def _view_function(self):
+        def bulk_create_view(request: Request):
+            partial_success = request.query_params.get(self.PARTIAL_SUCCESS_KEY) in ('true', '1')
+            validated_rows, errors = self._validate_rows(request)
+            if errors and not partial_success:
+                return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+            try:
+                instances = self._create(validated_rows, errors=errors, partial_success=partial_success)
+            except IntegrityError as exc:
+                raise ValidationError({'non_field_errors': [str(exc)]})
+            serializer = self._get_serializer(context={'request': request})
+            data = [serializer.to_representation(instance) if instance is not None else None
+                    for instance in instances]
+            return Response({'data': data, 'errors': errors}, status=status.HTTP_201_CREATED)
+
+        return bulk_create_view
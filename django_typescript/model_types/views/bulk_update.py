@@ -0,0 +1,83 @@
+import typing
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.versions import bump_model_versions
+
+
+# =================================
+# Bulk Update Type View
+# ---------------------------------
+
+class BulkUpdateView(ModelView):
+
+    """
+    Apply per-object partial payloads - a list of `{pk, changes}` items (the
+    request body) - with `bulk_update()`, in a single transaction. Objects
+    are read with one query, and each item is validated against its object.
+    Any invalid item fails the whole request with a 400 response holding the
+    errors of each invalid item, by item index.
+
+    As `bulk_update()`, this neither calls `save()` nor sends model signals.
+
+    """
+
+    REQUEST_METHOD = 'POST'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None):
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('bulk-update'))
+
+    def _items(self, request: Request) -> typing.List[typing.Tuple[typing.Any, dict]]:
+        items = request.data
+        if not isinstance(items, list) or not all(isinstance(item, dict) and 'pk' in item and
+                                                  isinstance(item.get('changes'), dict) for item in items):
+            raise ValidationError({'non_field_errors': ['Expected a list of `{pk, changes}` objects.']})
+        if len(items) > config.BULK_MAX_ROWS:
+            raise ValidationError({'non_field_errors': [f"At most {config.BULK_MAX_ROWS} objects can be updated."]})
+        pk_field = self.model_cls._meta.pk
+        try:
+            return [(pk_field.to_python(item['pk']), item['changes']) for item in items]
+        except (DjangoValidationError, TypeError):
+            raise ValidationError({'non_field_errors': ['Invalid primary key.']})
+
+    def _view_function(self):
+        def bulk_update_view(request: Request):
+            items = self._items(request)
+            instances = self.model_cls.objects.in_bulk([pk for pk, _ in items])
+            context = {'request': request}
+            self.serializer.prime_validator_relations(
+                [changes for _, changes in items] + list(instances.values()), context
+            )
+            errors = {}
+            updated_instances = {}
+            update_fields = set()
+            for i, (pk, changes) in enumerate(items):
+                instance = updated_instances.get(pk, instances.get(pk))
+                if instance is None:
+                    errors[i] = {'pk': ['Object does not exist.']}
+                    continue
+                serializer = self._get_serializer(instance, data=changes, partial=True, context=context)
+                if not serializer.is_valid():
+                    errors[i] = serializer.errors
+                    continue
+                for field_name, value in serializer.validated_data.items():
+                    setattr(instance, field_name, value)
+                    update_fields.add(field_name)
+                updated_instances[pk] = instance
+            if errors:
+                return Response({'errors': errors}, status=status.HTTP_400_BAD_REQUEST)
+            if update_fields:
+                with transaction.atomic():
+                    self.model_cls.objects.bulk_update(list(updated_instances.values()), fields=sorted(update_fields),
+                                                       batch_size=config.BULK_BATCH_SIZE)
+                    bump_model_versions(self.model_cls)
+            return Response({'updated': len(updated_instances)}, status=status.HTTP_200_OK)
+
+        return bulk_update_view
@@ -18,6 +18,6 @@ class CreateView(ModelView):
         def create_view(request):
             serializer = self._get_serializer(data=request.data, context={'request': request})
             serializer.is_valid(raise_exception=True)
-            serializer.save()
-            return Response(serializer.data, status=status.HTTP_201_CREATED)
+            instance = serializer.save()
+            return self._instance_response(request, instance, status_code=status.HTTP_201_CREATED)
         return create_view
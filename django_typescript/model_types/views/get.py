@@ -2,9 +2,12 @@ import json
 
 from django.db import models
 
+from django_typescript import config
 from django_typescript.core import endpoints
 from django_typescript.model_types.view import ModelView, Response, status
 from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
+from django_typescript.model_types.projection import project_queryset
+from django_typescript.model_types.result_cache import ResultCache
 
 
 # =================================
@@ -15,16 +18,28 @@ class GetView(ModelView):
 
     REQUEST_METHOD = 'GET'
 
-    def __init__(self, serializer, serializer_cls, permission_classes=None):
+    def __init__(self, serializer, serializer_cls, permission_classes=None, etag: bool = False,
+                 result_cache: ResultCache = None):
+        self.etag = etag
+        self.result_cache = result_cache
         ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
                            permission_classes=permission_classes,
                            endpoint=endpoints.Endpoint(endpoints.Param, 'get'))
 
     def _view_function(self):
         def get_view(request, pk):
-            queryset = self.model_cls.objects.all()
+            queryset = self._read_queryset(request)
             queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
-                                                                    model_cls=self.serializer_cls.Meta.model)
+                                                                    model_cls=self.serializer_cls.Meta.model,
+                                                                    relation_graph=self.relation_graph)
+            versions = self._versions(queryset_builder)
+            etag = self._etag(request, versions)
+            not_modified = self._not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
+            cached_response = self._cached_response(request, versions, etag)
+            if cached_response is not None:
+                return cached_response
             queryset = queryset_builder.build_queryset(queryset=queryset)
             if queryset_builder.prefetch_trees:
                 serializer_cls = self.serializer.build_prefetch_serializer_tree(
@@ -32,8 +47,13 @@ class GetView(ModelView):
                 )
             else:
                 serializer_cls = self.serializer_cls
+            if config.PROJECT_QUERIES:
+                queryset = project_queryset(queryset, serializer_cls=serializer_cls)
             queryset = queryset.get(pk=pk)
             payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset,
                                                                           many=False)
-            return Response(payload_builder.payload(serializer_cls=serializer_cls))
+            data = payload_builder.payload(serializer_cls=serializer_cls)
+            self._cache_result(request, versions, data)
+            response = Response(data)
+            return self._set_etag(response, etag)
         return get_view
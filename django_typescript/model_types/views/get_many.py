@@ -0,0 +1,81 @@
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
+
+
+# =================================
+# Get Many Type View
+# ---------------------------------
+
+class GetManyView(ModelView):
+
+    """
+    Get the objects of a list of primary keys (the `pks` query parameter)
+    with a single query. Objects are returned in the order of `pks`, along
+    with the primary keys of objects that do not exist.
+
+    """
+
+    REQUEST_METHOD = 'GET'
+    PKS_KEY = 'pks'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None):
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('get-many'))
+
+    def max_rows(self, request) -> int:
+        try:
+            pks = json.loads(request.query_params.get(self.PKS_KEY, '[]'))
+        except ValueError:
+            return 1
+        return min(len(pks), config.GET_MANY_MAX_PKS) if isinstance(pks, list) else 1
+
+    def _pks(self, request: Request) -> list:
+        """
+        Return the (deduplicated) primary keys requested, converted to their
+        Python values.
+
+        """
+        try:
+            pks = json.loads(request.query_params.get(self.PKS_KEY, '[]'))
+        except ValueError:
+            raise ValidationError({self.PKS_KEY: ['Expected a JSON list of primary keys.']})
+        if not isinstance(pks, list):
+            raise ValidationError({self.PKS_KEY: ['Expected a JSON list of primary keys.']})
+        if len(pks) > config.GET_MANY_MAX_PKS:
+            raise ValidationError({self.PKS_KEY: [f"At most {config.GET_MANY_MAX_PKS} primary keys can be requested."]})
+        pk_field = self.model_cls._meta.pk
+        try:
+            return list(dict.fromkeys(pk_field.to_python(pk) for pk in pks))
+        except (DjangoValidationError, TypeError):
+            raise ValidationError({self.PKS_KEY: ['Invalid primary key.']})
+
+    def _view_function(self):
+        def get_many_view(request: Request):
+            pks = self._pks(request)
+            queryset = self._read_queryset(request)
+            queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
+                                                                    model_cls=self.serializer_cls.Meta.model,
+                                                                    relation_graph=self.relation_graph)
+            queryset = queryset_builder.build_queryset(queryset=queryset)
+            if queryset_builder.prefetch_trees:
+                serializer_cls = self.serializer.build_prefetch_serializer_tree(
+                    prefetch_trees=queryset_builder.prefetch_trees
+                )
+                values_coercion_table = None
+            else:
+                serializer_cls = self.serializer_cls
+                values_coercion_table = self.serializer.values_coercion_table
+            payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset,
+                                                                          values_coercion_table=values_coercion_table)
+            return Response(payload_builder.pks_payload(serializer_cls=serializer_cls, pks=pks),
+                            status=status.HTTP_200_OK)
+
+        return get_many_view
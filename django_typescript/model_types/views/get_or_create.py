@@ -1,6 +1,5 @@
 from django_typescript.core import endpoints
 from django_typescript.model_types.view import ModelView, Response, status
-from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
 
 
 # =================================
@@ -23,21 +22,6 @@ class GetOrCreateView(ModelView):
             serializer = self._get_serializer(data={**lookup, **defaults}, context={'request': request})
             serializer.is_valid(raise_exception=True)
             instance, created = self.model_cls.objects.get_or_create(**lookup, defaults=defaults)
-            serializer = self._get_serializer(instance, context={'request': request})
-            if created:
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
-            queryset = self.model_cls.objects.all()
-            queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
-                                                                    model_cls=self.serializer_cls.Meta.model)
-            queryset = queryset_builder.build_queryset(queryset=queryset)
-            if queryset_builder.prefetch_trees:
-                serializer_cls = self.serializer.build_prefetch_serializer_tree(
-                    prefetch_trees=queryset_builder.prefetch_trees
-                )
-            else:
-                serializer_cls = self.serializer_cls
-            queryset = queryset.get(pk=instance.pk)
-            payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset,
-                                                                          many=False)
-            return Response(payload_builder.payload(serializer_cls=serializer_cls))
+            return self._instance_response(request, instance,
+                                           status_code=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
         return get_or_create_view
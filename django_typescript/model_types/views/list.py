@@ -1,11 +1,18 @@
 import json
+import typing
 
+from django.http import StreamingHttpResponse
 from rest_framework.request import Request
 
 from django_typescript.core import endpoints
 from django_typescript.model_types.view import ModelView, Response, status
 from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
 from django_typescript.core.utils.subset_serializer import subset_serializer
+from django_typescript.model_types.count import CountStrategy
+from django_typescript.core.renderers import NDJSONRenderer, renderer_classes
+from django_typescript.model_types.index_policy import IndexPolicy
+from django_typescript.model_types.result_cache import ResultCache
+from django_typescript.core.timeouts import stream_with_query_timeout
 
 
 # =================================
@@ -16,23 +23,68 @@ class ListView(ModelView):
 
     REQUEST_METHOD = 'GET'
 
-    def __init__(self, serializer, serializer_cls, permission_classes=None):
+    def __init__(self, serializer, serializer_cls, permission_classes=None, count_strategy: CountStrategy = None,
+                 index_policy: IndexPolicy = None, etag: bool = False, result_cache: ResultCache = None):
+        self.count_strategy = count_strategy
+        self.index_policy = index_policy
+        self.etag = etag
+        self.result_cache = result_cache
         ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
                            permission_classes=permission_classes, endpoint=endpoints.Endpoint())
 
+    @property
+    def renderer_classes(self):
+        return renderer_classes(NDJSONRenderer)
+
+    def max_rows(self, request) -> typing.Optional[int]:
+        params = request.query_params
+        payload_builder_cls = ModelTypeQuerysetPayloadBuilder
+        if params.get(payload_builder_cls.EXISTS_KEY) == 'true' or params.get(payload_builder_cls.COUNT_KEY) == 'true':
+            return 1
+        if payload_builder_cls.PAGE_NUM_KEY not in params and payload_builder_cls.CURSOR_KEY not in params:
+            return None
+        try:
+            return max(int(params.get(payload_builder_cls.PAGE_SIZE_KEY, payload_builder_cls.DEFAULT_PAGE_SIZE)), 0)
+        except ValueError:
+            return payload_builder_cls.DEFAULT_PAGE_SIZE
+
     def _view_function(self):
         def list_view(request: Request):
-            queryset = self.model_cls.objects.all()
+            queryset = self._read_queryset(request)
             queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
-                                                                    model_cls=self.serializer_cls.Meta.model)
+                                                                    model_cls=self.serializer_cls.Meta.model,
+                                                                    index_policy=self.index_policy,
+                                                                    relation_graph=self.relation_graph)
+            versions = self._versions(queryset_builder)
+            etag = self._etag(request, versions)
+            not_modified = self._not_modified(request, etag)
+            if not_modified is not None:
+                return not_modified
             queryset = queryset_builder.build_queryset(queryset=queryset)
+            cached_response = self._cached_response(request, versions, etag)
+            if cached_response is not None:
+                return self._flag_index_violations(cached_response, queryset_builder.index_violations)
             if queryset_builder.prefetch_trees:
                 serializer_cls = self.serializer.build_prefetch_serializer_tree(
                     prefetch_trees=queryset_builder.prefetch_trees
                 )
+                values_coercion_table = None
             else:
                 serializer_cls = self.serializer_cls
-            payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset)
-            return Response(payload_builder.payload(serializer_cls=serializer_cls), status=status.HTTP_200_OK)
+                values_coercion_table = self.serializer.values_coercion_table
+            payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset,
+                                                                          count_strategy=self.count_strategy,
+                                                                          values_coercion_table=values_coercion_table)
+            if payload_builder.is_streamed:
+                lines = payload_builder.stream_payload(serializer_cls=serializer_cls)
+                if self.query_timeout is not None:
+                    lines = stream_with_query_timeout(lines, seconds=self.query_timeout)
+                response = StreamingHttpResponse(lines, content_type=NDJSONRenderer.media_type)
+            else:
+                data = payload_builder.payload(serializer_cls=serializer_cls)
+                self._cache_result(request, versions, data)
+                response = Response(data, status=status.HTTP_200_OK)
+            self._set_etag(response, etag)
+            return self._flag_index_violations(response, queryset_builder.index_violations)
 
         return list_view
@@ -1,6 +1,7 @@
 from django_typescript.core import endpoints
 from django_typescript.core.views.view import View, Response, status
 from django_typescript.core.utils import underscore_to_dash
+from django_typescript.model_types.routing import ReadRouting
 
 
 # =================================
@@ -11,6 +12,8 @@ class ModelPropertyView(View):
 
     REQUEST_METHOD = 'GET'
 
+    read_routing: ReadRouting = None
+
     def __init__(self, property_name: str, model_cls, permission_classes=None):
         self.model_cls = model_cls
         self.property_name = property_name
@@ -23,7 +26,10 @@ class ModelPropertyView(View):
 
     def _view_function(self):
         def property_view_func(request, pk):
-            obj = self.model_cls.objects.get(pk=pk)
+            queryset = self.model_cls.objects.all()
+            if self.read_routing is not None:
+                queryset = self.read_routing.using(queryset, request)
+            obj = queryset.get(pk=pk)
             output = getattr(obj, self.property_name)
             # If the function returns a Response instance, just return that.
             if isinstance(output, Response):
@@ -0,0 +1,48 @@
+from django.db import transaction
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder
+from django_typescript.model_types.index_policy import IndexPolicy
+
+
+# =================================
+# Query Delete Type View
+# ---------------------------------
+
+class QueryDeleteView(ModelView):
+
+    """
+    Delete every object matched by a `ModelTypeQuery` (the `query` query
+    parameter), and return the number of deleted objects per model. Rows are
+    deleted with a single `DELETE` when no signal receivers or cascades
+    require deleting them in Python.
+
+    Queries matching more than `DJANGO_TS_QUERY_DELETE_MAX_ROWS` objects are
+    rejected, without deleting anything. The matched primary keys are read
+    (and locked, on backends supporting `SELECT ... FOR UPDATE`) and deleted
+    in one transaction, so objects created meanwhile are never deleted.
+
+    """
+
+    REQUEST_METHOD = 'DELETE'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None, index_policy: IndexPolicy = None):
+        self.index_policy = index_policy
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('query-delete'))
+
+    def _view_function(self):
+        def query_delete_view(request: Request):
+            queryset_builder = ModelTypeQuerysetBuilder.for_query_request(request=request, model_cls=self.model_cls,
+                                                                          index_policy=self.index_policy)
+            queryset = queryset_builder.build_queryset(queryset=self.model_cls.objects.all())
+            with transaction.atomic(using=queryset.db):
+                pks = self._capped_pks(queryset, max_rows=config.QUERY_DELETE_MAX_ROWS)
+                deleted, counts = self.model_cls.objects.filter(pk__in=pks).delete()
+            response = Response({'deleted': deleted, 'counts': counts}, status=status.HTTP_200_OK)
+            return self._flag_index_violations(response, queryset_builder.index_violations)
+
+        return query_delete_view
@@ -0,0 +1,64 @@
+from django.db import transaction, IntegrityError
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+
+from django_typescript import config
+from django_typescript.core import endpoints
+from django_typescript.model_types.view import ModelView, Response, status
+from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder
+from django_typescript.model_types.index_policy import IndexPolicy
+from django_typescript.model_types.versions import bump_model_versions
+
+
+# =================================
+# Query Update Type View
+# ---------------------------------
+
+class QueryUpdateView(ModelView):
+
+    """
+    Apply one partial payload (the request body) to every object matched by
+    a `ModelTypeQuery` (the `query` query parameter), with a single
+    `QuerySet.update()`. The payload is validated once; if the `ModelType`
+    has a `validate` method, the payload must include each of its fields.
+
+    As `QuerySet.update()`, this neither calls `save()` nor sends model
+    signals; `auto_now` fields are set to the current time. Queries matching
+    more than `DJANGO_TS_BULK_MAX_ROWS` objects, and updates violating a
+    database constraint (e.g. setting a unique field of several objects), are
+    rejected without updating anything.
+
+    """
+
+    REQUEST_METHOD = 'POST'
+
+    def __init__(self, serializer, serializer_cls, permission_classes=None, index_policy: IndexPolicy = None):
+        self.index_policy = index_policy
+        ModelView.__init__(self, serializer=serializer, serializer_cls=serializer_cls,
+                           permission_classes=permission_classes, endpoint=endpoints.Endpoint('query-update'))
+
+    def _view_function(self):
+        def query_update_view(request: Request):
+            queryset_builder = ModelTypeQuerysetBuilder.for_query_request(request=request, model_cls=self.model_cls,
+                                                                          index_policy=self.index_policy)
+            serializer = self._get_serializer(data=request.data, partial=True, context={'request': request})
+            serializer.is_valid(raise_exception=True)
+            if not serializer.validated_data:
+                raise ValidationError({'non_field_errors': ['No fields to update.']})
+            queryset = queryset_builder.build_queryset(queryset=self.model_cls.objects.all())
+            changes = dict(serializer.validated_data)
+            now = timezone.now()
+            changes.update({field.attname: now for field in self.model_cls._meta.concrete_fields
+                            if getattr(field, 'auto_now', False)})
+            try:
+                with transaction.atomic(using=queryset.db):
+                    pks = self._capped_pks(queryset, max_rows=config.BULK_MAX_ROWS)
+                    updated = self.model_cls.objects.filter(pk__in=pks).update(**changes)
+                    bump_model_versions(self.model_cls)
+            except IntegrityError as exc:
+                raise ValidationError({'non_field_errors': [str(exc)]})
+            response = Response({'updated': updated}, status=status.HTTP_200_OK)
+            return self._flag_index_violations(response, queryset_builder.index_violations)
+
+        return query_update_view
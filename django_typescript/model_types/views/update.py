@@ -1,6 +1,8 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
 from django_typescript.core import endpoints
 from django_typescript.model_types.view import ModelView, Response, status
-from django_typescript.model_types.queryset import ModelTypeQuerysetBuilder, ModelTypeQuerysetPayloadBuilder
 
 
 # =================================
@@ -20,6 +22,48 @@ class UpdateView(ModelView):
     def model_cls(self):
         return self.serializer_cls.Meta.model
 
+    @staticmethod
+    def _saves_fields_only(serializer, instance) -> bool:
+        """
+        Whether saving `serializer` only sets (concrete, non many-to-many)
+        fields of `instance`: its class does not override `update()`, and its
+        validated data holds no many-to-many, reverse or nested writes.
+
+        """
+        if type(serializer).update is not serializers.ModelSerializer.update:
+            return False
+        for field_name in serializer.validated_data:
+            try:
+                field = instance._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                return False
+            if not field.concrete or field.many_to_many:
+                return False
+        return True
+
+    @classmethod
+    def _save_changes(cls, serializer, instance):
+        """
+        Save the validated changes of `serializer` to `instance`, updating only
+        the fields whose values changed (and `auto_now` fields). Nothing is
+        saved if no value changed. Serializers overriding `update()`, or
+        writing many-to-many or nested fields, are saved with `save()`.
+
+        """
+        if not cls._saves_fields_only(serializer, instance):
+            serializer.save()
+            return
+        validated_data = serializer.validated_data
+        serializers.raise_errors_on_nested_writes('update', serializer, validated_data)
+        changed_fields = [field_name for field_name, value in validated_data.items()
+                          if getattr(instance, field_name) != value]
+        if not changed_fields:
+            return
+        for field_name in changed_fields:
+            setattr(instance, field_name, validated_data[field_name])
+        auto_now_fields = [field.name for field in instance._meta.concrete_fields if getattr(field, 'auto_now', False)]
+        instance.save(update_fields=changed_fields + auto_now_fields)
+
     def _view_function(self):
 
         def _update_view(request, pk):
@@ -36,21 +80,7 @@ class UpdateView(ModelView):
             serializer = self._get_serializer(data=request.data, context={'request': request}, partial=True,
                                               instance=instance)
             serializer.is_valid(raise_exception=True)
-            serializer.save()
-
-            queryset = self.model_cls.objects.all()
-            queryset_builder = ModelTypeQuerysetBuilder.for_request(request=request,
-                                                                    model_cls=self.serializer_cls.Meta.model)
-            queryset = queryset_builder.build_queryset(queryset=queryset)
-            if queryset_builder.prefetch_trees:
-                serializer_cls = self.serializer.build_prefetch_serializer_tree(
-                    prefetch_trees=queryset_builder.prefetch_trees
-                )
-            else:
-                serializer_cls = self.serializer_cls
-            queryset = queryset.get(pk=pk)
-            payload_builder = ModelTypeQuerysetPayloadBuilder.for_request(request=request, queryset=queryset,
-                                                                          many=False)
-            return Response(payload_builder.payload(serializer_cls=serializer_cls))
+            self._save_changes(serializer, instance)
+            return self._instance_response(request, instance)
 
         return update_view
@@ -33,10 +33,9 @@ class ReverseRelFieldTranspiler(object):
 
     @property
     def prefetch_type(self):
-        if self.is_one_to_one:
-            base_key = self.model_field.name
-            related_prefetch_type = model_prefetch_type_name(self.model_field.related_model)
-            return f"'{base_key}' | {{{base_key}: {related_prefetch_type} | {related_prefetch_type}[]}}"
+        base_key = self.model_field.name
+        related_prefetch_type = model_prefetch_type_name(self.model_field.related_model)
+        return f"'{base_key}' | {{{base_key}: {related_prefetch_type} | {related_prefetch_type}[]}}"
 
     def getter_setter_type_declaration(self):
         if self.is_one_to_one:
@@ -60,6 +59,10 @@ class ReverseRelFieldTranspiler(object):
     def name(self):
         return self.model_field.name
 
+    @property
+    def model_name(self):
+        return self.model_field.related_model.__name__
+
     @property
     def queryset_name(self):
         return model_queryset_name(model_cls=self.model_field.related_model)
@@ -178,8 +178,7 @@ class ModelTypeTranspiler(object):
             if field_transpiler.model_field.related_model in self.model_pool:
                 prefetch_parts.append(field_transpiler.prefetch_type)
         for field_transpiler in self.reverse_rel_fields:
-            if field_transpiler.is_one_to_one:
-                prefetch_parts.append(field_transpiler.prefetch_type)
+            prefetch_parts.append(field_transpiler.prefetch_type)
         if self.model_type.property_fields is not None:
             prefetch_parts += [f"'{f}'" for f in self.model_type.property_fields]
         if not prefetch_parts:
@@ -254,11 +253,17 @@ class ModelTypeTranspiler(object):
             # URLS
             update_url=self._url_prefix + self.model_type.update_view.endpoint.url(TYPESCRIPT_THIS_PK_REF),
             get_url=self._url_prefix + self.model_type.get_view.endpoint.url(TYPESCRIPT_ARG_PK_REF),
+            bulk_create_url=self._url_prefix + self.model_type.bulk_create_view.endpoint.url(),
+            query_update_url=self._url_prefix + self.model_type.query_update_view.endpoint.url(),
+            bulk_update_url=self._url_prefix + self.model_type.bulk_update_view.endpoint.url(),
+            query_delete_url=self._url_prefix + self.model_type.query_delete_view.endpoint.url(),
+            get_many_url=self._url_prefix + self.model_type.get_many_view.endpoint.url(),
             get_or_create_url=self._url_prefix + self.model_type.get_or_create_view.endpoint.url(),
             create_url=self._url_prefix + self.model_type.create_view.endpoint.url(TYPESCRIPT_ARG_PK_REF),
             # Todo: fix hacky
             list_url=self._url_prefix + self.model_type.list_view.endpoint.url().replace('//', '/'),
             delete_url=self._url_prefix + self.model_type.delete_view.endpoint.url(TYPESCRIPT_THIS_PK_REF),
+            aggregate_url=self._url_prefix + self.model_type.aggregate_view.endpoint.url(),
             # -----
             model_interface_types=self.model_interface_types(),
             model_class_types=self.model_class_types(),
@@ -1,6 +1,14 @@
 import fetch, {FetchError} from 'node-fetch';
 
-import {HeaderMiddleware, RequestMethod, ServerResponse} from "./types";
+import {
+    HeaderMiddleware,
+    QueryTimeoutData,
+    RequestMethod,
+    ResponseData,
+    ResponseStatusCode,
+    ServerErrorHttpStatusCodes,
+    ServerResponse
+} from "./types";
 
 
 // -------------------------
@@ -9,14 +17,20 @@ import {HeaderMiddleware, RequestMethod, ServerResponse} from "./types";
 // -------------------------
 
 
+// The maximum number of GET responses kept for revalidation with their ETags.
+const ETAG_CACHE_SIZE = 500;
+
+
 export class ServerClient {
 
     public baseUrl: string;
     public headerMiddleware: HeaderMiddleware;
+    private etagCache: Map<string, [string, any]>;
 
     constructor() {
         this.baseUrl = '';
-        this.headerMiddleware = (header) => header
+        this.headerMiddleware = (header) => header;
+        this.etagCache = new Map();
     }
 
     public setup(baseUrl: string, headerMiddleware?: HeaderMiddleware){
@@ -26,11 +40,30 @@ export class ServerClient {
         }
     }
 
+    /**
+     * Send a request to given url. GET responses carrying an ETag are kept,
+     * and sent back to the server with `If-None-Match`; if the server answers
+     * 304 (Not Modified), the kept data is returned with status 200.
+     *
+     */
     public request(url, requestOptions: object): Promise<ServerResponse>{
 
+        const isGet = requestOptions['method'] === RequestMethod.GET;
+        const cached = isGet ? this.etagCache.get(url) : undefined;
+        if (cached){
+            requestOptions['headers'] = {...requestOptions['headers'], 'If-None-Match': cached[0]};
+        }
         return ((fetch(url, requestOptions)
                 .then(async res => {
-                    return [await res.json(), res.status, undefined]
+                    if (res.status === 304 && cached){
+                        return [cached[1], 200, undefined]
+                    }
+                    const data = await res.json();
+                    const etag = res.headers.get('ETag');
+                    if (isGet && res.status === 200 && etag){
+                        this._cacheEtag(url, etag, data);
+                    }
+                    return [data, res.status, undefined]
                 })
                 .catch(err => {
                     return [undefined, undefined, err]
@@ -38,6 +71,58 @@ export class ServerClient {
         ));
     }
 
+    /**
+     * Send a GET request for newline delimited JSON to given url, and yield
+     * each parsed line as it arrives. Lines are parsed incrementally, so the
+     * full response is never held in memory. Throws if the response status
+     * is not 200, or - with a `FetchError` of type `'query_timeout'` - if a
+     * query exceeded its time limit while the response was streamed.
+     *
+     */
+    public async *stream(url: string, urlQuery?): AsyncGenerator<any>{
+        const headers = {'Accept': 'application/x-ndjson'};
+        const res: any = await fetch(this._buildUrl(url, urlQuery), this._requestOptions(RequestMethod.GET, headers));
+        if (res.status !== 200){
+            throw new FetchError(`Stream request failed with status ${res.status}: ${await res.text()}`, 'stream');
+        }
+        const decoder = new TextDecoder('utf-8');
+        let buffer = '';
+        for await (const chunk of readChunks(res.body)){
+            buffer += decoder.decode(chunk, {stream: true});
+            let newlineIndex = buffer.indexOf('\n');
+            while (newlineIndex !== -1){
+                const line = buffer.slice(0, newlineIndex);
+                buffer = buffer.slice(newlineIndex + 1);
+                if (line.trim()){
+                    yield parseStreamLine(line)
+                }
+                newlineIndex = buffer.indexOf('\n');
+            }
+        }
+        buffer += decoder.decode();
+        if (buffer.trim()){
+            yield parseStreamLine(buffer)
+        }
+    }
+
+    private _cacheEtag(url: string, etag: string, data: any){
+        // Maps iterate in insertion order, so re-inserting keeps the most
+        // recently used entries last, and the least recently used first.
+        this.etagCache.delete(url);
+        this.etagCache.set(url, [etag, data]);
+        if (this.etagCache.size > ETAG_CACHE_SIZE){
+            this.etagCache.delete(this.etagCache.keys().next().value);
+        }
+    }
+
+    /**
+     * Forget all kept GET responses.
+     *
+     */
+    public clearEtagCache(){
+        this.etagCache.clear();
+    }
+
     private _requestOptions(requestMethod: RequestMethod, headers?: object, body?: any | undefined): object{
         if (!headers){
             headers = {}
@@ -83,8 +168,8 @@ export class ServerClient {
      * Send a DELETE request to given url.
      *
      */
-    public async delete(url: string, postData?: object) {
-        return this.request(this._buildUrl(url), this._requestOptions(RequestMethod.DELETE));
+    public async delete(url: string, postData?: object, urlQuery?) {
+        return this.request(this._buildUrl(url, urlQuery), this._requestOptions(RequestMethod.DELETE));
     }
 
     private _buildUrl(url: string, urlQuery?): string {
@@ -96,6 +181,52 @@ export class ServerClient {
     }
 }
 
+/**
+ * Whether a response is the server's answer to a query exceeding its time
+ * limit - rather than a validation error, or a timeout of a proxy in front of
+ * the server. Retrying the same request is likely to time out again.
+ *
+ */
+export function isQueryTimeout(responseData: ResponseData,
+                               statusCode: ResponseStatusCode): responseData is QueryTimeoutData{
+    return statusCode === ServerErrorHttpStatusCodes.HTTP_504_GATEWAY_TIMEOUT
+        && !!responseData && responseData.code === 'query_timeout';
+}
+
+/**
+ * Parse a line of a streamed response. The server ends a stream whose query
+ * exceeded its time limit with an `{"__error__": QueryTimeoutData}` line.
+ *
+ */
+function parseStreamLine(line: string): any{
+    const data = JSON.parse(line);
+    if (data && data.__error__ && data.__error__.code === 'query_timeout'){
+        throw new FetchError(data.__error__.detail, 'query_timeout');
+    }
+    return data
+}
+
+/**
+ * Iterate over the chunks of a response body, which is a Node stream (async
+ * iterable) for node-fetch and a `ReadableStream` for browser fetch.
+ *
+ */
+async function* readChunks(body: any): AsyncGenerator<Uint8Array>{
+    if (body.getReader){
+        const reader = body.getReader();
+        while (true){
+            const {done, value} = await reader.read();
+            if (done){
+                return
+            }
+            yield value
+        }
+    }
+    for await (const chunk of body){
+        yield chunk
+    }
+}
+
 // -------------------------
 // List Query
 //
@@ -79,11 +79,41 @@ export interface BulkServerValidationErrors{
     [index: number]: ServerValidationErrors
 }
 
+// The result of a bulk create: the created object of each row (`null` for
+// invalid rows), and the validation errors of invalid rows, by row index.
+// Created objects' primary keys are `null` on databases that do not return
+// them from bulk inserts (e.g. SQLite, MySQL).
+export interface BulkCreateResult<M>{
+    objects: Array<M | null>,
+    errors: BulkServerValidationErrors
+}
+
+// The result of a query delete: the total number of deleted objects, and the
+// number deleted per model label (including cascades), e.g. `'app.Thing'`.
+export interface DeleteResult{
+    deleted: number,
+    counts: {[modelLabel: string]: number}
+}
+
+// The changes to make to the object of `pk`, in a bulk update.
+export interface BulkUpdateItem<PrimaryKeyType, Fields>{
+    pk: PrimaryKeyType,
+    changes: Partial<Fields>
+}
+
 // Structure of data returned by DRF if there is a permission error.
 export interface PermissionDeniedData{
     message: string,
 }
 
+// Structure of data returned (with status 504) if a query of the request
+// exceeded the view's time limit, of `timeout` seconds.
+export interface QueryTimeoutData{
+    code: 'query_timeout',
+    detail: string,
+    timeout: number
+}
+
 export type HeaderMiddleware = (header: object) => object;
 
 export enum RequestMethod{
@@ -93,11 +123,27 @@ export enum RequestMethod{
     DELETE='DELETE'
 }
 
-// Generic type for paginated data.
+// Strategies the server can use to count paginated results.
+export type CountStrategyName = 'exact' | 'capped' | 'cached' | 'estimated' | 'none';
+
+// Generic type for paginated data. `num_results`/`num_pages` are `null` if no
+// count was made. If `count_exact` is false, `num_results` is a lower bound
+// or an estimate (e.g. display a capped count as "1000+"). `cached` counts,
+// which may be stale, are never exact.
 export interface PaginatedData<DataType>{
-    num_results: number,
-    num_pages: number,
+    num_results: number | null,
+    num_pages: number | null,
     page: number,
+    count_strategy: CountStrategyName,
+    count_exact: boolean,
+    data: DataType[]
+}
+
+// Generic type for cursor (keyset) paginated data. A `null` cursor means there
+// is no page in that direction.
+export interface CursorPaginatedData<DataType>{
+    next: string | null,
+    prev: string | null,
     data: DataType[]
 }
 
@@ -159,6 +205,44 @@ export type QuerysetValuesList<ModelFields> = Array<Array<valueof<Partial<ModelF
 
 export type QuerysetModelList<Model> = Model[]
 
+// Objects fetched by primary key, keyed (in the requested order) by primary
+// key, and the primary keys of objects that do not exist.
+export interface GetManyResult<PrimaryKeyType, M>{
+    objects: Map<PrimaryKeyType, M>,
+    missing: PrimaryKeyType[]
+}
+
+// Aggregate functions the server runs in SQL.
+export type AggregateFunction = 'count' | 'sum' | 'avg' | 'min' | 'max';
+
+// An aggregate of a (related) field, e.g. `{fn: 'sum', field: 'price'}`. The
+// field may be omitted for a count of rows.
+export interface AggregateSpec<Fields>{
+    fn: AggregateFunction,
+    field?: keyof Fields | string,
+    distinct?: boolean
+}
+
+export type DateTruncKind = 'year' | 'quarter' | 'month' | 'week' | 'day' | 'hour' | 'minute' | 'second';
+
+// A date truncation bucket to group by, e.g. `{field: 'created', trunc: 'month'}`.
+// Bucket values are returned under `alias`, which defaults to `<field>_<trunc>`.
+export interface DateBucket<Fields>{
+    field: keyof Fields | string,
+    trunc: DateTruncKind,
+    alias?: string
+}
+
+export type GroupBy<Fields> = keyof Fields | string | DateBucket<Fields>
+
+// Aggregate values by alias. Decimal values (e.g. sums of `DecimalField`s) are
+// strings, unless DRF's `COERCE_DECIMAL_TO_STRING` is disabled, and aggregates
+// of empty sets are `null`.
+export type AggregateResult<Specs> = {[Alias in keyof Specs]: number | string | null}
+
+// One row per group: the group values, and the group's aggregate values.
+export type GroupedAggregateResult<Specs> = Array<AggregateResult<Specs> & {[group: string]: any}>
+
 
 // -------------------------
 // Abstract Model Types
@@ -25,6 +25,9 @@ export class __$queryset_name__{
     protected _valuesFields?: Array<keyof __$field_interface_name__>;
     protected _exists?: boolean;
     protected  _count?: boolean;
+    protected _nextCursor?: string | null;
+    protected _prevCursor?: string | null;
+    protected _countStrategy?: CountStrategyName;
 
     constructor(lookups: __$lookups_interface_name__ = {}, excludedLookups: __$lookups_interface_name__ = {}){
         this.lookups = lookups;
@@ -36,6 +39,7 @@ export class __$queryset_name__{
         clone.lookups = this.lookups;
         clone._prefetch = this._prefetch;
         clone._orderBy = this._orderBy;
+        clone._countStrategy = this._countStrategy;
         clone._or = JSON.parse(JSON.stringify(this._or));
         clone.excludedLookups = this.excludedLookups;
         return clone;
@@ -94,6 +98,27 @@ export class __$queryset_name__{
         return [undefined, responseData, statusCode, err]
     }
 
+    /**
+     * Get the objects of `primaryKeys` with a single request (and query).
+     *
+     */
+    public static async getMany(primaryKeys: __$pk_type__[], ...prefetchKeys: __$prefetch_type_name__[]): Promise<ServerPayload<GetManyResult<__$pk_type__, __$model_name__>>>{
+        let urlQuery = "pks=" + encodeURIComponent(JSON.stringify(primaryKeys));
+        if (prefetchKeys.length){
+            urlQuery += "&prefetch=" + JSON.stringify(prefetchKeys)
+        }
+        let [responseData, statusCode, err] = await serverClient.get(`'{{ get_many_url }}'`, urlQuery);
+        if (statusCode === 200){
+            const objects = new Map<__$pk_type__, __$model_name__>();
+            responseData.data.forEach((data) => {
+                const instance = new __$model_name__(data);
+                objects.set(instance.pk(), instance);
+            });
+            return [{objects, missing: responseData.missing}, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
     public static async getOrCreate(lookup:Partial<__$field_interface_name__>,  defaults: Partial<__$field_interface_name__> = {}, ...prefetchKeys: __$prefetch_type_name__[]): Promise<ServerPayload<[__$model_name__, boolean]>>{
         const data = {lookup, defaults};
          let urlQuery = '';
@@ -120,6 +145,69 @@ export class __$queryset_name__{
         return [undefined, responseData, statusCode, err]
     }
 
+    /**
+     * Create the objects of `rows` with a single request, and a single
+     * transaction. If any row is invalid, nothing is created and the errors
+     * of each invalid row are returned with a 400 status, unless
+     * `partialSuccess`, in which case the valid rows are created regardless,
+     * and rows violating a database constraint are returned as errors too.
+     * The created objects' primary keys are `null` on databases that do not
+     * return them from bulk inserts (e.g. SQLite, MySQL).
+     *
+     */
+    public static async bulkCreate(rows: Partial<__$field_interface_name__>[], partialSuccess: boolean = false): Promise<ServerPayload<BulkCreateResult<__$model_name__>>>{
+        const urlQuery = partialSuccess ? "partial_success=true" : undefined;
+        let [responseData, statusCode, err] = await serverClient.post(`'{{ bulk_create_url }}'`, rows, urlQuery);
+        if (statusCode === 201){
+            const objects = responseData.data.map((data) => data === null ? null : new __$model_name__(data));
+            return [{objects, errors: responseData.errors}, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
+    /**
+     * Apply the changes of each of `items` to its object with a single
+     * request, and a single transaction. If any item is invalid, nothing is
+     * updated and the errors of each invalid item are returned with a 400
+     * status. Resolves to the number of updated objects.
+     *
+     */
+    public static async bulkUpdate(items: BulkUpdateItem<__$pk_type__, __$field_interface_name__>[]): Promise<ServerPayload<number>>{
+        let [responseData, statusCode, err] = await serverClient.post(`'{{ bulk_update_url }}'`, items);
+        if (statusCode === 200){
+            return [responseData.updated, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
+    /**
+     * Set `values` on every object matched by this queryset, with a single
+     * SQL `UPDATE`. Resolves to the number of updated objects.
+     *
+     */
+    public async update(values: Partial<__$field_interface_name__>): Promise<ServerPayload<number>>{
+        const urlQuery = "query=" + JSON.stringify(this.serializeQuery());
+        let [responseData, statusCode, err] = await serverClient.post(`'{{ query_update_url }}'`, values, urlQuery);
+        if (statusCode === 200){
+            return [responseData.updated, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
+    /**
+     * Delete every object matched by this queryset (and cascades). The server
+     * rejects queries matching more than its maximum number of objects.
+     *
+     */
+    public async delete(): Promise<ServerPayload<DeleteResult>>{
+        const urlQuery = "query=" + JSON.stringify(this.serializeQuery());
+        let [responseData, statusCode, err] = await serverClient.delete(`'{{ query_delete_url }}'`, undefined, urlQuery);
+        if (statusCode === 200){
+            return [responseData, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
     public async values(...fields: Array<keyof __$field_interface_name__>): Promise<ServerDataPayload<QuerysetValuesList<__$field_interface_name__>>>{
         this._valuesFields = fields;
         return await this._retrieve();
@@ -135,6 +223,11 @@ export class __$queryset_name__{
         return this
     }
 
+    public countStrategy(strategy: CountStrategyName): this{
+        this._countStrategy = strategy;
+        return this
+    }
+
     public distinct(...fields:Array<keyof __$field_interface_name__>): this{
         this._distinct = fields;
         return this
@@ -161,6 +254,61 @@ export class __$queryset_name__{
         return [undefined, responseData, statusCode, err]
     }
 
+    public async retrieveCursor(cursor: string = '', pageSize: number = 25): Promise<ServerPayload<CursorPaginatedData<__$model_name__>>>{
+        let [responseData, statusCode, err] = await this._retrieve(undefined, pageSize, cursor);
+
+        if (statusCode in SuccessfulHttpStatusCodes){
+            this._nextCursor = responseData.next;
+            this._prevCursor = responseData.prev;
+            return [{
+            ...responseData,
+            data: responseData.data.map((data) => new __$model_name__(data) )
+        }, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
+    public hasNextPage(): boolean{
+        return Boolean(this._nextCursor)
+    }
+
+    public hasPrevPage(): boolean{
+        return Boolean(this._prevCursor)
+    }
+
+    public async nextPage(pageSize: number = 25): Promise<ServerPayload<CursorPaginatedData<__$model_name__>>>{
+        if (this._nextCursor === undefined){
+            return this.retrieveCursor('', pageSize)
+        }
+        if (this._nextCursor === null){
+            return [undefined, undefined, undefined, undefined]
+        }
+        return this.retrieveCursor(this._nextCursor, pageSize)
+    }
+
+    public async prevPage(pageSize: number = 25): Promise<ServerPayload<CursorPaginatedData<__$model_name__>>>{
+        if (!this._prevCursor){
+            return [undefined, undefined, undefined, undefined]
+        }
+        return this.retrieveCursor(this._prevCursor, pageSize)
+    }
+
+    /**
+     * Stream the matching objects as they are received, rather than
+     * waiting for (and holding) the whole result.
+     *
+     */
+    public async *stream(): AsyncGenerator<__$model_name__>{
+        for await (const data of serverClient.stream(`'{{ list_url}}'`, this._urlQuery())){
+            yield new __$model_name__(data)
+        }
+    }
+
+    public async *streamValues(...fields: Array<keyof __$field_interface_name__>): AsyncGenerator<Partial<__$field_interface_name__>>{
+        this._valuesFields = fields;
+        yield* serverClient.stream(`'{{ list_url}}'`, this._urlQuery())
+    }
+
     public async exists(): Promise<ServerPayload<boolean>>{
         this._exists = true;
         let [responseData, statusCode, err] = await this._retrieve();
@@ -179,7 +327,36 @@ export class __$queryset_name__{
          return [undefined, responseData, statusCode, err]
     }
 
-    private async _retrieve(pageNum?: number, pageSize?: number): Promise<ServerResponse>{
+    /**
+     * Aggregate the matching objects in SQL, e.g.
+     * `aggregate({total: {fn: 'sum', field: 'price'}, n: {fn: 'count'}})`.
+     *
+     */
+    public async aggregate<Specs extends {[alias: string]: AggregateSpec<__$field_interface_name__>}>(aggregates: Specs): Promise<ServerPayload<AggregateResult<Specs>>>{
+        return this._aggregate(aggregates)
+    }
+
+    /**
+     * Aggregate the matching objects per group of `groupBy` values - fields
+     * and/or date buckets, e.g. `[{field: 'created', trunc: 'month'}]`.
+     *
+     */
+    public async groupBy<Specs extends {[alias: string]: AggregateSpec<__$field_interface_name__>}>(groupBy: GroupBy<__$field_interface_name__>[], aggregates: Specs): Promise<ServerPayload<GroupedAggregateResult<Specs>>>{
+        return this._aggregate(aggregates, groupBy)
+    }
+
+    private async _aggregate(aggregates: object, groupBy?: GroupBy<__$field_interface_name__>[]): Promise<ServerPayload<any>>{
+        let urlQuery = "query=" + JSON.stringify(this.serializeQuery());
+        urlQuery += "&aggregates=" + encodeURIComponent(JSON.stringify(aggregates));
+        if (groupBy){urlQuery += "&group_by=" + encodeURIComponent(JSON.stringify(groupBy))}
+        let [responseData, statusCode, err] = await serverClient.get(`'{{ aggregate_url }}'`, urlQuery);
+        if (statusCode in SuccessfulHttpStatusCodes){
+            return [responseData, responseData, statusCode, err]
+        }
+        return [undefined, responseData, statusCode, err]
+    }
+
+    private _urlQuery(pageNum?: number, pageSize?: number, cursor?: string): string{
         let urlQuery = "query=" + JSON.stringify(this.serializeQuery());
         if (this._prefetch){urlQuery += "&prefetch=" + JSON.stringify(this._prefetch)}
         if (this._orderBy){urlQuery += "&order_by=" + JSON.stringify(this._orderBy)}
@@ -189,7 +366,13 @@ export class __$queryset_name__{
         if (this._valuesFields){urlQuery += "&values=" + JSON.stringify(this._valuesFields)}
         if (pageNum){urlQuery += "&page=" + pageNum}
         if (pageSize){urlQuery += "&pageSize=" + pageSize}
-        let [responseData, statusCode, err] = await serverClient.get(`'{{ list_url}}'`, urlQuery);
+        if (this._countStrategy){urlQuery += "&count_strategy=" + this._countStrategy}
+        if (cursor !== undefined){urlQuery += "&cursor=" + encodeURIComponent(cursor)}
+        return urlQuery
+    }
+
+    private async _retrieve(pageNum?: number, pageSize?: number, cursor?: string): Promise<ServerResponse>{
+        let [responseData, statusCode, err] = await serverClient.get(`'{{ list_url}}'`, this._urlQuery(pageNum, pageSize, cursor));
         return [responseData, statusCode, err]
     }
 
@@ -219,8 +402,27 @@ export class __$model_name__ implements __$field_interface_name__{
          /*<{{ field_schemas }}>*/
     }
 
+    // Prefetched reverse relation objects, keyed by relation name.
+    protected _prefetched: {[relationName: string]: any[]} = {};
+
     constructor(data: __$field_interface_name__){
-        Object.assign(this, data);
+        const fieldData: any = {...data};
+        /*<{% for reverse_relation in reverse_relations %}
+        if (Array.isArray(fieldData['{{ reverse_relation.name }}'])){
+            this._prefetched['{{ reverse_relation.name }}'] = fieldData['{{ reverse_relation.name }}'].map((d) => new {{ reverse_relation.model_name }}(d));
+            delete fieldData['{{ reverse_relation.name }}'];
+        }
+        {% endfor %}>*/
+        Object.assign(this, fieldData);
+    }
+
+    /**
+     * Return the prefetched objects of the reverse relation `relationName`,
+     * or `undefined` if that relation was not prefetched.
+     *
+     */
+    public prefetched(relationName: string): any[] | undefined{
+        return this._prefetched[relationName]
     }
 
     static objects = __$queryset_name__;
@@ -3,6 +3,16 @@ import * as _ from 'lodash'
 import {serverClient} from './client'
 import {
     PaginatedData,
+    CursorPaginatedData,
+    CountStrategyName,
+    GetManyResult,
+    BulkCreateResult,
+    BulkUpdateItem,
+    DeleteResult,
+    AggregateSpec,
+    AggregateResult,
+    GroupedAggregateResult,
+    GroupBy,
     PrimaryKey,
     foreignKeyField,
 	propertyField,
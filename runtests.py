@@ -34,7 +34,12 @@ def run_tests(*test_args):
             'default': {
                 'ENGINE': 'django.db.backends.sqlite3',
                 'NAME': ':memory:'
-            }
+            },
+            # A stand-in read replica (it does not replicate) for read routing tests.
+            'replica': {
+                'ENGINE': 'django.db.backends.sqlite3',
+                'NAME': ':memory:'
+            },
         },
         SITE_ID=1,
         SECRET_KEY='not very secret in tests',
@@ -12,4 +12,5 @@ setup(name='django-typescript',
                         'jinja2',
                         'pyparsing'
                         ],
+      extras_require={'fast_json': ['orjson']},
       zip_safe=False)
\ No newline at end of file
@@ -55,3 +55,9 @@ class GenericModel(TestModel):
 class TimestampedModel(TestModel):
     name = models.CharField(null=True, max_length=200)
     timestamp = models.DateTimeField(null=True)
+    modified = models.DateTimeField(auto_now=True)
+    price = models.DecimalField(null=True, max_digits=8, decimal_places=2)
+
+    @property
+    def title(self):
+        return (self.name or '').title()
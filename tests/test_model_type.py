@@ -1,8 +1,15 @@
 from django.test import TestCase
+from rest_framework.exceptions import ValidationError
 from rest_framework import serializers
 
 from django_typescript.model_types.model_type import ModelType
 from django_typescript.model_types.validator import ModelTypeValidator
+from django_typescript.model_types.serializer import PREFETCH_SERIALIZER_CACHE
+from django_typescript.model_types.queryset import ModelTypeQuery
+from django_typescript.model_types.query_plan import QUERY_PLAN_CACHE, validate_lookup_path
+from django_typescript.model_types.query_normalizer import UNION_VERDICT_CACHE
+from django_typescript.model_types.index_policy import IndexPolicy, INDEX_VERDICT_CACHE, INDEXED_FIELDS_CACHE
+from django_typescript.model_types.projection import serializer_projection, project_queryset
 from django_typescript import interface
 
 from .models import Thing, ThingChild
@@ -45,9 +52,168 @@ class TestModelType(TestCase):
         serializer = ThingChildModelType.as_type().serializer_cls()
         serializer.validate({'parent_id': parent_thing.id})
 
+    def test_resolve_forward_relations_batched(self):
+        parents = [Thing.objects.create() for _ in range(3)]
+
+        class ThingChildModelType(interface.ModelType, model_cls=ThingChild):
+
+            def validate(self_, parent):
+                self.assertTrue(isinstance(parent, Thing))
+
+        serializer = ThingChildModelType.as_type().serializer
+        rows = [{'parent_id': parent.id, 'name': 'child'} for parent in parents * 2]
+        context = {}
+        # One query for the related objects of every row.
+        with self.assertNumQueries(1):
+            serializer.prime_validator_relations(rows, context)
+            for row in rows:
+                self.assertTrue(serializer.base_serializer_cls(data=row, context=context).is_valid())
+        # Partial updates resolve the instance's related object, which is memoized too.
+        child = ThingChild.objects.create(parent=parents[0])
+        child = ThingChild.objects.get(pk=child.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.base_serializer_cls(child, data={'name': 'a'}, partial=True,
+                                                           context=context).is_valid())
+        invalid_serializer = serializer.base_serializer_cls(data={'parent_id': 0}, context=context)
+        self.assertFalse(invalid_serializer.is_valid())
+        self.assertIn('parent_id', invalid_serializer.errors)
+
     def test_foreign_key(self):
         parent_thing = Thing.objects.create()
         model_type = ModelType(model_cls=ThingChild)
         child_thing = model_type.serializer_cls().create({'parent_id': parent_thing.id})
         self.assertTrue(child_thing.parent is not None)
         self.assertEqual(child_thing.parent.id, parent_thing.id)
+
+    def test_prefetch_serializer_cache(self):
+        model_type = ModelType(model_cls=ThingChild)
+        PREFETCH_SERIALIZER_CACHE.clear()
+        serializer_cls = model_type.serializer.build_prefetch_serializer_tree(prefetch_trees=['parent'])
+        cached_serializer_cls = model_type.serializer.build_prefetch_serializer_tree(prefetch_trees=['parent'])
+        self.assertIs(serializer_cls, cached_serializer_cls)
+        self.assertEqual(PREFETCH_SERIALIZER_CACHE.hits, 1)
+        self.assertEqual(PREFETCH_SERIALIZER_CACHE.misses, 1)
+        self.assertIn('parent', serializer_cls().fields)
+        interface.Interface.clear_caches()
+        self.assertEqual(len(PREFETCH_SERIALIZER_CACHE), 0)
+
+    def test_query_plan_cache(self):
+        QUERY_PLAN_CACHE.clear()
+        thing_1 = Thing.objects.create(name='1', number=1)
+        thing_2 = Thing.objects.create(name='2', number=2)
+        Thing.objects.create(name='3', number=3)
+        for name, expected in [('1', [thing_1]), ('2', [thing_2])]:
+            query = ModelTypeQuery.from_data({'filters': {'name': name}, 'exclude': {'number__gt': 2}, 'or_': []})
+            self.assertEqual(list(query.apply_to_queryset(Thing.objects.all())), expected)
+        self.assertEqual(QUERY_PLAN_CACHE.misses, 1)
+        self.assertEqual(QUERY_PLAN_CACHE.hits, 1)
+        query = ModelTypeQuery.from_data({
+            'filters': {'name': '1'}, 'exclude': {},
+            'or_': [{'filters': {'name': '2'}, 'exclude': {}, 'or_': [{'filters': {'number': 3}}]}]
+        })
+        self.assertEqual(query.apply_to_queryset(Thing.objects.all()).count(), 3)
+        self.assertEqual(interface.Interface.cache_info()['query_plans']['size'], 2)
+
+    def test_query_normalization(self):
+        query = ModelTypeQuery.from_data({
+            'filters': {'number': 1, 'number__in': [1, 2]},
+            'or_': [
+                {'filters': {'number': 1}, 'or_': [{'filters': {'number': 1, 'name': 'a'}}]},
+                {'filters': {'number': 2, 'number__in': [3]}},
+                {'filters': {'number': 4}, 'exclude': {'number': 4}},
+                {'filters': {'pk': 5}, 'exclude': {'pk': 6}},
+            ]
+        }).normalized(model_cls=Thing)
+        # Redundant lookups folded, contradictory, duplicate and implied branches dropped.
+        branches = [(query.filters, query.exclude)] + [(child.filters, child.exclude) for child in query.children]
+        self.assertEqual(branches, [({'number': 1}, {}), ({'pk': 5}, {})])
+        query = ModelTypeQuery.from_data({'filters': {'number': 1}, 'or_': [{'filters': {'number__in': []}}]})
+        self.assertEqual(query.normalized(model_cls=Thing).filters, {'number': 1})
+        query = ModelTypeQuery.from_data({'filters': {'number': 1, 'number__in': [2]}})
+        self.assertEqual(query.normalized(model_cls=Thing).apply_to_queryset(Thing.objects.all()).count(), 0)
+
+    def test_query_union(self):
+        UNION_VERDICT_CACHE.clear()
+        thing = Thing.objects.create(name='a')
+        children = [ThingChild.objects.create(parent=thing, number=i) for i in range(3)]
+        ThingChild.objects.create(parent=Thing.objects.create(), number=3)
+        # Both branches filter on an index: the primary key, and the parent foreign key.
+        query = ModelTypeQuery.from_data({'filters': {'pk': children[0].pk},
+                                          'or_': [{'filters': {'parent__name': 'a', 'parent': thing.pk}}]})
+        queryset = query.normalized(model_cls=ThingChild).apply_to_queryset(ThingChild.objects.all())
+        self.assertIn('UNION ALL', str(queryset.query))
+        self.assertEqual(set(queryset.order_by('number')), set(children))
+        self.assertEqual(queryset.filter(number__gt=0).update(name='b'), 2)
+        # A branch without an index is OR-ed.
+        query = ModelTypeQuery.from_data({'filters': {'pk': children[0].pk}, 'or_': [{'filters': {'number': 3}}]})
+        queryset = query.normalized(model_cls=ThingChild).apply_to_queryset(ThingChild.objects.all())
+        self.assertNotIn('UNION', str(queryset.query))
+        self.assertEqual(queryset.count(), 2)
+
+    def test_query_relation_exists(self):
+        thing_1 = Thing.objects.create(name='1')
+        thing_2 = Thing.objects.create(name='2')
+        Thing.objects.create(name='3')
+        for thing, names in [(thing_1, ['a', 'ab']), (thing_2, ['b'])]:
+            for name in names:
+                ThingChild.objects.create(parent=thing, name=name, number=len(name))
+
+        def things(data):
+            queryset = ModelTypeQuery.from_data(data).apply_to_queryset(Thing.objects.order_by('pk'))
+            self.assertNotIn('JOIN', str(queryset.query))
+            return list(queryset)
+
+        # Each thing is matched once, however many of its children match.
+        self.assertEqual(things({'filters': {'children__name__startswith': 'a'}}), [thing_1])
+        self.assertEqual(things({'filters': {'children__name__contains': 'b'}}), [thing_1, thing_2])
+        # A single child must match every lookup of the relation.
+        self.assertEqual(things({'filters': {'children__name': 'a', 'children__number': 2}}), [])
+        self.assertEqual(things({'filters': {'children__name': 'ab', 'children__number': 2}}), [thing_1])
+        self.assertEqual(things({'exclude': {'children__name': 'b'}}), [thing_1, Thing.objects.get(name='3')])
+        self.assertEqual(things({'filters': {'children__isnull': True}}), [Thing.objects.get(name='3')])
+        self.assertEqual(things({'filters': {'name': '2'}, 'or_': [{'filters': {'children__number': 2}}]}),
+                         [thing_1, thing_2])
+        child = ThingChild.objects.get(name='b')
+        self.assertEqual(things({'filters': {'children__in': [child.pk]}}), [thing_2])
+        children = ThingChild.objects.filter(**{'parent__children__name': 'ab'})
+        queryset = ModelTypeQuery.from_data({'filters': {'parent__children__name': 'ab'}}).apply_to_queryset(
+            ThingChild.objects.all())
+        self.assertEqual(set(queryset), set(children))
+        self.assertEqual(queryset.count(), 2)
+
+    def test_validate_lookup_path(self):
+        for lookup_path in ['name', 'pk', 'name__icontains', 'parent__name__in', 'parent__isnull',
+                            'parent_id', 'children__children__number__gte', 'children__name__iexact']:
+            validate_lookup_path(ThingChild if lookup_path.startswith('parent') else Thing, lookup_path)
+        for lookup_path in ['nope', 'name__nope', 'number__year__nope', 'children__nope__gt']:
+            with self.assertRaises(ValidationError):
+                validate_lookup_path(Thing, lookup_path)
+
+    def test_index_policy_flag(self):
+        INDEX_VERDICT_CACHE.clear()
+        policy = IndexPolicy(action=IndexPolicy.FLAG, explain=True)
+        query = ModelTypeQuery.from_data({'filters': {'name__icontains': 'a'}})
+        plan = query.plan(model_cls=Thing)
+        queryset = plan.apply(Thing.objects.all(), query.bind_values())
+        with self.assertLogs('django_typescript', level='WARNING'):
+            violations = policy.enforce(model_cls=Thing, plan=plan, order_by=['-pk'], queryset=queryset)
+        self.assertTrue(violations[0].startswith('`name__icontains`'))
+        self.assertTrue(any(v.startswith('EXPLAIN') for v in violations))
+        with self.assertLogs('django_typescript', level='WARNING'):
+            policy.enforce(model_cls=Thing, plan=plan, order_by=['-pk'], queryset=queryset)
+        self.assertEqual(INDEX_VERDICT_CACHE.hits, 1)
+        self.assertIn(Thing, INDEXED_FIELDS_CACHE)
+        interface.Interface.clear_caches()
+        self.assertEqual(interface.Interface.cache_info()['indexed_fields']['size'], 0)
+
+    def test_serializer_projection(self):
+        model_type = ModelType(model_cls=Thing, serializer_field_kwargs={'number': {'write_only': True}})
+        self.assertEqual(serializer_projection(model_type.serializer_cls), ('id', 'name'))
+        sql = str(project_queryset(Thing.objects.all(), model_type.serializer_cls).query)
+        self.assertNotIn('number', sql)
+        model_type = ModelType(model_cls=ThingChild)
+        serializer_cls = model_type.serializer.build_prefetch_serializer_tree(prefetch_trees=['parent'])
+        self.assertEqual(serializer_projection(serializer_cls),
+                         ('id', 'name', 'number', 'parent', 'parent__id', 'parent__name', 'parent__number'))
+        serializer_cls = model_type.serializer.build_prefetch_serializer_tree(prefetch_trees=['non_field'])
+        self.assertIsNone(serializer_projection(serializer_cls))
@@ -1,15 +1,29 @@
 import json
-
+import datetime
+import time
+import decimal
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.db.models import signals
 from django.test import TestCase, override_settings
 from rest_framework.permissions import BasePermission
 from django.urls import reverse
 from django.contrib.auth.models import User
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 from rest_framework import status
 
-from django_typescript import interface
+from django_typescript import interface, config
+from django_typescript.core.exceptions import ModelTypeImproperlyConfigured
+from django_typescript.model_types.throttling import QueryCostThrottle
+from django_typescript.model_types.count import CappedCount
+from django_typescript.core.utils.subset_serializer import subset_serializer
+from django_typescript.model_types.versions import bump_model_versions
+from django_typescript.model_types.views import UpdateView
 
-from .models import Thing, ThingChild, GenericModel
+from .models import (Thing, ThingChild, ThingChildChild, ThingChildChildChild, ThingOneToOneTarget, GenericModel,
+                     TimestampedModel)
 
 
 # =================================
@@ -44,11 +58,20 @@ class GenericModelType(interface.ModelType, model_cls=GenericModel, create_permi
 
 class Interface(interface.Interface, transpile_dest=''):
     things = ThingType.as_type()
-    child_things = interface.ModelType(model_cls=ThingChild)
+    child_things = interface.ModelType(model_cls=ThingChild, etag=True, result_cache=True)
     generic_models = GenericModelType.as_type()
+    timestamped_models = interface.ModelType(model_cls=TimestampedModel, count_strategy=CappedCount(cap=2),
+                                             property_fields=['title'])
+    child_child_things = interface.ModelType(model_cls=ThingChildChild, index_policy='reject')
+    # SQLite checks the time limit every 1000 instructions, so any but the smallest list query times out.
+    child_child_child_things = interface.ModelType(model_cls=ThingChildChildChild, query_timeout={'list': 1e-9})
+
 
+class ReplicatedInterface(interface.Interface, transpile_dest='', read_routing=['replica']):
+    thing_targets = interface.ModelType(model_cls=ThingOneToOneTarget)
 
-urlpatterns = Interface.urlpatterns()
+
+urlpatterns = Interface.urlpatterns() + ReplicatedInterface.urlpatterns()
 
 
 # =================================
@@ -63,6 +86,7 @@ class TestModelTypeViews(TestCase):
 
     def setUp(self):
         self.client = APIClient()
+        cache.clear()
 
     def test_get_view(self):
         thing = Thing.objects.create(name='test')
@@ -91,6 +115,46 @@ class TestModelTypeViews(TestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertTrue(Thing.objects.filter(name='test').exists())
 
+    def test_bulk_create_view(self):
+        view_url = reverse('thing:bulk_create')
+        rows = [{'name': 'a', 'number': 1}, {'name': 'b', 'number': 2}]
+        # A single INSERT, within a savepoint (the test's transaction).
+        with self.assertNumQueries(3):
+            response = self.client.post(view_url, data=rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([data['name'] for data in response.data['data']], ['a', 'b'])
+        self.assertEqual(set(Thing.objects.values_list('name', flat=True)), {'a', 'b'})
+
+    def test_bulk_create_view_errors(self):
+        view_url = reverse('thing:bulk_create')
+        rows = [{'name': 'c'}, {'name': 'invalid_name'}, {'number': 'nope'}]
+        response = self.client.post(view_url, data=rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['errors']), {1, 2})
+        self.assertFalse(Thing.objects.exists())
+        response = self.client.post(view_url + '?partial_success=true', data=rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data'][0]['name'], 'c')
+        self.assertEqual(response.data['data'][1:], [None, None])
+        self.assertIn('name', response.data['errors'][1])
+        self.assertEqual(list(Thing.objects.values_list('name', flat=True)), ['c'])
+
+    def test_bulk_create_view_constraints(self):
+        things = [Thing.objects.create(name=str(i)) for i in range(2)]
+        view_url = reverse('thing_one_to_one_target:bulk_create')
+        # Rows that pass validation, but violate a unique constraint together.
+        rows = [{'sibling_thing_id': things[0].id}, {'sibling_thing_id': things[0].id},
+                {'sibling_thing_id': things[1].id}]
+        response = self.client.post(view_url, data=rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(ThingOneToOneTarget.objects.exists())
+        response = self.client.post(view_url + '?partial_success=true', data=rows, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['data'][1], None)
+        self.assertEqual(set(response.data['errors']), {1})
+        self.assertEqual(set(ThingOneToOneTarget.objects.values_list('sibling_thing_id', flat=True)),
+                         {things[0].id, things[1].id})
+
     def test_get_or_create_view_created(self):
         data = {'lookup': {'name': 'test'}, 'defaults': {'number': 10}}
         view_url = reverse('thing:get_or_create')
@@ -121,6 +185,149 @@ class TestModelTypeViews(TestCase):
         thing.refresh_from_db()
         self.assertEqual(thing.name, 'new name')
 
+    def test_update_view_changed_fields(self):
+        thing = Thing.objects.create(name='a', number=1)
+        view_url = reverse('thing:update', kwargs={'pk': thing.id})
+        # One read, and an UPDATE of the changed field only.
+        with self.assertNumQueries(2) as context:
+            response = self.client.post(view_url, data={'name': 'b', 'number': 1}, format='json')
+        self.assertEqual(response.data['name'], 'b')
+        self.assertNotIn('"number"', context.captured_queries[1]['sql'])
+        with self.assertNumQueries(1):
+            self.client.post(view_url, data={'name': 'b'}, format='json')
+        # Prefetches read the instance again, with its relations.
+        child = ThingChild.objects.create(parent=thing, name='c')
+        response = self.client.post(reverse('thing_child:update', kwargs={'pk': child.id}) + '?prefetch=' +
+                                    json.dumps(['parent']), data={'name': 'd'}, format='json')
+        self.assertEqual((response.data['name'], response.data['parent']['name']), ('d', 'b'))
+        # Property fields are read from the written instance.
+        model = TimestampedModel.objects.create(name='a')
+        with self.assertNumQueries(2):
+            response = self.client.post(reverse('timestamped_model:update', kwargs={'pk': model.id}) + '?prefetch=' +
+                                        json.dumps(['title']), data={'name': 'new name'}, format='json')
+        self.assertEqual(response.data['title'], 'New Name')
+
+    def test_update_view_serializer_update(self):
+        thing = Thing.objects.create(name='a')
+
+        class Serializer(Interface.things.serializer_cls):
+
+            def update(self, instance, validated_data):
+                validated_data['number'] = 10
+                return super().update(instance, validated_data)
+
+        serializer = Serializer(instance=thing, data={'name': 'b'}, partial=True)
+        serializer.is_valid(raise_exception=True)
+        UpdateView._save_changes(serializer, thing)
+        self.assertEqual(list(Thing.objects.values_list('name', 'number')), [('b', 10)])
+
+    def test_write_views_return_minimal(self):
+        response = self.client.post(reverse('thing:create'), data={'name': 'a'}, format='json', HTTP_PREFER='return=minimal')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        pk = Thing.objects.get().pk
+        self.assertEqual(response.data, {'pk': pk})
+        self.assertEqual(response['Preference-Applied'], 'return=minimal')
+        response = self.client.post(reverse('thing:update', kwargs={'pk': pk}), data={'name': 'b'}, format='json',
+                                    HTTP_PREFER='respond-async, return=minimal')
+        self.assertEqual(response.data, {'pk': pk})
+        self.assertEqual(Thing.objects.get().name, 'b')
+
+    def test_query_update_view(self):
+        for number in [1, 2, 3]:
+            Thing.objects.create(name='a', number=number)
+        view_url = reverse('thing:query_update') + '?query=' + json.dumps({'filters': {'number__gte': 2}})
+        response = self.client.post(view_url, data={'name': 'b'}, format='json')
+        self.assertEqual(response.data, {'updated': 2})
+        self.assertEqual(list(Thing.objects.order_by('number').values_list('name', flat=True)), ['a', 'b', 'b'])
+        # Invalid values, values failing the `validate` hook, and missing queries.
+        for url, data in [(view_url, {'number': 'nope'}), (view_url, {'name': 'invalid_name'}),
+                          (view_url, {'number': 4}), (reverse('thing:query_update'), {'name': 'c'})]:
+            response = self.client.post(url, data=data, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Thing.objects.filter(name='b').count(), 2)
+        # Queries matching too many objects update nothing.
+        with mock.patch.object(config, 'BULK_MAX_ROWS', 1):
+            response = self.client.post(view_url, data={'name': 'c'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Thing.objects.filter(name='b').count(), 2)
+
+    def test_query_update_view_constraints(self):
+        things = [Thing.objects.create(name=str(i)) for i in range(3)]
+        for thing in things[:2]:
+            ThingOneToOneTarget.objects.create(sibling_thing=thing)
+        # Setting a unique field of several objects violates its constraint.
+        view_url = reverse('thing_one_to_one_target:query_update') + '?query=' + json.dumps({})
+        response = self.client.post(view_url, data={'sibling_thing_id': things[2].id}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('UNIQUE', str(response.data['non_field_errors'][0]))
+        self.assertFalse(ThingOneToOneTarget.objects.filter(sibling_thing=things[2]).exists())
+        # `auto_now` fields are updated.
+        model = TimestampedModel.objects.create(name='a')
+        view_url = reverse('timestamped_model:query_update') + '?query=' + json.dumps({})
+        response = self.client.post(view_url, data={'name': 'b'}, format='json')
+        self.assertEqual(response.data, {'updated': 1})
+        self.assertGreater(TimestampedModel.objects.get().modified, model.modified)
+
+    def test_bulk_update_view(self):
+        things = [Thing.objects.create(name=str(i), number=i) for i in range(3)]
+        view_url = reverse('thing:bulk_update')
+        items = [{'pk': things[0].id, 'changes': {'name': 'x'}}, {'pk': things[2].id, 'changes': {'number': 20}}]
+        # One read, one (batched) UPDATE, and the test transaction's savepoint.
+        with self.assertNumQueries(4):
+            response = self.client.post(view_url, data=items, format='json')
+        self.assertEqual(response.data, {'updated': 2})
+        self.assertEqual(list(Thing.objects.order_by('id').values_list('name', 'number')),
+                         [('x', 0), ('1', 1), ('2', 20)])
+        items = [{'pk': things[1].id, 'changes': {'name': 'y'}}, {'pk': 999, 'changes': {'name': 'z'}},
+                 {'pk': things[0].id, 'changes': {'name': 'invalid_name'}}]
+        response = self.client.post(view_url, data=items, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(response.data['errors']), {1, 2})
+        self.assertEqual(Thing.objects.get(pk=things[1].id).name, '1')
+
+    def test_query_delete_view(self):
+        things = [Thing.objects.create(name=str(i), number=i) for i in range(3)]
+        for thing in things:
+            ThingChild.objects.create(parent=thing, name='child')
+        child_list_url = reverse('thing_child:list')
+        self.assertEqual(len(self.client.get(child_list_url).data), 3)
+        view_url = reverse('thing:query_delete') + '?query=' + json.dumps({'filters': {'number__gte': 1}})
+        response = self.client.delete(view_url)
+        self.assertEqual(response.data['deleted'], 4)
+        self.assertEqual(response.data['counts'], {'tests.Thing': 2, 'tests.ThingChild': 2})
+        self.assertEqual(list(Thing.objects.values_list('number', flat=True)), [0])
+        # Cascades invalidate cached results of the related models.
+        self.assertEqual(len(self.client.get(child_list_url).data), 1)
+
+    def test_query_delete_view_fast_path(self):
+        for i in range(3):
+            TimestampedModel.objects.create(name=str(i))
+        view_url = reverse('timestamped_model:query_delete') + '?query=' + json.dumps({'filters': {'name__in': ['0', '1']}})
+        # Capped primary keys and a single DELETE, in one transaction; rows are
+        # not fetched, as version receivers are only connected for the models read
+        # by versioned views.
+        with self.assertNumQueries(4) as context:
+            response = self.client.delete(view_url)
+        sqls = [query['sql'] for query in context.captured_queries]
+        self.assertTrue(sqls[0].startswith('SAVEPOINT') and sqls[3].startswith('RELEASE SAVEPOINT'))
+        self.assertTrue(sqls[1].startswith('SELECT') and sqls[1].endswith('LIMIT 1001'))
+        self.assertTrue(sqls[2].startswith('DELETE'))
+        self.assertEqual(response.data, {'deleted': 2, 'counts': {'tests.TimestampedModel': 2}})
+        self.assertFalse(signals.post_delete.has_listeners(TimestampedModel))
+        self.assertTrue(signals.post_delete.has_listeners(ThingChild))
+        self.assertFalse(signals.post_delete.has_listeners(ThingChildChild))
+
+    def test_query_delete_view_max_rows(self):
+        for i in range(3):
+            Thing.objects.create(name=str(i))
+        view_url = reverse('thing:query_delete') + '?query=' + json.dumps({})
+        with mock.patch.object(config, 'QUERY_DELETE_MAX_ROWS', 2):
+            response = self.client.delete(view_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Thing.objects.count(), 3)
+        response = self.client.delete(reverse('thing:query_delete'))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_delete_view(self):
         thing = Thing.objects.create()
         thing_id = thing.id
@@ -184,6 +391,181 @@ class TestModelTypeViews(TestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]['name'], '2')
 
+    def test_list_view_invalid_query(self):
+        view_url = reverse('thing:list')
+        for query in [{'filters': {'nope__gt': 1}}, {'filters': {'name__nope': 1}}, {'filters': []}]:
+            response = self.client.get(view_url + '?query=' + json.dumps(query))
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_view_index_policy(self):
+        view_url = reverse('thing_child_child:list')
+        for query, order_by in [({'filters': {'parent__in': [1, 2]}}, ['-id']),
+                                ({'filters': {'parent': 1}, 'or_': [{'filters': {'pk__gte': 3}}]}, ['parent'])]:
+            response = self.client.get(view_url + '?query=' + json.dumps(query) + '&order_by=' + json.dumps(order_by))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        for query, order_by in [({'filters': {'name': 'a'}}, []),
+                                ({'filters': {'parent__name__icontains': 'a'}}, []),
+                                ({'filters': {'parent': 1}}, ['number'])]:
+            response = self.client.get(view_url + '?query=' + json.dumps(query) + '&order_by=' + json.dumps(order_by))
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('index_policy', response.data)
+
+    def test_list_view_etag(self):
+        thing = Thing.objects.create(name='parent')
+        child = ThingChild.objects.create(parent=thing, name='a')
+        view_url = reverse('thing_child:list') + '?prefetch=' + json.dumps(['parent'])
+        response = self.client.get(view_url)
+        etag = response['ETag']
+        with self.assertNumQueries(0):
+            response = self.client.get(view_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        # Writes to any table the list reads change the ETag.
+        for write in [lambda: child.save(), lambda: thing.save(), lambda: bump_model_versions(ThingChild),
+                      lambda: ThingChild.objects.create(parent=thing, name='b').delete()]:
+            write()
+            response = self.client.get(view_url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertNotEqual(response['ETag'], etag)
+            etag = response['ETag']
+        # Writes to other tables do not.
+        GenericModel.objects.create(name='other')
+        response = self.client.get(view_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_view_etag(self):
+        thing = Thing.objects.create(name='parent')
+        child = ThingChild.objects.create(parent=thing, name='a')
+        view_url = reverse('thing_child:get', kwargs={'pk': child.id})
+        etag = self.client.get(view_url)['ETag']
+        response = self.client.get(view_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        # Other query parameters are other representations.
+        response = self.client.get(view_url + '?prefetch=' + json.dumps(['parent']), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        child.name = 'b'
+        child.save()
+        response = self.client.get(view_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'b')
+
+    def _assert_result_cache(self):
+        thing = Thing.objects.create(name='parent')
+        ThingChild.objects.create(parent=thing, name='a')
+        view_url = reverse('thing_child:list') + '?prefetch=' + json.dumps(['parent'])
+        self.assertEqual(self.client.get(view_url).data[0]['parent']['name'], 'parent')
+        with self.assertNumQueries(0):
+            response = self.client.get(view_url)
+        self.assertEqual(response.data[0]['parent']['name'], 'parent')
+        # Writes to unrelated tables keep the entry.
+        GenericModel.objects.create(name='other')
+        with self.assertNumQueries(0):
+            self.client.get(view_url)
+        # Writes through generated views, or the ORM, to joined tables invalidate it.
+        self.client.post(reverse('thing:update', kwargs={'pk': thing.id}), data={'name': 'new'}, format='json')
+        self.assertEqual(self.client.get(view_url).data[0]['parent']['name'], 'new')
+        ThingChild.objects.create(parent=thing, name='b')
+        self.assertEqual(len(self.client.get(view_url).data), 2)
+        self.client.delete(reverse('thing_child:delete', kwargs={'pk': ThingChild.objects.get(name='b').id}))
+        self.assertEqual(len(self.client.get(view_url).data), 1)
+
+    def test_list_view_result_cache(self):
+        self._assert_result_cache()
+
+    def test_list_view_result_cache_file_backend(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            caches = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+                                  'LOCATION': cache_dir}}
+            with override_settings(CACHES=caches):
+                self._assert_result_cache()
+
+    def test_get_view_result_cache(self):
+        thing = Thing.objects.create(name='parent')
+        child = ThingChild.objects.create(parent=thing, name='a')
+        view_url = reverse('thing_child:get', kwargs={'pk': child.id})
+        self.client.get(view_url)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(view_url).data['name'], 'a')
+        self.client.post(reverse('thing_child:update', kwargs={'pk': child.id}), data={'name': 'b'}, format='json')
+        self.assertEqual(self.client.get(view_url).data['name'], 'b')
+
+    def test_get_many_view(self):
+        things = [Thing.objects.create(name=str(i)) for i in range(4)]
+        for thing in things:
+            ThingChild.objects.create(parent=thing, name='child-' + thing.name)
+        pks = [things[2].id, things[0].id, 999, things[3].id, things[0].id]
+        view_url = reverse('thing:get_many')
+        with self.assertNumQueries(1):
+            response = self.client.get(view_url, {'pks': json.dumps(pks)})
+        self.assertEqual([data['name'] for data in response.data['data']], ['2', '0', '3'])
+        self.assertEqual(response.data['missing'], [999])
+        # Values, without the primary key.
+        response = self.client.get(view_url, {'pks': json.dumps(pks), 'values': json.dumps(['name'])})
+        self.assertEqual(response.data['data'], [{'name': '2'}, {'name': '0'}, {'name': '3'}])
+        # Prefetched reverse relations.
+        with self.assertNumQueries(2):
+            response = self.client.get(view_url, {'pks': json.dumps(pks[:2]), 'prefetch': json.dumps(['children'])})
+        self.assertEqual(response.data['data'][0]['children'][0]['name'], 'child-2')
+        for pks in [['x'], {'a': 1}, list(range(config.GET_MANY_MAX_PKS + 1))]:
+            response = self.client.get(view_url, {'pks': json.dumps(pks)})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_aggregate_view(self):
+        for number in [1, 2, 3, 4]:
+            Thing.objects.create(name='even' if number % 2 == 0 else 'odd', number=number)
+        view_url = reverse('thing:aggregate')
+        aggregates = {'total': {'fn': 'sum', 'field': 'number'}, 'n': {'fn': 'count'},
+                      'names': {'fn': 'count', 'field': 'name', 'distinct': True}, 'top': {'fn': 'max', 'field': 'number'}}
+        query = {'filters': {'number__gt': 1}}
+        with self.assertNumQueries(1):
+            response = self.client.get(view_url, {'aggregates': json.dumps(aggregates), 'query': json.dumps(query)})
+        self.assertEqual(response.data, {'total': 9, 'n': 3, 'names': 2, 'top': 4})
+        response = self.client.get(view_url, {'aggregates': json.dumps({'total': {'fn': 'sum', 'field': 'number'}}),
+                                              'group_by': json.dumps(['name'])})
+        self.assertEqual(response.data, [{'name': 'even', 'total': 6}, {'name': 'odd', 'total': 4}])
+
+    def test_aggregate_view_date_buckets(self):
+        for month, day in [(1, 1), (1, 20), (3, 5)]:
+            TimestampedModel.objects.create(name='a', timestamp=datetime.datetime(2020, month, day, 12))
+        view_url = reverse('timestamped_model:aggregate')
+        response = self.client.get(view_url, {'aggregates': json.dumps({'n': {'fn': 'count'}}),
+                                              'group_by': json.dumps([{'field': 'timestamp', 'trunc': 'month',
+                                                                       'alias': 'month'}])})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([(row['month'].month, row['n']) for row in response.data], [(1, 2), (3, 1)])
+
+    def test_aggregate_view_decimals(self):
+        for price in ['1.50', '2.25']:
+            TimestampedModel.objects.create(name='a', price=decimal.Decimal(price))
+        view_url = reverse('timestamped_model:aggregate')
+        aggregates = json.dumps({'total': {'fn': 'sum', 'field': 'price'}, 'top': {'fn': 'max', 'field': 'price'}})
+        # Sent as strings, as are decimal fields of serialized objects.
+        response = self.client.get(view_url, {'aggregates': aggregates})
+        data = json.loads(response.content)
+        self.assertTrue(all(isinstance(value, str) for value in data.values()))
+        self.assertEqual({key: decimal.Decimal(value) for key, value in data.items()},
+                         {'total': decimal.Decimal('3.75'), 'top': decimal.Decimal('2.25')})
+        response = self.client.get(view_url, {'aggregates': aggregates, 'group_by': json.dumps(['price'])})
+        data = json.loads(response.content)
+        self.assertEqual({key: decimal.Decimal(value) for key, value in data[0].items()},
+                         {'price': decimal.Decimal('1.5'), 'total': decimal.Decimal('1.5'), 'top': decimal.Decimal('1.5')})
+
+    def test_aggregate_view_invalid(self):
+        view_url = reverse('thing:aggregate')
+        for aggregates, group_by in [({}, []),
+                                     ({'n': {'fn': 'median', 'field': 'number'}}, []),
+                                     ({'n': {'fn': 'sum'}}, []),
+                                     ({'n': {'fn': 'sum', 'field': 'nope'}}, []),
+                                     ({'n': {'fn': 'sum', 'field': 'name'}}, []),
+                                     ({'n': {'fn': 'avg', 'field': 'children__parent'}}, []),
+                                     ({'name': {'fn': 'count'}}, []),
+                                     ({'n': {'fn': 'max', 'field': 'number', 'distinct': True}}, []),
+                                     ({'n': {'fn': 'count'}}, [{'field': 'name', 'trunc': 'month'}]),
+                                     ({'n': {'fn': 'count'}}, ['name__icontains'])]:
+            response = self.client.get(view_url, {'aggregates': json.dumps(aggregates),
+                                                  'group_by': json.dumps(group_by)})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, aggregates)
+
     def test_list_view_field_subset(self):
         thing_1 = Thing.objects.create(name='1')
         thing_2 = Thing.objects.create(name='2')
@@ -198,6 +580,45 @@ class TestModelTypeViews(TestCase):
         response = self.client.get(view_url)
         self.assertEqual(set(response.data[0].keys()), {'name'})
 
+    def test_list_view_values_fast_path(self):
+        timestamp = datetime.datetime(2020, 1, 2, 3, 4, 5, 678901)
+        TimestampedModel.objects.create(name='a', timestamp=timestamp)
+        TimestampedModel.objects.create(name=None, timestamp=None)
+        values = ['id', 'timestamp', 'name']
+        view_url = reverse('timestamped_model:list') + '?values=' + json.dumps(values)
+        response = self.client.get(view_url)
+        serializer_cls = subset_serializer(serializer_cls=Interface.timestamped_models.serializer.base_serializer_cls,
+                                           select_fields=values)
+        expected = serializer_cls(TimestampedModel.objects.values(*values), many=True).data
+        self.assertEqual(response.data, expected)
+        self.assertEqual(list(response.data[0].keys()), values)
+
+    def test_list_view_stream(self):
+        for i in range(5):
+            thing = Thing.objects.create(name=str(i))
+            ThingChild.objects.create(parent=thing, name=f'{i}-0')
+        view_url = reverse('thing:list') + '?order_by=' + json.dumps(['name']) + \
+            '&prefetch=' + json.dumps(['children'])
+        expected = self.client.get(view_url).data
+        # Stream in chunks smaller than the result, so prefetches are made per chunk.
+        with mock.patch.object(config, 'STREAM_CHUNK_SIZE', 2):
+            response = self.client.get(view_url + '&stream=true')
+            lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual([json.loads(line) for line in lines], json.loads(json.dumps(expected)))
+        response = self.client.get(view_url, HTTP_ACCEPT='application/x-ndjson')
+        self.assertTrue(response.streaming)
+        self.assertEqual(len(b''.join(response.streaming_content).splitlines()), 5)
+
+    def test_list_view_stream_values(self):
+        for i in range(3):
+            Thing.objects.create(name=str(i), number=i)
+        view_url = reverse('thing:list') + '?stream=true&values=' + json.dumps(['name', 'number'])
+        response = self.client.get(view_url)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual([json.loads(line) for line in lines],
+                         [{'name': str(i), 'number': i} for i in range(3)])
+
     def test_list_view_prefetch_paginated(self):
         thing_1 = Thing.objects.create(name='1')
         child_thing_1 = ThingChild.objects.create(parent=thing_1)
@@ -268,3 +689,245 @@ class TestModelTypeViews(TestCase):
         response = self.client.post(view_url, data=data, format='json')
         self.assertEqual(response.data['a'], 'test_a')
         self.assertEqual(response.data['b'], 'test_b')
+
+    def test_list_view_cursor_paginated(self):
+        for name in ['a', 'b', 'c', 'd', 'e']:
+            Thing.objects.create(name=name)
+        view_url = reverse('thing:list') + '?order_by=' + json.dumps(['-name']) + '&pageSize=2'
+        response = self.client.get(view_url + '&cursor=')
+        self.assertEqual([d['name'] for d in response.data['data']], ['e', 'd'])
+        self.assertIsNone(response.data['prev'])
+        response = self.client.get(view_url + '&cursor=' + response.data['next'])
+        self.assertEqual([d['name'] for d in response.data['data']], ['c', 'b'])
+        prev_cursor = response.data['prev']
+        response = self.client.get(view_url + '&cursor=' + response.data['next'])
+        self.assertEqual([d['name'] for d in response.data['data']], ['a'])
+        self.assertIsNone(response.data['next'])
+        response = self.client.get(view_url + '&cursor=' + prev_cursor)
+        self.assertEqual([d['name'] for d in response.data['data']], ['e', 'd'])
+        self.assertIsNone(response.data['prev'])
+
+    def test_list_view_cursor_paginated_values(self):
+        Thing.objects.create(name='a', number=1)
+        Thing.objects.create(name='b', number=1)
+        Thing.objects.create(name='c', number=2)
+        view_url = reverse('thing:list') + '?order_by=' + json.dumps(['number']) + '&pageSize=2' + \
+            '&values=' + json.dumps(['name'])
+        response = self.client.get(view_url + '&cursor=')
+        self.assertEqual(response.data['data'], [{'name': 'a'}, {'name': 'b'}])
+        response = self.client.get(view_url + '&cursor=' + response.data['next'])
+        self.assertEqual(response.data['data'], [{'name': 'c'}])
+
+    def test_list_view_invalid_cursor(self):
+        view_url = reverse('thing:list') + '?cursor=not-a-cursor'
+        response = self.client.get(view_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_view_paginated_count_strategy(self):
+        for name in ['a', 'b', 'c', 'd']:
+            TimestampedModel.objects.create(name=name)
+        view_url = reverse('timestamped_model:list') + '?page=1&pageSize=1'
+        response = self.client.get(view_url)
+        self.assertEqual(response.data['num_results'], 2)
+        self.assertEqual(response.data['count_strategy'], 'capped')
+        self.assertFalse(response.data['count_exact'])
+        self.assertEqual(len(response.data['data']), 1)
+        response = self.client.get(view_url + '&count_strategy=none')
+        self.assertIsNone(response.data['num_results'])
+        self.assertEqual(response.data['count_strategy'], 'none')
+        response = self.client.get(view_url + '&count_strategy=exact')
+        self.assertEqual(response.data['num_results'], 4)
+        self.assertTrue(response.data['count_exact'])
+
+    def test_list_view_paginated_cached_count(self):
+        Thing.objects.create(name='a')
+        view_url = reverse('thing:list') + '?page=1&pageSize=1&count_strategy=cached'
+        response = self.client.get(view_url)
+        self.assertEqual(response.data['num_results'], 1)
+        self.assertFalse(response.data['count_exact'])
+        Thing.objects.create(name='b')
+        response = self.client.get(view_url)
+        self.assertEqual(response.data['num_results'], 1)
+        self.assertFalse(response.data['count_exact'])
+
+    def test_list_view_invalid_page_size(self):
+        Thing.objects.create(name='a')
+        view_url = reverse('thing:list') + '?page=1&pageSize='
+        for page_size in ('abc', '0', '-1'):
+            for count_strategy in ('exact', 'capped'):
+                response = self.client.get(view_url + page_size + '&count_strategy=' + count_strategy)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn('pageSize', response.data)
+            response = self.client.get(reverse('thing:list') + '?cursor=&pageSize=' + page_size)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_view_invalid_count_strategy(self):
+        view_url = reverse('thing:list') + '?page=1&count_strategy=bogus'
+        response = self.client.get(view_url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_view_prefetch_reverse_relation(self):
+        for i in range(3):
+            thing = Thing.objects.create(name=str(i))
+            for j in range(2):
+                child = ThingChild.objects.create(parent=thing, name=f'{i}-{j}')
+                ThingChildChild.objects.create(parent=child, name=f'{i}-{j}-0')
+        view_url = reverse('thing:list') + '?prefetch=' + json.dumps([{'children': ['children']}])
+        # One query for the things, one for their children, one for the children's children.
+        with self.assertNumQueries(3):
+            response = self.client.get(view_url)
+        self.assertEqual(len(response.data), 3)
+        for thing_data in response.data:
+            self.assertEqual(len(thing_data['children']), 2)
+            self.assertEqual(len(thing_data['children'][0]['children']), 1)
+
+    def test_list_view_prefetch_forward_then_reverse_relation(self):
+        thing = Thing.objects.create(name='parent')
+        ThingChild.objects.create(parent=thing, name='a')
+        ThingChild.objects.create(parent=thing, name='b')
+        view_url = reverse('thing_child:list') + '?prefetch=' + json.dumps([{'parent': 'children'}])
+        with self.assertNumQueries(2):
+            response = self.client.get(view_url)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(response.data[0]['parent']['name'], 'parent')
+        self.assertEqual({c['name'] for c in response.data[0]['parent']['children']}, {'a', 'b'})
+
+    def test_list_view_prefetch_resolution(self):
+        Thing.objects.create(name='a')
+        view_url = reverse('thing:list') + '?prefetch='
+        interface.Interface.clear_caches()
+        for _ in range(2):
+            response = self.client.get(view_url + json.dumps([{'children': ['children']}]))
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(interface.Interface.cache_info()['resolved_prefetches']['hits'], 1)
+        relation_graph = Interface.relation_graph()
+        Interface.clear_caches()
+        self.assertIsNot(Interface.relation_graph(), relation_graph)
+        # Unknown names, non-relation fields and malformed trees are rejected.
+        for prefetch_trees in (['bogus'], ['name'], [{'children': ['bogus']}], [{'children': 1}], 'children'):
+            response = self.client.get(view_url + json.dumps(prefetch_trees))
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn('prefetch', response.data)
+
+
+    def test_query_timeout(self):
+        parent = ThingChildChild.objects.create(name='a', parent=ThingChild.objects.create(
+            name='a', parent=Thing.objects.create(name='a')))
+        ThingChildChildChild.objects.bulk_create([ThingChildChildChild(parent=parent, name=str(i)) for i in range(500)])
+        response = self.client.get(reverse('thing_child_child_child:list'))
+        self.assertEqual(response.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
+        self.assertEqual(response.data, {'code': 'query_timeout', 'timeout': 1e-9,
+                                         'detail': 'The query exceeded its time limit of 1e-09 seconds.'})
+        # Streamed lists are limited as they are streamed, ending with an error line.
+        response = self.client.get(reverse('thing_child_child_child:list') + '?stream=true')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(json.loads(lines[-1])['__error__']['code'], 'query_timeout')
+        # Views without a time limit, and later queries, are not limited.
+        response = self.client.get(reverse('thing_child_child_child:get_many') + '?pks=' + json.dumps(
+            list(ThingChildChildChild.objects.values_list('pk', flat=True))))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(ThingChildChildChild.objects.count(), 500)
+        # Method, static method and property views are limited too, by name.
+        class SlowType(interface.ModelType, model_cls=ThingChildChildChild, query_timeout={'names': 1e-9}):
+
+            @interface.ModelType.static_method()
+            def names(cls):
+                return list(ThingChildChildChild.objects.values_list('name', flat=True))
+
+        patterns = {pattern.name: pattern.callback for pattern in SlowType.as_type().urlpatterns()}
+        response = patterns['names'](APIRequestFactory().post('/', {}, format='json'))
+        self.assertEqual(response.status_code, status.HTTP_504_GATEWAY_TIMEOUT)
+        with self.assertRaises(ModelTypeImproperlyConfigured):
+            interface.ModelType(model_cls=Thing, query_timeout={'lists': 1})
+        with self.assertRaises(ModelTypeImproperlyConfigured):
+            interface.ModelType(model_cls=Thing, query_timeout=-1)
+
+    def test_query_cost_throttle(self):
+        class Throttle(QueryCostThrottle):
+            budget = 10
+
+        cache.clear()
+        thing_type = interface.ModelType(model_cls=Thing, throttle_classes=(Throttle,))
+        list_view = thing_type.list_view.view()
+        factory = APIRequestFactory()
+
+        def cost(**params):
+            request = list_view.cls().initialize_request(factory.get('/', {k: json.dumps(v) for k, v in params.items()}))
+            return Throttle().query_cost(request, list_view.cls())
+
+        self.assertEqual(cost(count=True), 1.01)
+        self.assertEqual(cost(page=1), 1.25)
+        self.assertEqual(cost(page=1, values=['name']), 1.125)
+        self.assertEqual(cost(page=1, pageSize=-1000000), 1)
+        self.assertEqual(cost(page=1, query={'filters': {'name': 'a'}, 'or_': [{'filters': {'name': 'b'}}]}), 2.25)
+        # 2 relations (depths 1 and 2), each returning as many rows again.
+        self.assertEqual(cost(page=1, prefetch=[{'children': ['children']}]), 1 + 2 * 3 + 0.75)
+        # An unbounded list costs more than the budget, so it needs a full bucket.
+        self.assertEqual(cost(), 11)
+        self.assertEqual(list_view(factory.get('/')).status_code, status.HTTP_200_OK)
+        response = list_view(factory.get('/'))
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+        # Method, static method and property views are throttled too, at `base_cost`.
+        patterns = {pattern.name: pattern.callback for pattern in ThingType(
+            model_cls=Thing, throttle_classes=(Throttle,), property_fields=['name']).urlpatterns()}
+        for name in ('thing_method', 'thing_static_method', 'name'):
+            self.assertEqual(patterns[name].cls.throttle_classes, (Throttle,))
+        # Negative page sizes do not refill the bucket.
+        list_view(factory.get('/', {'page': 1, 'pageSize': -1000000}))
+        self.assertEqual(list_view(factory.get('/')).status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+    def test_query_cost_throttle_concurrent_requests(self):
+        class Throttle(QueryCostThrottle):
+            budget = 10
+
+        cache.clear()
+        list_view = interface.ModelType(model_cls=Thing, throttle_classes=(Throttle,)).list_view.view()
+        factory = APIRequestFactory()
+        request = list_view.cls().initialize_request(factory.get('/', {'page': 1, 'pageSize': 600}))
+        self.assertTrue(Throttle().allow_request(request, list_view.cls()))
+        # A request that read the bucket before the first spent from it loses
+        # the claim, reads the bucket again, and finds too few tokens left.
+        key = Throttle().get_cache_key(request, list_view.cls())
+        stale_state = (10, time.time(), 0)
+        cache_get = cache.get
+        with mock.patch.object(Throttle.cache, 'get', side_effect=[stale_state, cache_get(key)]):
+            throttle = Throttle()
+            self.assertFalse(throttle.allow_request(request, list_view.cls()))
+        self.assertGreater(throttle.wait(), 0)
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TestReadRouting(TestCase):
+
+    databases = {'default', 'replica'}
+
+    def test_read_routing(self):
+        thing = Thing.objects.create(name='a')
+        Thing.objects.using('replica').create(id=thing.id, name='a')
+        ThingOneToOneTarget.objects.using('replica').create(id=7, sibling_thing_id=thing.id)
+        view_url = reverse('thing_one_to_one_target:list')
+        # The stand-in replica does not replicate, so reads show which database served them.
+        response = self.client.get(view_url)
+        self.assertEqual([target['id'] for target in response.data], [7])
+        response = self.client.post(reverse('thing_one_to_one_target:create'),
+                                    data={'sibling_thing_id': thing.id}, content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertIn('django_ts_primary_until', response.cookies)
+        # After a write, the client reads its own writes from the primary.
+        response = self.client.get(view_url)
+        self.assertEqual([target['id'] for target in response.data], [response.data[0]['id']])
+        self.assertNotEqual(response.data[0]['id'], 7)
+        self.client.cookies.clear()
+        response = self.client.get(view_url)
+        self.assertEqual([target['id'] for target in response.data], [7])
+        self.assertEqual(self.client.get(reverse('thing_one_to_one_target:get', args=[7])).status_code,
+                         status.HTTP_200_OK)
+        # Views with ETags or a result cache read from the primary.
+        for options in ({'etag': True}, {'result_cache': True}):
+            model_type = interface.ModelType(model_cls=ThingOneToOneTarget, read_routing=['replica'], **options)
+            model_type.urlpatterns()
+            request = APIRequestFactory().get('/')
+            self.assertEqual(model_type.list_view._read_queryset(request).db, 'default')
+            self.assertEqual(model_type.get_many_view._read_queryset(request).db, 'replica')
@@ -0,0 +1,66 @@
+import io
+import uuid
+import decimal
+import datetime
+from collections import OrderedDict
+from unittest import mock
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.parsers import JSONParser
+
+from django_typescript import config
+from django_typescript.core import renderers, parsers
+from django_typescript.core.renderers import FastJSONRenderer, NDJSONRenderer
+from django_typescript.core.parsers import FastJSONParser
+
+
+# =================================
+# Renderer Tests
+# ---------------------------------
+
+class TestRenderers(SimpleTestCase):
+
+    DATA = [
+        OrderedDict([
+            ('id', 1),
+            ('name', 'caf\u00e9 \u2028'),
+            ('price', decimal.Decimal('1.50')),
+            ('uuid', uuid.UUID('12345678-1234-5678-1234-567812345678')),
+            ('created', datetime.datetime(2020, 1, 2, 3, 4, 5, 678901)),
+            ('date', datetime.date(2020, 1, 2)),
+            ('time', datetime.time(3, 4, 5)),
+            ('label', gettext_lazy('label')),
+            ('nested', {'values': [1.5, None, True]}),
+        ])
+    ]
+
+    def test_fast_json_renderer(self):
+        expected = JSONRenderer().render(self.DATA)
+        self.assertEqual(FastJSONRenderer().render(self.DATA), expected)
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(FastJSONRenderer().render(self.DATA), expected)
+        self.assertEqual(FastJSONRenderer().render(self.DATA, 'application/json; indent=4'),
+                         JSONRenderer().render(self.DATA, 'application/json; indent=4'))
+
+    def test_fast_json_renderer_big_int(self):
+        data = {'a': 2 ** 64, 'b': [-2 ** 70]}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+        with mock.patch.object(config, 'FAST_JSON', True):
+            self.assertEqual(NDJSONRenderer().render_line(data), JSONRenderer().render(data) + b'\n')
+
+    def test_ndjson_renderer(self):
+        rendered = NDJSONRenderer().render(self.DATA * 2)
+        self.assertEqual(rendered, (JSONRenderer().render(self.DATA[0]) + b'\n') * 2)
+
+    def test_fast_json_parser(self):
+        content = JSONRenderer().render(self.DATA)
+        expected = JSONParser().parse(io.BytesIO(content))
+        self.assertEqual(FastJSONParser().parse(io.BytesIO(content)), expected)
+        with mock.patch.object(parsers, 'orjson', None):
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(content)), expected)
+        for content in [b'{', b'', b'{"a": NaN}']:
+            with self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(content))